@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark del registro de fuentes
+
+Mide el tiempo por cuadro del dibujado que tenía el script clásico
+(juego/quien_quiere_ser_millonario.py, hoy un lanzador de juego.game) y
+el tiempo de construir GameUI (sin la imagen del título), antes
+(pygame.font.SysFont en cada llamada) y después (registro de fuentes).
+También cuenta los cuadros que no caben en el presupuesto de 60 FPS.
+
+Uso:
+    python3 benchmarks/bench_fonts.py [--frames N] [--builds N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import juego.ui
+from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT, FPS
+from juego.fonts import clear_fonts, get_font
+from juego.utils import wrap_text
+
+FRAME_BUDGET_MS = 1000.0 / FPS
+
+QUESTION = ("¿Cuál es el nombre del parque nacional ubicado en la región amazónica "
+            "de Colombia que protege una gran diversidad de flora y fauna?")
+OPTIONS = ["Parque Nacional Natural Tayrona", "Parque Nacional Natural Los Nevados",
+           "Parque Nacional Natural El Cocuy", "Parque Nacional Natural Amacayacu"]
+
+
+def sysfont(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Comportamiento anterior: buscar y cargar la fuente en cada llamada"""
+    return pygame.font.SysFont(family, size, bold=bold)
+
+
+def legacy_frame(screen: pygame.Surface, title: pygame.Surface, load_font) -> None:
+    """Cuadro de la pantalla de juego como lo dibujaba el script clásico"""
+    width, height = screen.get_size()
+    white = (255, 255, 255)
+    screen.fill((1, 0, 56))
+    screen.blit(title, title.get_rect(midtop=(width // 2, 50)))
+    
+    question_font = load_font("Arial", 35)
+    score_font = load_font("Arial", 30)
+    name_font = load_font("Arial", 20)
+    lines = wrap_text(QUESTION, question_font, width - 100)
+    y = (height - len(lines) * question_font.get_linesize()) // 3 + 100
+    for line in lines:
+        text = question_font.render(line, True, white)
+        screen.blit(text, ((width - text.get_width()) // 2, y))
+        y += question_font.get_linesize()
+    screen.blit(score_font.render("Dinero: $20000", True, white), (width - 400, height - 50))
+    
+    option_font = load_font("Arial", 30)
+    max_width = max(option_font.size(option)[0] for option in OPTIONS)
+    for i, option in enumerate(OPTIONS):
+        text = option_font.render(f"{'ABCD'[i]}. {option}", True, white)
+        x = (width // 4 if i < 2 else width * 3 // 4) - max_width // 2
+        screen.blit(text, text.get_rect(midleft=(x, height // 2 + (i % 2) * 90 + 85)))
+    
+    user_input_font = load_font("Arial", 25)
+    screen.blit(user_input_font.render("Tu Respuesta: B", True, white), (20, height - 50))
+    name = name_font.render("Jugador: Ana", True, white)
+    screen.blit(name, name.get_rect(midbottom=(width // 2, height - 10)))
+    pygame.display.update()
+
+
+def time_calls(function, repeats: int) -> list:
+    """Duración en milisegundos de cada llamada"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+def summary(timings: list) -> str:
+    """Mediana, percentil 95 y cuadros fuera de presupuesto"""
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    over = sum(1 for t in timings if t > FRAME_BUDGET_MS)
+    return (f"mediana {statistics.median(timings):7.3f} ms | p95 {p95:7.3f} ms | "
+            f"{over} de {len(timings)} sobre {FRAME_BUDGET_MS:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark del registro de fuentes")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--builds", type=int, default=100)
+    args = parser.parse_args()
+    
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    title = pygame.Surface((300, 300))
+    
+    # La imagen del título no depende de las fuentes y taparía la diferencia
+    juego.ui.GameUI._load_title_image = lambda self: None
+    
+    results = {}
+    for label, loader in (("antes (SysFont)", sysfont), ("después (registro)", get_font)):
+        clear_fonts()
+        juego.ui.get_font = loader
+        frame = lambda: legacy_frame(screen, title, loader)
+        frame()  # Calentamiento: el registro carga aquí sus fuentes
+        results[f"Cuadro clásico, {label}"] = summary(time_calls(frame, args.frames))
+        results[f"GameUI(), {label}"] = summary(
+            time_calls(lambda: juego.ui.GameUI(screen), args.builds))
+    pygame.quit()
+    
+    print(f"Tiempo por llamada ({args.frames} cuadros, {args.builds} construcciones):")
+    for name, line in results.items():
+        print(f"  {name:<36} {line}")
+
+
+if __name__ == "__main__":
+    main()
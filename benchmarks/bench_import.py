@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark del tiempo de importación de los módulos del juego
+
+Cada módulo se importa en un proceso nuevo varias veces y se reporta la
+mediana, junto con si pygame quedó cargado. Los módulos sin gráficos no
+deben pagar el costo de importar pygame.
+
+Uso:
+    python3 benchmarks/bench_import.py [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "juego",
+    "juego.config",
+    "juego.questions",
+    "juego.engine",
+    "juego.utils",
+    "pygame",
+    "juego.ui",
+    "juego.game",
+]
+
+_SNIPPET = (
+    "import sys, time, json\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps([elapsed, 'pygame' in sys.modules]))\n"
+)
+
+
+def measure(module: str, runs: int) -> dict:
+    """
+    Mide la importación de un módulo en procesos nuevos.
+    
+    Args:
+        module: Nombre del módulo
+        runs: Número de procesos a lanzar
+        
+    Returns:
+        Diccionario con la mediana en milisegundos y si se cargó pygame
+    """
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    times = []
+    loads_pygame = False
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _SNIPPET.format(module=module)],
+            cwd=ROOT, env=env, text=True
+        )
+        elapsed, loads_pygame = json.loads(output.strip().splitlines()[-1])
+        times.append(elapsed * 1000)
+    return {"module": module, "median_ms": statistics.median(times),
+            "loads_pygame": loads_pygame}
+
+
+def main(argv=None) -> list:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+    
+    results = [measure(module, args.runs) for module in MODULES]
+    print(f"{'Módulo':<18}{'Mediana (ms)':>14}  pygame")
+    for result in results:
+        flag = "sí" if result["loads_pygame"] else "no"
+        print(f"{result['module']:<18}{result['median_ms']:>14.2f}  {flag}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
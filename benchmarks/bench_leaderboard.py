@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la tabla de clasificación
+
+Llena una base de resultados temporal con muchas partidas sintéticas y
+mide la carga de la clasificación y la latencia de las consultas: los 10
+mejores (histórico y de hoy), el puesto de un jugador y la actualización
+incremental tras una partida.
+
+Uso:
+    python3 benchmarks/bench_leaderboard.py [--results N] [--players N]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from juego.config import PRIZES
+from juego.leaderboard import Leaderboard, day_key
+from juego.results import ResultsStore
+
+
+def fill_store(store: ResultsStore, n_results: int, n_players: int, days: int,
+               seed: int) -> None:
+    """Inserta partidas sintéticas directamente en la tabla de sesiones"""
+    rng = random.Random(seed)
+    ladder = [0] + PRIZES
+    # Premios más bajos mucho más frecuentes, como en partidas reales
+    weights = [2 ** -i for i in range(len(ladder))]
+    now = time.time()
+    batch_size = 100_000
+    for start in range(0, n_results, batch_size):
+        count = min(batch_size, n_results - start)
+        prizes = rng.choices(ladder, weights, k=count)
+        rows = [
+            (f"jugador{rng.randrange(n_players)}", finished_at - 120, finished_at,
+             "lost", 0, prize, "[]")
+            for prize, finished_at in zip(
+                prizes, (now - rng.random() * days * 86400 for _ in range(count)))
+        ]
+        with store.connection:
+            store.connection.executemany(
+                "INSERT INTO sessions (player, started_at, finished_at, result, "
+                "correct_answers, prize, lifelines) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        print(f"\r  {start + count:,} resultados", end="", flush=True)
+    print()
+
+
+def measure(function, repeats: int) -> float:
+    """Mediana en microsegundos de varias ejecuciones"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de la clasificación")
+    parser.add_argument("--results", type=int, default=10_000_000)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeats", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, "results.db"))
+        print(f"Generando {args.results:,} resultados de {args.players:,} jugadores...")
+        start = time.perf_counter()
+        fill_store(store, args.results, args.players, args.days, args.seed)
+        print(f"  {time.perf_counter() - start:.1f} s")
+        
+        start = time.perf_counter()
+        leaderboard = Leaderboard.from_store(store)
+        print(f"Carga de la clasificación: {time.perf_counter() - start:.2f} s "
+              f"({len(leaderboard.all_time):,} jugadores)")
+        
+        rng = random.Random(args.seed)
+        players = [f"jugador{rng.randrange(args.players)}" for _ in range(args.repeats)]
+        today = day_key(time.time())
+        queue = iter(players * 2)
+        results = {
+            "Top 10 histórico": measure(lambda: leaderboard.top(10), args.repeats),
+            "Top 10 de hoy": measure(lambda: leaderboard.top(10, today), args.repeats),
+            "Puesto de un jugador": measure(
+                lambda: leaderboard.rank(next(queue)), args.repeats),
+            "Resumen de un jugador": measure(
+                lambda: leaderboard.player(next(queue)), args.repeats),
+            "Actualización tras una partida": measure(
+                lambda: leaderboard.record({
+                    "player": rng.choice(players), "finished_at": time.time(),
+                    "prize": rng.choice(PRIZES)}),
+                args.repeats),
+        }
+        
+        # Referencia: el mismo puesto calculado con SQL sobre el índice
+        sql_rank = measure(lambda: store.connection.execute(
+            "SELECT COUNT(*) FROM (SELECT player FROM sessions GROUP BY player "
+            "HAVING MAX(prize) > ?)", (PRIZES[3],)).fetchone(), 3)
+        store.close()
+    
+    print("Mediana por consulta:")
+    for name, micros in results.items():
+        print(f"  {name:<32} {micros:10.1f} µs")
+    print(f"  {'Puesto con SQL (referencia)':<32} {sql_rank:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
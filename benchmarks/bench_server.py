@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Generador de carga para el servidor multijugador
+
+Lanza muchos clientes concurrentes que juegan partidas completas y mide la
+latencia de cada respuesta (desde que se envía ANSWER hasta recibir el
+resultado). Por defecto levanta el servidor en el mismo proceso; con
+--host/--port se conecta a un servidor externo.
+
+Uso:
+    python3 benchmarks/bench_server.py [--clients N] [--games N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from juego.config import DATA_DIR
+from juego.engine import LETTERS
+from juego.questions import get_shared_bank
+from juego.server import GameServer
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Percentil por el método del rango más cercano sobre valores ordenados"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))
+    return values[index]
+
+
+async def play_client(host: str, port: int, games: int, answers: dict,
+                      accuracy: float, latencies: list, rng: random.Random) -> None:
+    """Juega varias partidas y registra la latencia de cada respuesta"""
+    reader, writer = await asyncio.open_connection(host, port)
+    
+    async def receive() -> dict:
+        return json.loads(await reader.readline())
+    
+    await receive()  # Bienvenida
+    for _ in range(games):
+        writer.write(b"START\n")
+        message = await receive()
+        while message["type"] != "game_over":
+            if message["type"] == "safe_haven":
+                writer.write(b"CONTINUE\n")
+                message = await receive()
+                continue
+            
+            correct = answers.get(message["question"], 0)
+            choice = correct if rng.random() < accuracy else (correct + 1) % 4
+            start = time.perf_counter()
+            writer.write(f"ANSWER {LETTERS[choice]}\n".encode())
+            await writer.drain()
+            await receive()  # Resultado de la respuesta
+            latencies.append(time.perf_counter() - start)
+            message = await receive()
+    
+    writer.write(b"QUIT\n")
+    await receive()
+    writer.close()
+
+
+async def run(args) -> dict:
+    bank = get_shared_bank(os.path.join(DATA_DIR, "questions.json"))
+    answers = {question["question"]: question["answer"] for question in bank.records}
+    
+    server = None
+    host, port = args.host, args.port
+    if host is None:
+        server = GameServer(bank)
+        host, port = "127.0.0.1", await server.start("127.0.0.1", 0)
+    
+    latencies = []
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        play_client(host, port, args.games, answers, args.accuracy, latencies,
+                    random.Random(rng.random()))
+        for _ in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        await server.stop()
+    
+    latencies.sort()
+    return {
+        "clients": args.clients,
+        "games": args.clients * args.games,
+        "answers": len(latencies),
+        "elapsed_s": elapsed,
+        "answers_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Generador de carga del servidor")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--accuracy", type=float, default=0.9,
+                        help="Probabilidad de que un cliente acierte")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=5050)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Imprimir resultados en JSON")
+    args = parser.parse_args(argv)
+    
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print(f"{results['clients']} clientes, {results['games']} partidas, "
+              f"{results['answers']} respuestas en {results['elapsed_s']:.2f} s "
+              f"({results['answers_per_second']:.0f} respuestas/s)")
+        print(f"Latencia de respuesta: p50 {results['p50_ms']:.2f} ms | "
+              f"p99 {results['p99_ms']:.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks sin pantalla
+
+Corre con el driver de video "dummy" de SDL y mide:
+- cuadros por segundo de GameUI.draw_game_screen sobre el banco real
+- textos por segundo de wrap_text con preguntas largas
+- carga del banco y reparto de preguntas con 1.000, 100.000 y 1.000.000
+  preguntas sintéticas
+- pasos por segundo del motor del juego
+
+Los resultados se guardan en JSON y se comparan con una línea base
+(benchmarks/baseline.json): si alguna métrica empeora más que la
+tolerancia, el programa termina con código 1. Junto a cada medición se
+cronometra un trabajo de referencia fijo en Python puro, y la
+comparación se corrige por la diferencia de velocidad de la máquina entre
+la línea base y la corrida. La línea base se regenera con
+--update-baseline.
+
+Uso:
+    python3 benchmarks/run.py [--sizes 1000,100000] [--output resultados.json]
+    python3 benchmarks/run.py --update-baseline
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from juego.bankfile import write_compiled_bank
+from juego.config import DATA_DIR, PRIZES, WINDOW_WIDTH, WINDOW_HEIGHT, WRAP_CACHE_SIZE
+from juego.engine import GameEngine, LETTERS, STATE_SAFE_HAVEN
+from juego.questions import QuestionBank, QuestionManager, Lifeline
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+# Cargar JSON cuesta decenas de segundos por millón de preguntas
+DEFAULT_JSON_LIMIT = 100_000
+# Las máquinas compartidas (CI) varían fácilmente un 40 % entre corridas
+DEFAULT_TOLERANCE = 0.50
+
+
+def metric(measured: tuple, unit: str, higher_is_better: bool = True,
+           scale=lambda seconds: seconds) -> dict:
+    """
+    Resultado de una métrica en el formato de salida.
+    
+    Args:
+        measured: (segundos, milisegundos de referencia) de best_time()
+        unit: Unidad del valor
+        higher_is_better: Si un valor mayor es mejor
+        scale: Convierte los segundos medidos al valor de la métrica
+    """
+    seconds, calibration = measured
+    return {"value": round(scale(seconds), 3), "unit": unit,
+            "higher_is_better": higher_is_better, "calibration_ms": round(calibration, 3)}
+
+
+def _reference_work() -> None:
+    """Trabajo fijo de Python puro (diccionarios, cadenas, llamadas)"""
+    counts = {}
+    for i in range(30_000):
+        counts[i & 1023] = counts.get(i & 1023, 0) + i
+    "".join(str(i) for i in range(6_000)).split("9")
+
+
+def best_time(function, repeats: int) -> tuple:
+    """
+    Mejor tiempo de varias ejecuciones, junto al de un trabajo de referencia.
+    
+    Antes de cada ejecución se cronometra _reference_work y se queda la
+    ejecución más rápida en relación con su referencia: la velocidad de la
+    máquina cambia durante la corrida y el ruido solo puede sumar tiempo.
+    Como en timeit, el recolector de basura no corre durante la medición.
+    
+    Returns:
+        (segundos de la ejecución, milisegundos de su referencia)
+    """
+    best = None
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            _reference_work()
+            reference = time.perf_counter() - start
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or elapsed / reference < best[0] / best[1]:
+            best = (elapsed, reference)
+    return best[0], best[1] * 1000
+
+
+def synthetic_questions(n: int, with_ids: bool = False):
+    """Genera n preguntas válidas y distintas, repartidas en 4 dificultades"""
+    for i in range(n):
+        question = {
+            "question": f"¿Pregunta sintética número {i} sobre un tema cualquiera?",
+            "options": [f"Opción {letter} de la pregunta {i}" for letter in LETTERS],
+            "answer": i % 4,
+            "difficulty": i % 4 + 1,
+        }
+        if with_ids:
+            # Evita calcular el hash del contenido: no es lo que se mide
+            question["id"] = f"{i:016x}"
+        yield question
+
+
+def load_real_bank() -> QuestionBank:
+    """Banco de preguntas real del juego"""
+    return QuestionBank.from_file(os.path.join(DATA_DIR, "questions.json"))
+
+
+def bench_render(frames: int) -> dict:
+    """
+    Cuadros por segundo de la pantalla de juego recorriendo el banco real.
+    
+    Cada pregunta se muestra y luego se seleccionan sus cuatro opciones,
+    como en una partida. También se mide el redibujado completo de cada
+    cuadro (sin regiones sucias).
+    """
+    import pygame
+    from juego.ui import GameUI
+    
+    bank = load_real_bank()
+    scenes = []
+    for i, question in enumerate(bank.records):
+        level = i % len(PRIZES) + 1
+        for selected in ("",) + tuple(LETTERS):
+            scenes.append((question["question"], list(question["options"]), selected, level))
+    
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        ui = GameUI(screen)
+        ui.prewrap_questions(q["question"] for q in bank.records)
+        
+        def play(n: int, full: bool) -> None:
+            for i in range(n):
+                question, options, selected, level = scenes[i % len(scenes)]
+                if not selected:
+                    ui.on_question_changed(options, question)
+                if full:
+                    ui.invalidate()
+                ui.draw_game_screen(question, options, selected, level,
+                                    PRIZES[level - 2] if level > 1 else 0,
+                                    "Jugador", False, False)
+        
+        play(len(scenes), False)  # Calentamiento de cachés
+        dirty = best_time(lambda: play(frames, False), 5)
+        full = best_time(lambda: play(frames, True), 5)
+    finally:
+        pygame.quit()
+    return {
+        "render.fps": metric(dirty, "cuadros/s", scale=lambda t: frames / t),
+        "render.full_redraw_fps": metric(full, "cuadros/s", scale=lambda t: frames / t),
+    }
+
+
+def bench_wrap() -> dict:
+    """Textos por segundo de wrap_text con preguntas largas, en frío y en caché"""
+    import pygame
+    from juego.fonts import get_font
+    from juego.utils import clear_wrap_cache, wrap_text
+    
+    questions = [q["question"] for q in load_real_bank().records]
+    texts = [f"{questions[i % len(questions)]} {questions[(i + 1) % len(questions)]} "
+             f"(variante {i})" for i in range(WRAP_CACHE_SIZE)]
+    max_width = WINDOW_WIDTH - 100
+    
+    pygame.init()
+    try:
+        font = get_font("Arial", 35)
+        
+        def cold() -> None:
+            clear_wrap_cache()
+            for text in texts:
+                wrap_text(text, font, max_width)
+        
+        def cached() -> None:
+            for text in texts:
+                wrap_text(text, font, max_width)
+        
+        cold_time = best_time(cold, 7)
+        cached_time = best_time(cached, 7)
+    finally:
+        pygame.quit()
+    return {
+        "wrap_text.cold_texts_per_s": metric(
+            cold_time, "textos/s", scale=lambda t: len(texts) / t),
+        "wrap_text.cached_texts_per_s": metric(
+            cached_time, "textos/s", scale=lambda t: len(texts) / t),
+    }
+
+
+def bench_bank(size: int, tmp: str, json_limit: int, games: int) -> dict:
+    """
+    Carga del banco y reparto con preguntas sintéticas.
+    
+    Args:
+        size: Número de preguntas
+        tmp: Directorio temporal para los archivos generados
+        json_limit: Tamaño máximo al que también se mide la carga desde JSON
+        games: Partidas de 10 preguntas repartidas para medir el reparto
+    """
+    results = {}
+    # Las cargas rápidas se repiten más para que el ruido no domine
+    repeats = 20 if size < 100_000 else 5
+    
+    compiled = os.path.join(tmp, f"compilado_{size}.qbank")
+    write_compiled_bank(synthetic_questions(size, with_ids=True), compiled)
+    load = lambda: QuestionManager(bank=QuestionBank.from_compiled(compiled))
+    results[f"bank.qbank_load_ms[{size}]"] = metric(
+        best_time(load, repeats), "ms", False, scale=lambda t: t * 1000)
+    
+    if size <= json_limit:
+        source = os.path.join(tmp, f"preguntas_{size}.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for question in synthetic_questions(size):
+                f.write(json.dumps(question, ensure_ascii=False) + "\n")
+        load = lambda: QuestionManager(bank=QuestionBank.from_file(source))
+        results[f"bank.json_load_ms[{size}]"] = metric(
+            best_time(load, 3 if size < 100_000 else 1), "ms", False,
+            scale=lambda t: t * 1000)
+    
+    manager = QuestionManager(bank=QuestionBank.from_compiled(compiled),
+                              rng=random.Random(size))
+    
+    def deal() -> None:
+        for _ in range(games):
+            manager.shuffle_questions()
+            for level in range(1, len(PRIZES) + 1):
+                manager.get_next_question(level)
+    
+    results[f"bank.deals_per_s[{size}]"] = metric(
+        best_time(deal, 5), "preguntas/s", scale=lambda t: games * len(PRIZES) / t)
+    return results
+
+
+def bench_engine(games: int) -> dict:
+    """Pasos por segundo del motor con un jugador que siempre acierta"""
+    bank = load_real_bank()
+    rng = random.Random(1)
+    engine = GameEngine(QuestionManager(bank=bank, rng=rng), Lifeline(rng))
+    steps = 0
+    
+    def play() -> None:
+        nonlocal steps
+        for _ in range(games):
+            engine.start()
+            while not engine.is_over:
+                if engine.state == STATE_SAFE_HAVEN:
+                    engine.continue_game()
+                else:
+                    engine.answer(LETTERS[engine.current_question["answer"]])
+                steps += 1
+    
+    play()  # Calentamiento; también cuenta los pasos de una pasada
+    steps_per_run = steps
+    return {"engine.steps_per_s": metric(
+        best_time(play, 5), "pasos/s", scale=lambda t: steps_per_run / t)}
+
+
+def run_suite(sizes=DEFAULT_SIZES, json_limit: int = DEFAULT_JSON_LIMIT,
+              frames: int = 500, games: int = 2000) -> dict:
+    """
+    Corre todos los benchmarks.
+    
+    Args:
+        sizes: Tamaños de los bancos sintéticos
+        json_limit: Tamaño máximo al que se mide la carga desde JSON
+        frames: Cuadros dibujados por medición
+        games: Partidas por medición (reparto y motor)
+    
+    Returns:
+        Diccionario nombre -> métrica
+    """
+    import pygame
+    
+    results = {}
+    steps = [("pantalla de juego", lambda: bench_render(frames)),
+             ("wrap_text", bench_wrap),
+             ("motor", lambda: bench_engine(games))]
+    with tempfile.TemporaryDirectory() as tmp:
+        steps.extend((f"banco de {size:,} preguntas",
+                      lambda size=size: bench_bank(size, tmp, json_limit, games))
+                     for size in sizes)
+        for label, step in steps:
+            print(f"Midiendo {label}...", flush=True)
+            results.update(step())
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compara métricas con la línea base.
+    
+    El valor base se ajusta por la razón entre los tiempos de referencia
+    de ambas corridas. Las métricas que no están en ambos lados no se
+    comparan.
+    
+    Args:
+        results: Métricas medidas (nombre -> métrica)
+        baseline: Métricas de la línea base
+        tolerance: Empeoramiento relativo permitido (0.3 = 30 %)
+    
+    Returns:
+        Lista de (nombre, valor, valor base ajustado, cambio relativo,
+        es regresión)
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None or not base["value"] or not current["value"]:
+            continue
+        # > 1 si esta corrida fue en una máquina (o un momento) más lento
+        slowdown = current.get("calibration_ms", 1) / base.get("calibration_ms", 1)
+        if current["higher_is_better"]:
+            expected = base["value"] / slowdown
+            change = current["value"] / expected - 1
+        else:
+            expected = base["value"] * slowdown
+            change = expected / current["value"] - 1
+        # Cambio positivo = mejora, sea cual sea el sentido de la métrica
+        rows.append((name, current["value"], expected, change, change < -tolerance))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Suite de benchmarks sin pantalla")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Tamaños de los bancos sintéticos, separados por comas")
+    parser.add_argument("--json-limit", type=int, default=DEFAULT_JSON_LIMIT)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--output", help="Archivo donde guardar los resultados en JSON")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Guarda los resultados como nueva línea base")
+    args = parser.parse_args(argv)
+    
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run_suite(sizes, args.json_limit, args.frames, args.games)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"Línea base guardada en {args.baseline}")
+        return 0
+    
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Sin línea base para comparar ({e})")
+        baseline = {}
+    
+    rows = {row[0]: row for row in compare(report["results"], baseline, args.tolerance)}
+    regressions = 0
+    for name, current in report["results"].items():
+        line = f"  {name:<34} {current['value']:14,.1f} {current['unit']:<12}"
+        if name in rows:
+            _, _, base, change, regressed = rows[name]
+            regressions += regressed
+            line += f" esperado {base:14,.1f}  {change:+7.1%}{'  REGRESIÓN' if regressed else ''}"
+        print(line)
+    
+    if regressions:
+        print(f"{regressions} métricas empeoraron más de {args.tolerance:.0%} "
+              f"respecto a la línea base")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
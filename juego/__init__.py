@@ -1,5 +1,33 @@
 """
 Paquete del juego ¿Quién Quiere Ser Millonario?
+
+Los módulos de preguntas, configuración y reglas no dependen de pygame.
+Las clases gráficas se exponen de forma perezosa: pygame solo se importa
+al acceder a ``juego.Game`` o ``juego.GameUI``.
 """
 
 __version__ = "2.0.0"
+
+# Nombre exportado -> módulo que lo define (se importa al primer acceso)
+_LAZY_EXPORTS = {
+    "Game": "juego.game",
+    "GameUI": "juego.ui",
+    "GameEngine": "juego.engine",
+    "QuestionManager": "juego.questions",
+    "QuestionBank": "juego.questions",
+    "Lifeline": "juego.questions",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'juego' has no attribute '{name}'")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -0,0 +1,113 @@
+"""
+Banco de preguntas compilado y embebido
+
+Generado desde questions.json con
+python -m juego.bankfile embed; no editar a mano.
+"""
+
+QUESTIONS = 25
+
+BANK = (
+    b"QQSB\x03\x002\x00\x19\x00\x00\x00\x06\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x00\x00\x00'\x00\x00\x00"
+    b'.\x00\x00\x005\x00\x00\x00!\x00\x00\x00\x06\x00\x00\x00\x07\x00\x00\x00\x07\x00\x00\x00\x06\x00\x00\x00\x93ty\x1c\xf8\xe78\xbf\x00\x01;\x00\x00\x00\xc2\x00\x00\x00\xe1\x00'
+    b'\x00\x00\x04\x01\x00\x00$\x01\x00\x00\x87\x00\x00\x00\x1f\x00\x00\x00#\x00\x00\x00 \x00\x00\x00!\x00\x00\x005\x93E\xc6\x90\xda\xe6k\x03\x02E\x01\x00\x00\xb5\x01\x00\x00'
+    b'\xbf\x01\x00\x00\xc7\x01\x00\x00\xce\x01\x00\x00p\x00\x00\x00\n\x00\x00\x00\x08\x00\x00\x00\x07\x00\x00\x00\n\x00\x00\x00\x99\xb4\x02\xd1\x8a\x08\xd8x\x00\x02\xd8\x01\x00\x00\x01\x02'
+    b'\x00\x00\x17\x02\x00\x00.\x02\x00\x00D\x02\x00\x00)\x00\x00\x00\x16\x00\x00\x00\x17\x00\x00\x00\x16\x00\x00\x00\x16\x00\x00\x00\xb1\x87\xf0o6\xd3\xee\xe5\x02\x03Z\x02\x00\x00'
+    b'\xd5\x02\x00\x00\xe1\x02\x00\x00\xed\x02\x00\x00\xf9\x02\x00\x00{\x00\x00\x00\x0c\x00\x00\x00\x0c\x00\x00\x00\x0c\x00\x00\x00\x0c\x00\x00\x00s2\xd5m\x95\x9f\x90\n\x01\x03\x05\x03'
+    b'\x00\x00p\x03\x00\x00|\x03\x00\x00\x86\x03\x00\x00\x94\x03\x00\x00k\x00\x00\x00\x0c\x00\x00\x00\n\x00\x00\x00\x0e\x00\x00\x00\r\x00\x00\x00\xf5L\x93\xbe\x93Q\t\xc7\x01\x02'
+    b'\xa1\x03\x00\x003\x04\x00\x00E\x04\x00\x00U\x04\x00\x00h\x04\x00\x00\x92\x00\x00\x00\x12\x00\x00\x00\x10\x00\x00\x00\x13\x00\x00\x00\x13\x00\x00\x00(J\x0f\xf1\xd2\xe0\x0f7'
+    b'\x01\x03{\x04\x00\x00\x10\x05\x00\x00#\x05\x00\x001\x05\x00\x00C\x05\x00\x00\x95\x00\x00\x00\x13\x00\x00\x00\x0e\x00\x00\x00\x12\x00\x00\x00\x13\x00\x00\x004PF\x05>\xdd'
+    b'\x04O\x03\x04V\x05\x00\x00\xcb\x05\x00\x00\xda\x05\x00\x00\xeb\x05\x00\x00\xf8\x05\x00\x00u\x00\x00\x00\x0f\x00\x00\x00\x11\x00\x00\x00\r\x00\x00\x00\x0c\x00\x00\x00\xce\xf3]3'
+    b'|\r\x8e\x92\x01\x02\x04\x06\x00\x00\xb4\x06\x00\x00\xbd\x06\x00\x00\xc5\x06\x00\x00\xcc\x06\x00\x00\xb0\x00\x00\x00\t\x00\x00\x00\x08\x00\x00\x00\x07\x00\x00\x00\x06\x00\x00\x00\xad\x81'
+    b'@\xc3+\xac\xc6l\x01\x03\xd2\x06\x00\x00W\x07\x00\x00a\x07\x00\x00e\x07\x00\x00n\x07\x00\x00\x85\x00\x00\x00\n\x00\x00\x00\x04\x00\x00\x00\t\x00\x00\x00\x06\x00\x00\x00'
+    b'4\x8fa+\x94\xe8%\xac\x02\x02t\x07\x00\x00\x11\x08\x00\x00\x16\x08\x00\x00"\x08\x00\x00&\x08\x00\x00\x9d\x00\x00\x00\x05\x00\x00\x00\x0c\x00\x00\x00\x04\x00\x00\x00\t\x00'
+    b'\x00\x00\xbb\xe1\xb2D\x14-UD\x00\x02/\x08\x00\x00\xb1\x08\x00\x00\xc3\x08\x00\x00\xd1\x08\x00\x00\xdd\x08\x00\x00\x82\x00\x00\x00\x12\x00\x00\x00\x0e\x00\x00\x00\x0c\x00\x00\x00'
+    b'\x15\x00\x00\x00\xa8/g\x92;\xf2$\x18\x02\x04\xf2\x08\x00\x00%\t\x00\x00)\t\x00\x00-\t\x00\x001\t\x00\x003\x00\x00\x00\x04\x00\x00\x00\x04\x00\x00\x00\x04\x00'
+    b'\x00\x00\x04\x00\x00\x00\x03\xa1\xb2\xcd\x97\r\x18\x86\x02\x015\t\x00\x00m\t\x00\x00r\t\x00\x00y\t\x00\x00\x80\t\x00\x008\x00\x00\x00\x05\x00\x00\x00\x07\x00\x00\x00'
+    b'\x07\x00\x00\x00\x06\x00\x00\x00G\x86\x8f\x90\xc6\x876\xd8\x00\x03\x86\t\x00\x00\xcb\t\x00\x00\xcf\t\x00\x00\xd3\t\x00\x00\xd7\t\x00\x00E\x00\x00\x00\x04\x00\x00\x00\x04\x00'
+    b"\x00\x00\x04\x00\x00\x00\x19\x00\x00\x00E\xfe\xa4\x97\x9a=d\xd5\x02\x03\xf0\t\x00\x00#\n\x00\x00'\n\x00\x00+\n\x00\x00/\n\x00\x003\x00\x00\x00\x04\x00\x00\x00"
+    b'\x04\x00\x00\x00\x04\x00\x00\x00\x04\x00\x00\x00-*\x83\xb8s\xff\x8c,\x01\x033\n\x00\x00\x80\n\x00\x00\x8d\n\x00\x00\x9d\n\x00\x00\xb6\n\x00\x00M\x00\x00\x00\r\x00'
+    b'\x00\x00\x10\x00\x00\x00\x19\x00\x00\x00\x0e\x00\x00\x00\x15\x96z\xd7\r\xbbY\x1b\x02\x04\xc4\n\x00\x00D\x0b\x00\x00Z\x0b\x00\x00q\x0b\x00\x00\x87\x0b\x00\x00\x80\x00\x00\x00'
+    b'\x16\x00\x00\x00\x17\x00\x00\x00\x16\x00\x00\x00\x1d\x00\x00\x00^-nP\x96F\xbdh\x01\x04\xa4\x0b\x00\x00\xe3\x0b\x00\x00\xee\x0b\x00\x00\xf9\x0b\x00\x00\t\x0c\x00\x00?\x00'
+    b'\x00\x00\x0b\x00\x00\x00\x0b\x00\x00\x00\x10\x00\x00\x00\x0b\x00\x00\x00\x8a\xef?\xc2\x8e5J\xfe\x00\x01\x14\x0c\x00\x00\x86\x03\x00\x00|\x03\x00\x00>\x0c\x00\x00K\x0c\x00\x00'
+    b'*\x00\x00\x00\x0e\x00\x00\x00\n\x00\x00\x00\r\x00\x00\x00\x0c\x00\x00\x00K\x95"\xe8Un\xc1\xe5\x00\x02W\x0c\x00\x00\xa1\x0c\x00\x00\xce\x01\x00\x00\xa6\x0c\x00\x00\xab\x0c'
+    b'\x00\x00J\x00\x00\x00\x05\x00\x00\x00\n\x00\x00\x00\x05\x00\x00\x00\t\x00\x00\x00\x9a\xe7\x02\xf5\x11\xa3v1\x00\x03\xb4\x0c\x00\x00\xe0\x0c\x00\x00\xef\x0c\x00\x00\xff\x0c\x00\x00'
+    b'\x10\r\x00\x00,\x00\x00\x00\x0f\x00\x00\x00\x10\x00\x00\x00\x11\x00\x00\x00\x10\x00\x00\x00\x11\xc4\x85;I\x83I)\x00\x03 \r\x00\x00g\r\x00\x00\x7f\r\x00\x00\x8c\r'
+    b'\x00\x00\x9c\r\x00\x00G\x00\x00\x00\x18\x00\x00\x00\r\x00\x00\x00\x10\x00\x00\x00\x12\x00\x00\x00\xb9\xe1\xe9\xab\xa3\xd8\x95\xfa\x00\x01\xae\r\x00\x00\xdc\r\x00\x00\xe3\r\x00\x00'
+    b'"\x08\x00\x00\x16\x08\x00\x00.\x00\x00\x00\x07\x00\x00\x00\t\x00\x00\x00\x04\x00\x00\x00\x0c\x00\x00\x00\x19\xee\x0c\'\xb5\x81\x93\r\x00\x01\xc2\xbfCu\xc3\xa1l es'
+    b' la capital de Francia?Par\xc3\xadsBerl\xc3\xadnLondresMadri'
+    b'd\xc2\xbfCu\xc3\xa1l es el nombre del parque nacional ubicad'
+    b'o en la regi\xc3\xb3n amaz\xc3\xb3nica de Colombia que prote'
+    b'ge una gran diversidad de flora y fauna?Parque N'
+    b'acional Natural TayronaParque Nacional Natural L'
+    b'os NevadosParque Nacional Natural El CocuyParque'
+    b' Nacional Natural Amacayacu\xc2\xbfQu\xc3\xa9 ciudad colombi'
+    b'ana es conocida como la "Capital del Oro Blanco"'
+    b' debido a su importante producci\xc3\xb3n de sal?Zipaq'
+    b'uir\xc3\xa1Nemoc\xc3\xb3nC\xc3\xbacutaLa Guajira\xc2\xbfCu\xc3\xa1ndo se fund\xc3'
+    b'\xb3 la ciudad de Bogot\xc3\xa1?El 29 de julio de 1525El '
+    b'8 de octubre de 1558El 6 de agosto de 1538El 12 '
+    b'de abril de 1546\xc2\xbfCu\xc3\xa1l es la altura aproximada '
+    b'del Cerro del Quinini, una monta\xc3\xb1a en Colombia '
+    b'conocida por su misteriosa niebla perpetua?2.000'
+    b' metros3.500 metros4.800 metros6.200 metros\xc2\xbfQu\xc3'
+    b'\xa9 r\xc3\xado atraviesa la ciudad de Cali y es famoso p'
+    b'or sus r\xc3\xa1pidos y practicantes de deportes acu\xc3\xa1'
+    b'ticos?R\xc3\xado Bogot\xc3\xa1R\xc3\xado CaucaR\xc3\xado MagdalenaR\xc3\xado C'
+    b'aquet\xc3\xa1\xc2\xbfCu\xc3\xa1l es el nombre de la famosa danza c'
+    b'olombiana que representa la lucha entre el bien '
+    b'y el mal, y suele interpretarse en festivales re'
+    b'ligiosos?Danza del GarabatoDanza del DiabloDanza'
+    b' de la CulebraDanza de los Congos\xc2\xbfCu\xc3\xa1l es el n'
+    b'ombre del fen\xc3\xb3meno natural en Colombia que cons'
+    b'iste en la formaci\xc3\xb3n de miles de luci\xc3\xa9rnagas s'
+    b'incronizadas que iluminan los bosques?Mariposas '
+    b'amarillasFlores de lunaR\xc3\xados de estrellasMar de '
+    b'luci\xc3\xa9rnagas\xc2\xbfQu\xc3\xa9 regi\xc3\xb3n de Colombia es famosa'
+    b' por sus tejidos de fique, utilizados en la conf'
+    b'ecci\xc3\xb3n de productos artesanales?La Costa Caribe'
+    b'La Regi\xc3\xb3n AndinaLa Orinoqu\xc3\xadaLa Amazon\xc3\xada\xc2\xbfQu\xc3\xa9'
+    b' tipo de m\xc3\xbasica colombiana es originaria de la '
+    b'regi\xc3\xb3n del Pac\xc3\xadfico y se caracteriza por sus r'
+    b'itmos africanos y letras que narran historias de'
+    b' esclavitud y resistencia?VallenatoCurrulaoBambu'
+    b'coJoropo\xc2\xbfQu\xc3\xa9 fruta tropical originaria de Colo'
+    b'mbia se caracteriza por su pulpa suave y jugosa,'
+    b' y es conocida como "la fruta de la pasi\xc3\xb3n"?Gua'
+    b'n\xc3\xa1banaLuloMaracuy\xc3\xa1Papaya\xc2\xbfQu\xc3\xa9 ciudad colombia'
+    b'na es conocida por su tradicional Carnaval de Bl'
+    b'ancos y Negros, declarado Patrimonio Cultural In'
+    b'material de la Humanidad por la UNESCO?PastoBarr'
+    b'anquillaCaliManizales\xc2\xbfQu\xc3\xa9 pintor colombiano es'
+    b' conocido por su estilo impresionista y sus obra'
+    b's que retratan la vida cotidiana de la costa car'
+    b'ibe\xc3\xb1a?Alejandro Obreg\xc3\xb3nD\xc3\xa9bora ArangoEnrique G'
+    b'rauEnrique Olaya Herrera\xc2\xbfEn qu\xc3\xa9 a\xc3\xb1o lleg\xc3\xb3 Cr'
+    b'ist\xc3\xb3bal Col\xc3\xb3n a Am\xc3\xa9rica?1485147314921468\xc2\xbfCu\xc3'
+    b'\xa1l es la etnia ind\xc3\xadgena m\xc3\xa1s numerosa de Colomb'
+    b'ia?WayuuEmber\xc3\xa1SikuaniYaggua\xc2\xbfCu\xc3\xa1ndo gan\xc3\xb3 la s'
+    b'elecci\xc3\xb3n colombiana la Copa Am\xc3\xa9rica de F\xc3\xbatbol'
+    b'?201020052001Ninguna de las anteriores\xc2\xbfHasta qu'
+    b'\xc3\xa9 a\xc3\xb1o Panam\xc3\xa1 form\xc3\xb3 parte de Colombia?1923190'
+    b'319531913\xc2\xbfCu\xc3\xa1l fue el primer ciclista colombia'
+    b'no en participar en el Giro de Italia?Lucho Herr'
+    b'eraOliverio Rinc\xc3\xb3nMart\xc3\xadn Emilio Rodr\xc3\xadguezNair'
+    b'o Quintana\xc2\xbfC\xc3\xb3mo se llam\xc3\xb3 el pueblo fundado po'
+    b'r los esclavos cimarrones rebeldes liderados por'
+    b' Benk\xc3\xb3s Bioh\xc3\xb3 a comienzos del siglo XVI?El pue'
+    b'blo de Monter\xc3\xadaSan Basilio de PalenqueLa ciudad'
+    b' de SincelejoEl pueblo de Puerto Liberador\xc2\xbfQu\xc3\xa9'
+    b' d\xc3\xada se celebra el d\xc3\xada de la independencia de '
+    b'Colombia?20 de julio19 de abril18 de septiembre2'
+    b'0 de junio\xc2\xbfCu\xc3\xa1l es el r\xc3\xado m\xc3\xa1s largo de Colom'
+    b'bia?R\xc3\xado AmazonasR\xc3\xado Orinoco\xc2\xbfEn qu\xc3\xa9 departame'
+    b'nto de Colombia se encuentra el Desierto de la T'
+    b'atacoa?HuilaCesarSantander\xc2\xbfCu\xc3\xa1l es el volc\xc3\xa1n '
+    b'm\xc3\xa1s alto de Colombia?Nevado del RuizNevado del '
+    b'HuilaNevado del TolimaNevado del Cocuy\xc2\xbfQu\xc3\xa9 esc'
+    b'ritor colombiano gan\xc3\xb3 el Premio Nobel de Litera'
+    b'tura en 1982?Gabriel Garc\xc3\xada M\xc3\xa1rquez\xc3\x81lvaro Mut'
+    b'isFernando VallejoMario Vargas Llosa\xc2\xbfCu\xc3\xa1l es l'
+    b'a ciudad m\xc3\xa1s poblada de Colombia?Bogot\xc3\xa1Medell\xc3'
+    b'\xadn'
+)
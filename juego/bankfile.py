@@ -0,0 +1,363 @@
+"""
+Formato binario compilado del banco de preguntas
+
+El archivo compilado (.qbank) contiene una cabecera, un registro de tamaño
+fijo por pregunta y una tabla de cadenas UTF-8. Se abre con mmap, de modo
+que las preguntas se decodifican solo al acceder a ellas y varios procesos
+comparten las mismas páginas de memoria.
+
+El banco compilado también se puede embeber en un módulo de Python
+(juego/bank_embedded.py) como un literal de bytes, para arrancar sin leer
+archivos de datos.
+
+Uso:
+    python -m juego.bankfile build [data/questions.json] [-o salida.qbank]
+    python -m juego.bankfile embed [data/questions.json] [-o juego/bank_embedded.py]
+"""
+import io
+import mmap
+import os
+import struct
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
+from juego.config import DATA_DIR
+from juego.loader import LoadReport, iter_questions, question_id
+
+MAGIC = b"QQSB"
+VERSION = 3
+COMPILED_SUFFIX = ".qbank"
+
+# magic, versión, tamaño de registro, número de preguntas,
+# posición de la tabla de cadenas, mtime_ns y tamaño del JSON de origen
+HEADER = struct.Struct("<4sHHIQqQ")
+
+# posiciones de pregunta y 4 opciones, sus longitudes (de 32 bits: el
+# cargador admite preguntas de hasta 1 MB), identificador, respuesta,
+# dificultad
+RECORD = struct.Struct("<5I5IQBB")
+ID = struct.Struct("<Q")
+ID_OFFSET = 40
+DIFFICULTY_OFFSET = RECORD.size - 1
+
+MAX_INTERNED_STRINGS = 65536
+
+EMBEDDED_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bank_embedded.py")
+EMBEDDED_LINE_BYTES = 48
+
+
+class CompiledRecords:
+    """Secuencia de preguntas de solo lectura sobre un buffer compilado"""
+    
+    def __init__(self, buffer):
+        """
+        Inicializa la secuencia.
+        
+        Args:
+            buffer: Contenido del archivo compilado (mmap o bytes)
+            
+        Raises:
+            ValueError: Si el buffer no es un banco compilado válido
+        """
+        header = HEADER.unpack_from(buffer, 0)
+        magic, version, record_size, count, strings_offset, mtime_ns, size = header
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError("Formato de banco compilado no reconocido")
+        
+        self.buffer = buffer
+        self.count = count
+        self.strings_offset = strings_offset
+        self.source_mtime_ns = mtime_ns
+        self.source_size = size
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __getitem__(self, index: int) -> Mapping:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Índice de pregunta fuera de rango")
+        
+        fields = RECORD.unpack_from(self.buffer, HEADER.size + index * RECORD.size)
+        offsets, lengths = fields[:5], fields[5:10]
+        texts = [
+            bytes(self.buffer[self.strings_offset + start:
+                              self.strings_offset + start + length]).decode("utf-8")
+            for start, length in zip(offsets, lengths)
+        ]
+        return MappingProxyType({
+            "question": texts[0],
+            "options": tuple(texts[1:]),
+            "answer": fields[11],
+            "difficulty": fields[12],
+            "id": f"{fields[10]:016x}",
+        })
+    
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+    
+    def ids(self) -> Iterable[int]:
+        """Identificador de cada pregunta como entero, sin decodificar los textos"""
+        unpack_from = ID.unpack_from
+        start = HEADER.size + ID_OFFSET
+        for i in range(self.count):
+            yield unpack_from(self.buffer, start + i * RECORD.size)[0]
+    
+    def difficulties(self) -> bytes:
+        """Dificultad de cada pregunta, sin decodificar los textos"""
+        start = HEADER.size + DIFFICULTY_OFFSET
+        return bytes(self.buffer[start:start + self.count * RECORD.size:RECORD.size])
+
+
+def compiled_path_for(json_path: str) -> str:
+    """Ruta del archivo compilado que corresponde a un JSON de preguntas"""
+    return os.path.splitext(json_path)[0] + COMPILED_SUFFIX
+
+
+def open_compiled_bank(path: str) -> CompiledRecords:
+    """
+    Abre un banco compilado mapeándolo en memoria.
+    
+    Args:
+        path: Ruta del archivo .qbank
+        
+    Returns:
+        Secuencia de preguntas decodificadas bajo demanda
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return CompiledRecords(buffer)
+
+
+def is_fresh(compiled_path: str, json_path: str) -> bool:
+    """
+    Verifica si el archivo compilado corresponde a la versión actual del JSON.
+    
+    Args:
+        compiled_path: Ruta del archivo .qbank
+        json_path: Ruta del JSON de origen
+        
+    Returns:
+        True si el compilado existe y fue generado desde ese mismo JSON
+    """
+    try:
+        with open(compiled_path, "rb") as f:
+            header = f.read(HEADER.size)
+        source = os.stat(json_path)
+    except OSError:
+        return False
+    if len(header) < HEADER.size:
+        return False
+    magic, version, _, _, _, mtime_ns, size = HEADER.unpack(header)
+    return (magic == MAGIC and version == VERSION
+            and mtime_ns == source.st_mtime_ns and size == source.st_size)
+
+
+def _write_bank(out, strings, questions: Iterable[Dict],
+                source_mtime_ns: int, source_size: int) -> int:
+    """
+    Escribe el banco en out usando strings como almacén temporal de cadenas.
+    
+    Returns:
+        Número de preguntas escritas
+    """
+    import shutil
+    
+    # Cadenas repetidas (p. ej. opciones comunes) se guardan una sola vez
+    string_offsets: Dict[str, int] = {}
+    strings_size = 0
+    count = 0
+    
+    def intern(text: str) -> tuple:
+        nonlocal strings_size
+        data = text.encode("utf-8")
+        offset = string_offsets.get(text)
+        if offset is None:
+            if len(string_offsets) >= MAX_INTERNED_STRINGS:
+                string_offsets.clear()
+            offset = string_offsets[text] = strings_size
+            strings.write(data)
+            strings_size += len(data)
+        return offset, len(data)
+    
+    out.write(b"\0" * HEADER.size)
+    for question in questions:
+        if len(question["options"]) != 4:
+            raise ValueError(f"La pregunta {count} no tiene 4 opciones")
+        located = [intern(question["question"])]
+        located.extend(intern(option) for option in question["options"])
+        try:
+            record = RECORD.pack(
+                *(offset for offset, _ in located),
+                *(length for _, length in located),
+                int(question.get("id") or question_id(question), 16),
+                question["answer"], question.get("difficulty", 1)
+            )
+        except struct.error as e:
+            raise ValueError(f"La pregunta {count} no cabe en el formato compilado: {e}")
+        out.write(record)
+        count += 1
+    
+    strings_offset = out.tell()
+    strings.seek(0)
+    shutil.copyfileobj(strings, out)
+    out.seek(0)
+    out.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, strings_offset,
+                          source_mtime_ns, source_size))
+    return count
+
+
+def write_compiled_bank(questions: Iterable[Dict], out_path: str,
+                        source_mtime_ns: int = 0, source_size: int = 0) -> int:
+    """
+    Escribe preguntas en formato compilado, en streaming.
+    
+    Los registros se escriben directamente en el archivo de salida y las
+    cadenas en un archivo temporal que se concatena al final, así que la
+    memoria usada no crece con el número de preguntas.
+    
+    Args:
+        questions: Preguntas válidas (4 opciones, respuesta y dificultad)
+        out_path: Ruta del archivo a generar
+        source_mtime_ns: mtime del JSON de origen (para detectar cambios)
+        source_size: Tamaño del JSON de origen
+        
+    Returns:
+        Número de preguntas escritas
+    """
+    import tempfile
+    
+    tmp_path = out_path + ".tmp"
+    try:
+        with open(tmp_path, "w+b") as out, tempfile.TemporaryFile() as strings:
+            count = _write_bank(out, strings, questions, source_mtime_ns, source_size)
+    except BaseException:
+        # Una pregunta inválida a mitad del streaming no deja el archivo a medias
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Reemplazo atómico: los procesos que ya lo mapearon no ven un archivo a medias
+    os.replace(tmp_path, out_path)
+    return count
+
+
+def compile_to_bytes(questions: Iterable[Dict]) -> bytes:
+    """
+    Compila preguntas en memoria.
+    
+    Args:
+        questions: Preguntas válidas (4 opciones, respuesta y dificultad)
+        
+    Returns:
+        Contenido de un archivo .qbank
+    """
+    out, strings = io.BytesIO(), io.BytesIO()
+    _write_bank(out, strings, questions, 0, 0)
+    return out.getvalue()
+
+
+def write_embedded_module(json_path: str, out_path: str = EMBEDDED_MODULE,
+                          report: Optional[LoadReport] = None) -> int:
+    """
+    Genera un módulo de Python con el banco compilado como literal de bytes.
+    
+    Args:
+        json_path: Ruta del archivo de preguntas de origen
+        out_path: Ruta del módulo a generar
+        report: Reporte donde acumular los conteos y errores
+        
+    Returns:
+        Número de preguntas embebidas
+    """
+    data = compile_to_bytes(iter_questions(json_path, report))
+    count = HEADER.unpack_from(data, 0)[3]
+    lines = [
+        '"""',
+        "Banco de preguntas compilado y embebido",
+        "",
+        f"Generado desde {os.path.basename(json_path)} con",
+        "python -m juego.bankfile embed; no editar a mano.",
+        '"""',
+        "",
+        f"QUESTIONS = {count}",
+        "",
+        "BANK = (",
+    ]
+    lines.extend(f"    {data[i:i + EMBEDDED_LINE_BYTES]!r}"
+                 for i in range(0, len(data), EMBEDDED_LINE_BYTES))
+    lines.append(")")
+    
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", encoding="ascii") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, out_path)
+    return count
+
+
+def build_compiled_bank(json_path: str, out_path: Optional[str] = None,
+                        report: Optional[LoadReport] = None) -> str:
+    """
+    Compila un archivo de preguntas (arreglo JSON o JSON Lines).
+    
+    Las preguntas inválidas se omiten y quedan registradas en el reporte.
+    
+    Args:
+        json_path: Ruta del archivo de origen
+        out_path: Ruta de salida (por defecto, junto al origen con extensión .qbank)
+        report: Reporte donde acumular los conteos y errores
+        
+    Returns:
+        Ruta del archivo generado
+    """
+    out_path = out_path or compiled_path_for(json_path)
+    source = os.stat(json_path)
+    write_compiled_bank(iter_questions(json_path, report), out_path,
+                        source.st_mtime_ns, source.st_size)
+    return out_path
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Compila el banco de preguntas")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Genera el archivo .qbank")
+    build.add_argument("json_path", nargs="?",
+                       default=os.path.join(DATA_DIR, "questions.json"))
+    build.add_argument("-o", "--output", default=None)
+    embed = subparsers.add_parser("embed", help="Genera el módulo con el banco embebido")
+    embed.add_argument("json_path", nargs="?",
+                       default=os.path.join(DATA_DIR, "questions.json"))
+    embed.add_argument("-o", "--output", default=EMBEDDED_MODULE)
+    args = parser.parse_args(argv)
+    
+    if args.command == "embed":
+        report = LoadReport(args.json_path)
+        try:
+            count = write_embedded_module(args.json_path, args.output, report)
+        except (OSError, ValueError) as e:
+            print(f"Error: No se pudo embeber {args.json_path}: {e}")
+            raise SystemExit(1)
+        print(f"Banco embebido: {args.output} ({count} preguntas; {report.summary()})")
+        for error in report.errors:
+            print(f"  - {error}")
+    elif args.command == "build":
+        report = LoadReport(args.json_path)
+        try:
+            out_path = build_compiled_bank(args.json_path, args.output, report)
+        except (OSError, ValueError) as e:
+            # ValueError incluye los errores de sintaxis de json
+            print(f"Error: No se pudo compilar {args.json_path}: {e}")
+            raise SystemExit(1)
+        print(f"Banco compilado: {out_path} ({report.summary()})")
+        for error in report.errors:
+            print(f"  - {error}")
+
+
+if __name__ == "__main__":
+    main()
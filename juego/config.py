@@ -8,10 +8,22 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(os.path.dirname(BASE_DIR), "assets")
 DATA_DIR = os.path.join(os.path.dirname(BASE_DIR), "data")
 
-# Configuración de la ventana
+# Configuración de la ventana (también es la resolución de referencia del
+# diseño: en otros tamaños la interfaz se escala, ver juego/layout.py)
 WINDOW_WIDTH = 1800
 WINDOW_HEIGHT = 900
+WINDOW_RESIZABLE = True
+FULLSCREEN = os.environ.get("QQSM_FULLSCREEN", "") not in ("", "0")  # Kioscos
+RENDER_MAX_HEIGHT = 1080  # Paneles más altos se dibujan a esta altura y se escalan por hardware
+LAYOUT_CACHE_SIZE = 8  # Resoluciones con disposición e imágenes escaladas en caché
 FPS = 60
+DIRTY_RECT_RENDERING = True  # Redibujar solo las regiones que cambian
+
+# Planificador del bucle: esperar eventos en lugar de girar a FPS fijos
+IDLE_WAIT_MODE = True
+IDLE_WAIT_TIMEOUT_MS = 1000  # Despertar periódico aunque no haya eventos
+SCHEDULER_REPORT_INTERVAL = 0  # Segundos entre reportes de consumo (0 = desactivado)
+TRANSITION_SAMPLES = 256  # Transiciones entre preguntas que se guardan para las métricas
 
 # Colores
 COLOR_BACKGROUND = (1, 0, 56)
@@ -25,12 +37,26 @@ COLOR_OPTION_HOVER = (50, 50, 150)
 COLOR_OPTION_SELECTED = (100, 150, 255)
 
 # Fuentes
+FONT_FAMILY = "Arial"
 FONT_TITLE_SIZE = 48
 FONT_QUESTION_SIZE = 35
 FONT_OPTION_SIZE = 30
 FONT_SCORE_SIZE = 30
 FONT_INFO_SIZE = 20
 
+# Escalera de premios (panel izquierdo de la pantalla de juego)
+LADDER_X = 50
+LADDER_Y = 400
+LADDER_WIDTH = 350
+LADDER_ROW_HEIGHT = 36
+
+# Caché de superficies de texto renderizadas
+TEXT_CACHE_SIZE = 256  # Máximo de textos estáticos en caché
+QUESTION_TEXT_CACHE_SIZE = 64  # Máximo de textos de la pregunta actual
+WRAP_CACHE_SIZE = 512  # Máximo de textos con su división en líneas memorizada
+WIDTH_TABLE_SIZE = 8192  # Máximo de anchos de palabra memorizados por fuente
+PREPARED_QUESTIONS = 4  # Preguntas candidatas prerenderizadas como máximo
+
 # Configuración del juego
 MAX_QUESTIONS = 10
 QUESTION_VALUE = 1000
@@ -50,6 +76,28 @@ PRIZES = [
     1000000,   # Pregunta 10 (Gran premio)
 ]
 
+# Registro de resultados
+RESULTS_DB = os.path.join(DATA_DIR, "results.db")
+RESULTS_QUEUE_SIZE = 1024  # Sesiones pendientes de escribir como máximo
+RESULTS_BATCH_SIZE = 100  # Sesiones por transacción
+RESULTS_FLUSH_INTERVAL = 1.0  # Segundos máximos antes de escribir un lote
+LEADERBOARD_DAYS_CACHED = 7  # Clasificaciones diarias que se mantienen en memoria
+SEEN_DB = os.path.join(DATA_DIR, "seen.db")  # Preguntas vistas por cada jugador
+
+# Comodín "preguntar al público"
+ANSWER_STATS_FILE = os.path.join(DATA_DIR, "answer_stats.json")
+AUDIENCE_PRIOR_ANSWERS = 20  # Respuestas simuladas que suavizan preguntas con pocos datos
+
+# Servidor multijugador
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 5050
+SERVER_IDLE_TIMEOUT = 300  # Segundos sin comandos antes de cerrar la sesión
+
+# Perfilador de cuadros: solo se instala con QQSM_PROFILE=1; desactivado no cuesta nada
+PROFILER_ENABLED = os.environ.get("QQSM_PROFILE", "") not in ("", "0")
+PROFILER_OUTPUT = os.path.join(DATA_DIR, "profile.json")  # También se escribe profile.folded
+PROFILER_TOP_SECTIONS = 5  # Secciones más costosas que muestra la superposición
+
 # Teclas
 KEY_OPTION_A = "a"
 KEY_OPTION_B = "b"
@@ -58,3 +106,5 @@ KEY_OPTION_D = "d"
 KEY_CONFIRM = "return"
 KEY_FIFTY_FIFTY = "z"
 KEY_SKIP_QUESTION = "x"
+KEY_ASK_AUDIENCE = "v"
+KEY_PROFILER_OVERLAY = "f3"
@@ -0,0 +1,250 @@
+"""
+Motor del juego sin interfaz gráfica
+
+Contiene las reglas de ¿Quién Quiere Ser Millonario? como una máquina de
+estados independiente de pygame, para jugar desde la interfaz gráfica, un
+servidor o simulaciones por lotes.
+"""
+import time
+from typing import Iterable, List, Mapping, Optional
+from juego.config import MAX_QUESTIONS, PRIZES, SAFE_HAVENS
+from juego.questions import QuestionManager, Lifeline
+from juego.stats import AnswerStats, question_key
+
+LETTERS = ["A", "B", "C", "D"]
+
+# Estados del motor
+STATE_IDLE = "idle"  # Aún no comienza
+STATE_QUESTION = "question"  # Esperando respuesta a la pregunta actual
+STATE_SAFE_HAVEN = "safe_haven"  # En estación segura: continuar o retirarse
+STATE_WON = "won"  # Respondió todas las preguntas
+STATE_LOST = "lost"  # Respuesta incorrecta
+STATE_WALKED_AWAY = "walked_away"  # Se retiró en una estación segura
+STATE_OUT_OF_QUESTIONS = "out_of_questions"  # El banco se agotó
+
+FINAL_STATES = (STATE_WON, STATE_LOST, STATE_WALKED_AWAY, STATE_OUT_OF_QUESTIONS)
+
+
+def check_answer(user_answer: str, correct_answer: int) -> bool:
+    """
+    Verifica si la respuesta es correcta.
+    
+    Args:
+        user_answer: Respuesta del usuario (A, B, C, D)
+        correct_answer: Índice de la respuesta correcta
+        
+    Returns:
+        True si es correcta, False si no
+    """
+    return user_answer.upper() == LETTERS[correct_answer]
+
+
+class GameEngine:
+    """Reglas del juego como máquina de estados"""
+    
+    __slots__ = ("question_manager", "lifeline", "state", "correct_answers",
+                 "score", "current_question", "current_options", "questions_dealt",
+                 "history", "lifelines_used", "started_at", "_dealt_at",
+                 "stats", "audience", "dealt_ids")
+    
+    def __init__(self, question_manager: QuestionManager,
+                 lifeline: Optional[Lifeline] = None,
+                 stats: Optional[AnswerStats] = None):
+        """
+        Inicializa el motor.
+        
+        Args:
+            question_manager: Gestor de preguntas de la sesión
+            lifeline: Comodines de la sesión (por defecto, unos nuevos)
+            stats: Estadísticas de respuestas que se actualizan con cada
+                   respuesta y alimentan el comodín del público (opcional)
+        """
+        self.question_manager = question_manager
+        self.lifeline = lifeline if lifeline is not None else Lifeline()
+        self.state = STATE_IDLE
+        self.correct_answers = 0
+        self.score = 0
+        self.current_question: Optional[Mapping] = None
+        self.current_options: List[str] = []
+        self.questions_dealt = 0
+        # (nivel, id, pregunta, opción elegida, correcta, segundos en responder)
+        self.history: List[tuple] = []
+        # Identificadores de las preguntas repartidas en la partida
+        self.dealt_ids: List[str] = []
+        self.lifelines_used: List[str] = []
+        self.started_at = 0.0
+        self._dealt_at = 0.0
+        self.stats = stats
+        # Porcentajes del público para la pregunta actual (None si no se pidieron)
+        self.audience: Optional[List[int]] = None
+    
+    @property
+    def current_level(self) -> int:
+        """Nivel de la pregunta actual (1-MAX_QUESTIONS)"""
+        return self.correct_answers + 1
+    
+    @property
+    def is_over(self) -> bool:
+        """Indica si la partida terminó"""
+        return self.state in FINAL_STATES
+    
+    @property
+    def won(self) -> bool:
+        """Indica si la partida terminó sin perder"""
+        return self.is_over and self.state != STATE_LOST
+    
+    def start(self, exclude_ids: Iterable[str] = (), seen=None) -> None:
+        """
+        Comienza una partida nueva y reparte la primera pregunta.
+        
+        Args:
+            exclude_ids: Preguntas que no se deben repartir (p. ej. las que
+                         el jugador ya vio en partidas anteriores)
+            seen: SeenSet persistente del jugador (ver juego.seen)
+        """
+        self.question_manager.shuffle_questions(exclude_ids, seen)
+        self.lifeline.reset()
+        self.correct_answers = 0
+        self.score = 0
+        self.history = []
+        self.dealt_ids = []
+        self.lifelines_used = []
+        self.started_at = time.time()
+        self._deal()
+    
+    def _deal(self) -> None:
+        """Reparte una pregunta para el nivel actual"""
+        question = self.question_manager.get_next_question(self.current_level)
+        if question is None:
+            self.current_question = None
+            self.current_options = []
+            self.state = STATE_OUT_OF_QUESTIONS
+            return
+        self.current_question = question
+        self.current_options = list(question["options"])
+        self.dealt_ids.append(question["id"])
+        self.audience = None
+        self.questions_dealt += 1
+        self.state = STATE_QUESTION
+        self._dealt_at = time.perf_counter()
+    
+    def answer(self, letter: str) -> bool:
+        """
+        Responde la pregunta actual.
+        
+        Args:
+            letter: Opción elegida (A, B, C, D)
+            
+        Returns:
+            True si la respuesta es correcta
+        """
+        if self.state != STATE_QUESTION:
+            return False
+        
+        correct = check_answer(letter, self.current_question["answer"])
+        if self.stats is not None and letter.upper() in LETTERS:
+            self.stats.record(question_key(self.current_question),
+                              LETTERS.index(letter.upper()))
+        self.history.append((self.current_level, self.current_question["id"],
+                             self.current_question["question"],
+                             letter.upper(), correct,
+                             time.perf_counter() - self._dealt_at))
+        if not correct:
+            self.state = STATE_LOST
+            return False
+        
+        self.correct_answers += 1
+        self.score = PRIZES[self.correct_answers - 1]
+        if self.correct_answers >= MAX_QUESTIONS:
+            self.state = STATE_WON
+        elif self.correct_answers in SAFE_HAVENS:
+            self.state = STATE_SAFE_HAVEN
+        else:
+            self._deal()
+        return True
+    
+    def continue_game(self) -> bool:
+        """
+        Sigue jugando desde una estación segura.
+        
+        Returns:
+            True si se repartió la siguiente pregunta
+        """
+        if self.state != STATE_SAFE_HAVEN:
+            return False
+        self._deal()
+        return self.state == STATE_QUESTION
+    
+    def walk_away(self) -> bool:
+        """
+        Se retira con el premio acumulado (solo en estaciones seguras).
+        
+        Returns:
+            True si el jugador se retiró
+        """
+        if self.state != STATE_SAFE_HAVEN:
+            return False
+        self.state = STATE_WALKED_AWAY
+        return True
+    
+    def use_fifty_fifty(self) -> bool:
+        """
+        Usa el comodín 50/50 sobre la pregunta actual.
+        
+        Returns:
+            True si se usó el comodín
+        """
+        if self.state != STATE_QUESTION or self.lifeline.fifty_fifty_used:
+            return False
+        self.current_options = self.lifeline.use_fifty_fifty(
+            self.current_options, self.current_question["answer"]
+        )
+        self.lifelines_used.append("fifty_fifty")
+        return True
+    
+    def use_ask_audience(self) -> bool:
+        """
+        Usa el comodín de preguntar al público sobre la pregunta actual.
+        
+        Returns:
+            True si se usó el comodín (los porcentajes quedan en audience)
+        """
+        if self.state != STATE_QUESTION or self.lifeline.ask_audience_used:
+            return False
+        question = self.current_question
+        counts = self.stats.get(question_key(question)) if self.stats is not None else None
+        self.audience = self.lifeline.use_ask_audience(
+            self.current_options, question["answer"], counts, question["difficulty"]
+        )
+        self.lifelines_used.append("ask_audience")
+        return True
+    
+    def prefetch(self) -> List[Mapping]:
+        """
+        Reserva las preguntas que puede necesitar el próximo reparto.
+        
+        Returns:
+            Candidatas: la del siguiente nivel y, si el comodín de saltar
+            sigue disponible, la que lo reemplazaría
+        """
+        if self.state != STATE_QUESTION:
+            return []
+        levels = []
+        if self.current_level < MAX_QUESTIONS:
+            levels.append(self.current_level + 1)
+        if not self.lifeline.skip_question_used:
+            levels.append(self.current_level)
+        return self.question_manager.prefetch(levels)
+    
+    def skip(self) -> bool:
+        """
+        Usa el comodín para cambiar la pregunta actual por otra del mismo nivel.
+        
+        Returns:
+            True si se usó el comodín
+        """
+        if self.state != STATE_QUESTION or not self.lifeline.use_skip_question():
+            return False
+        self.lifelines_used.append("skip")
+        self._deal()
+        return True
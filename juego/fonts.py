@@ -0,0 +1,69 @@
+"""
+Registro de fuentes del proceso
+
+pygame.font.SysFont busca la familia entre las fuentes del sistema y vuelve
+a cargar el archivo en cada llamada. El registro resuelve y carga cada
+combinación (familia, tamaño, negrita) una sola vez y después devuelve
+siempre el mismo objeto, así que todas las pantallas comparten fuentes (y
+las tablas de anchos que wrap_text guarda por fuente).
+
+pygame.quit() invalida las fuentes cargadas, por eso el registro se vacía
+al cerrar pygame.
+"""
+from typing import Callable, Dict, Optional, Tuple
+import pygame
+
+# (familia, tamaño, negrita) -> fuente cargada
+_fonts: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+# Constructor que recibe SysFont (None = pygame.font.Font)
+_constructor: Optional[Callable] = None
+
+
+def get_font(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Obtiene una fuente del sistema, cargándola solo la primera vez.
+    
+    Args:
+        family: Familia de la fuente (p. ej. "Arial")
+        size: Tamaño en puntos
+        bold: Si la fuente es negrita
+    
+    Returns:
+        Fuente compartida de pygame
+    """
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if not _fonts:
+            # pygame olvida las funciones registradas en cada quit()
+            pygame.register_quit(clear_fonts)
+        font = _fonts[key] = pygame.font.SysFont(family, size, bold=bold,
+                                                 constructor=_constructor)
+    return font
+
+
+def set_font_constructor(constructor: Optional[Callable]) -> None:
+    """
+    Cambia cómo se crean las fuentes (p. ej. para instrumentarlas) y vacía
+    el registro.
+    
+    Args:
+        constructor: Función (ruta, tamaño, negrita, cursiva) -> fuente, o
+                     None para volver a las fuentes normales de pygame
+    """
+    global _constructor
+    _constructor = constructor
+    _fonts.clear()
+
+
+def clear_fonts() -> None:
+    """Olvida las fuentes cargadas"""
+    _fonts.clear()
+
+
+def loaded_fonts() -> int:
+    """Número de fuentes cargadas en el registro"""
+    return len(_fonts)
@@ -2,39 +2,139 @@
 Juego principal - ¿Quién Quiere Ser Millonario?
 """
 import pygame
+import sqlite3
 import sys
+import time
+from typing import List, Mapping, Optional
 from juego.config import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, MAX_QUESTIONS,
-    PRIZES, SAFE_HAVENS, KEY_OPTION_A, KEY_OPTION_B,
+    KEY_OPTION_A, KEY_OPTION_B,
     KEY_OPTION_C, KEY_OPTION_D, KEY_CONFIRM,
-    KEY_FIFTY_FIFTY, KEY_SKIP_QUESTION
+    KEY_FIFTY_FIFTY, KEY_SKIP_QUESTION, KEY_ASK_AUDIENCE, RESULTS_DB,
+    ANSWER_STATS_FILE, SEEN_DB, PROFILER_ENABLED, PROFILER_OUTPUT
 )
-from juego.questions import QuestionManager, Lifeline
+from juego.questions import QuestionBank, QuestionManager, Lifeline
+from juego.engine import GameEngine, STATE_SAFE_HAVEN, check_answer
 from juego.ui import GameUI
+from juego.layout import open_display
+from juego.scheduler import FrameScheduler
+from juego.results import ResultsStore, ResultsWriter, build_session_record
+from juego.leaderboard import Leaderboard
+from juego.stats import AnswerStats, default_node, release_node
+from juego.seen import SeenStore
 
 
 class Game:
     """Clase principal del juego"""
     
-    def __init__(self):
-        """Inicializa el juego"""
+    def __init__(self, bank: Optional[QuestionBank] = None):
+        """
+        Inicializa el juego.
+        
+        Args:
+            bank: Banco de preguntas ya cargado (por defecto, data/questions.json)
+        """
         # Obtener nombre ANTES de inicializar pygame para evitar bloqueos
         self.player_name = self.get_player_name()
         
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Ventana o pantalla completa, a una resolución interna acotada
+        self.screen = open_display()
         pygame.display.set_caption("¿Quién Quiere Ser Millonario?")
         
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
+        if self.scheduler.idle_wait:
+            # El juego no usa el ratón: sus movimientos no deben despertar el bucle
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+        # Perfilador opcional (QQSM_PROFILE=1): si no se activa no se instala nada
+        self.profiler = None
+        if PROFILER_ENABLED:
+            from juego.profiler import Profiler
+            self.profiler = Profiler()
+            self.profiler.instrument_fonts()
         self.ui = GameUI(self.screen)
-        self.question_manager = QuestionManager()
+        self.question_manager = QuestionManager(bank=bank)
         self.lifeline = Lifeline()
+        self.stats = AnswerStats.load(ANSWER_STATS_FILE, default_node("juego"))
+        self.engine = GameEngine(self.question_manager, self.lifeline, self.stats)
+        # Las partidas se guardan desde un hilo de fondo
+        self.results = ResultsWriter()
+        self.leaderboard = self._load_leaderboard()
+        self.seen_store, self.seen = self._load_seen()
+        
+        # Teclas de config.py como códigos de pygame
+        self.option_keys = {
+            pygame.key.key_code(key): letter for key, letter in (
+                (KEY_OPTION_A, "A"), (KEY_OPTION_B, "B"),
+                (KEY_OPTION_C, "C"), (KEY_OPTION_D, "D"))
+        }
+        self.confirm_key = pygame.key.key_code(KEY_CONFIRM)
+        self.fifty_fifty_key = pygame.key.key_code(KEY_FIFTY_FIFTY)
+        self.skip_key = pygame.key.key_code(KEY_SKIP_QUESTION)
+        self.ask_audience_key = pygame.key.key_code(KEY_ASK_AUDIENCE)
         
         self.running = True
-        self.current_level = 0
-        self.score = 0
         self.selected_option = ""
-        self.current_question = None
+        # Candidatas a preparar para la pregunta repartida número _prefetch_for
+        self._prefetch_for = 0
+        self._prefetch_queue: List[Mapping] = []
+        if self.profiler is not None:
+            self.profiler.instrument(self)
+    
+    @property
+    def current_level(self) -> int:
+        """Nivel de la pregunta actual"""
+        return self.engine.current_level
+    
+    @property
+    def score(self) -> int:
+        """Premio acumulado"""
+        return self.engine.score
+    
+    @property
+    def current_question(self) -> Optional[Mapping]:
+        """Pregunta en juego"""
+        return self.engine.current_question
+    
+    @property
+    def current_options(self) -> List[str]:
+        """Opciones visibles de la pregunta en juego"""
+        return self.engine.current_options
+    
+    def _load_leaderboard(self) -> Leaderboard:
+        """Carga la clasificación guardada (vacía si no se puede leer)"""
+        try:
+            return Leaderboard.from_store(ResultsStore(RESULTS_DB))
+        except sqlite3.Error as e:
+            print(f"Error al cargar la clasificación: {e}")
+            return Leaderboard()
+    
+    def _load_seen(self) -> tuple:
+        """Abre el registro de preguntas vistas y carga las del jugador"""
+        try:
+            store = SeenStore(SEEN_DB)
+            return store, store.load(self.player_name, self.question_manager.bank)
+        except sqlite3.Error as e:
+            print(f"Error al cargar las preguntas vistas: {e}")
+            return None, None
+    
+    def _prefetch_idle(self) -> None:
+        """
+        Prepara las preguntas candidatas mientras el jugador piensa.
+        
+        Tarea cooperativa: cada candidata se prerenderiza solo si no hay
+        eventos esperando, así que nunca retrasa la respuesta a una tecla.
+        """
+        if self._prefetch_for != self.engine.questions_dealt:
+            self._prefetch_for = self.engine.questions_dealt
+            self._prefetch_queue = self.engine.prefetch()
+        while self._prefetch_queue and not pygame.event.peek():
+            question = self._prefetch_queue.pop(0)
+            self.ui.prerender_question(question["question"], question["options"])
+    
+    def _on_resize(self) -> None:
+        """Adapta la interfaz al nuevo tamaño de la ventana"""
+        self.screen = pygame.display.get_surface()
+        self.ui.resize(self.screen)
     
     def get_player_name(self) -> str:
         """Solicita el nombre del jugador"""
@@ -47,18 +147,20 @@ class Game:
             try:
                 self.ui.draw_start_screen(self.player_name)
                 
-                for event in pygame.event.get():
+                for event in self.scheduler.wait_events():
                     if event.type == pygame.QUIT:
                         self.running = False
                         return False
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        self.ui.invalidate()
+                    elif event.type == pygame.VIDEORESIZE:
+                        self._on_resize()
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
                             waiting = False
                         elif event.key == pygame.K_ESCAPE:
                             self.running = False
                             return False
-                
-                self.clock.tick(FPS)
             except Exception as e:
                 print(f"Error en pantalla de inicio: {e}")
                 import traceback
@@ -73,7 +175,8 @@ class Game:
         Maneja la pantalla de estación segura.
         
         Returns:
-            True si continúa, False si se retira
+            True si continúa, False si se retira o se cierra la ventana
+            (en ese caso self.running queda en False)
         """
         waiting = True
         continue_game = True
@@ -81,10 +184,14 @@ class Game:
         while waiting and self.running:
             self.ui.draw_safe_haven_screen(self.current_level, self.score)
             
-            for event in pygame.event.get():
+            for event in self.scheduler.wait_events():
                 if event.type == pygame.QUIT:
                     self.running = False
                     return False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.ui.invalidate()
+                elif event.type == pygame.VIDEORESIZE:
+                    self._on_resize()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         waiting = False
@@ -92,26 +199,28 @@ class Game:
                     elif event.key == pygame.K_ESCAPE:
                         waiting = False
                         continue_game = False
-            
-            self.clock.tick(FPS)
         
         return continue_game
     
-    def handle_end_screen(self, won: bool, correct_answers: int) -> None:
+    def handle_end_screen(self, won: bool, correct_answers: int,
+                          standings: Optional[dict] = None) -> None:
         """Maneja la pantalla de fin de juego"""
         waiting = True
         
         while waiting and self.running:
-            self.ui.draw_end_screen(won, self.score, correct_answers, self.player_name)
+            self.ui.draw_end_screen(won, self.score, correct_answers, self.player_name,
+                                    standings)
             
-            for event in pygame.event.get():
+            for event in self.scheduler.wait_events():
                 if event.type == pygame.QUIT:
                     waiting = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.ui.invalidate()
+                elif event.type == pygame.VIDEORESIZE:
+                    self._on_resize()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         waiting = False
-            
-            self.clock.tick(FPS)
     
     def check_answer(self, user_answer: str, correct_answer: int) -> bool:
         """
@@ -124,45 +233,56 @@ class Game:
         Returns:
             True si es correcta, False si no
         """
-        letters = ["A", "B", "C", "D"]
-        return user_answer.upper() == letters[correct_answer]
+        return check_answer(user_answer, correct_answer)
     
-    def process_game_events(self) -> str:
+    def process_game_events(self, events: Optional[list] = None) -> str:
         """
         Procesa los eventos del juego.
         
+        Args:
+            events: Eventos a procesar (por defecto, los pendientes en la cola)
+            
         Returns:
-            Acción realizada: "answer", "fifty_fifty", "skip", "quit", o ""
+            Acción realizada: "answer", "fifty_fifty", "skip", "ask_audience",
+            "quit", o ""
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 return "quit"
             
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.ui.invalidate()
+            
+            elif event.type == pygame.VIDEORESIZE:
+                self._on_resize()
+            
             elif event.type == pygame.KEYDOWN:
                 # Selección de opciones
-                if event.key == pygame.K_a:
-                    self.selected_option = "A"
-                elif event.key == pygame.K_b:
-                    self.selected_option = "B"
-                elif event.key == pygame.K_c:
-                    self.selected_option = "C"
-                elif event.key == pygame.K_d:
-                    self.selected_option = "D"
+                if event.key in self.option_keys:
+                    self.selected_option = self.option_keys[event.key]
                 
                 # Confirmar respuesta
-                elif event.key == pygame.K_RETURN:
+                elif event.key == self.confirm_key:
                     if self.selected_option:
                         return "answer"
                 
                 # Comodín 50/50
-                elif event.key == pygame.K_z:
+                elif event.key == self.fifty_fifty_key:
                     if not self.lifeline.fifty_fifty_used and self.current_question:
                         return "fifty_fifty"
                 
                 # Comodín saltar pregunta
-                elif event.key == pygame.K_x:
+                elif event.key == self.skip_key:
                     if not self.lifeline.skip_question_used:
                         return "skip"
+                
+                # Comodín preguntar al público
+                elif event.key == self.ask_audience_key:
+                    if not self.lifeline.ask_audience_used:
+                        return "ask_audience"
         
         return ""
     
@@ -173,119 +293,126 @@ class Game:
             self.quit()
             return
         
-        # Preparar preguntas
-        self.question_manager.shuffle_questions()
+        self.engine.start(seen=self.seen)
+        # Solo la pregunta repartida y las reservadas: prepararlas todas
+        # decodificaría el banco entero al arrancar
+        self.ui.prewrap_questions(
+            q["question"] for q in [self.current_question, *self.engine.prefetch()] if q)
+        shown_question = 0
+        # Momento de la acción que repartirá una pregunta nueva
+        transition_started = None
         
         # Bucle principal del juego
-        correct_answers = 0
-        
-        while self.running and correct_answers < MAX_QUESTIONS:
-            # Obtener siguiente pregunta
-            self.current_question = self.question_manager.get_next_question()
-            
-            if not self.current_question:
-                break
-            
-            self.current_level = correct_answers + 1
-            self.selected_option = ""
+        while self.running and not self.engine.is_over:
+            if self.engine.state == STATE_SAFE_HAVEN:
+                if self.handle_safe_haven():
+                    transition_started = time.perf_counter()
+                    self.engine.continue_game()
+                elif self.running:
+                    # El jugador se retira
+                    self.engine.walk_away()
+                # Si se cerró la ventana la partida queda abandonada, no retirada
+                continue
             
-            # Bucle de la pregunta actual
-            question_active = True
+            # Nueva pregunta repartida (siguiente nivel o comodín de saltar)
+            if self.engine.questions_dealt != shown_question:
+                shown_question = self.engine.questions_dealt
+                self.selected_option = ""
+                self.ui.on_question_changed(self.current_options,
+                                            self.current_question["question"])
             
-            while question_active and self.running:
-                try:
-                    # Dibujar pantalla
-                    self.ui.draw_game_screen(
-                        self.current_question["question"],
-                        self.current_question["options"],
-                        self.selected_option,
-                        self.current_level,
-                        self.score,
-                        self.player_name,
-                        self.lifeline.fifty_fifty_used,
-                        self.lifeline.skip_question_used
-                    )
-                    
-                    # Procesar eventos
-                    action = self.process_game_events()
-                except Exception as e:
-                    print(f"Error durante el juego: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    self.running = False
-                    break
-                
-                if action == "quit":
-                    self.running = False
-                    question_active = False
-                
-                elif action == "answer":
-                    # Verificar respuesta
-                    is_correct = self.check_answer(
-                        self.selected_option,
-                        self.current_question["answer"]
-                    )
-                    
-                    if is_correct:
-                        correct_answers += 1
-                        self.score = PRIZES[correct_answers - 1]
-                        
-                        # Verificar si es estación segura
-                        if correct_answers in SAFE_HAVENS:
-                            if not self.handle_safe_haven():
-                                # El jugador se retira
-                                self.handle_end_screen(True, correct_answers)
-                                self.quit()
-                                return
-                        
-                        # Verificar si ganó
-                        if correct_answers >= MAX_QUESTIONS:
-                            self.handle_end_screen(True, correct_answers)
-                            self.quit()
-                            return
-                        
-                        question_active = False
-                    else:
-                        # Respuesta incorrecta
-                        self.handle_end_screen(False, correct_answers)
-                        self.quit()
-                        return
+            try:
+                # Dibujar pantalla
+                self.ui.draw_game_screen(
+                    self.current_question["question"],
+                    self.current_options,
+                    self.selected_option,
+                    self.current_level,
+                    self.score,
+                    self.player_name,
+                    self.lifeline.fifty_fifty_used,
+                    self.lifeline.skip_question_used,
+                    self.lifeline.ask_audience_used,
+                    self.engine.audience
+                )
+                if transition_started is not None:
+                    self.scheduler.record_transition(time.perf_counter() - transition_started)
+                    transition_started = None
                 
-                elif action == "fifty_fifty":
-                    # Usar comodín 50/50
-                    if not self.lifeline.fifty_fifty_used:
-                        self.current_question["options"] = self.lifeline.use_fifty_fifty(
-                            self.current_question["options"],
-                            self.current_question["answer"]
-                        )
+                # Preparar las siguientes preguntas antes de dormir
+                self._prefetch_idle()
                 
-                elif action == "skip":
-                    if self.lifeline.use_skip_question():
-                        question_active = False
-                        # Obtener nueva pregunta
-                        self.current_question = self.question_manager.get_next_question()
-                        if not self.current_question:
-                            self.running = False
-                            break
-                
-                self.clock.tick(FPS)
+                # Esperar y procesar eventos
+                action = self.process_game_events(self.scheduler.wait_events())
+            except Exception as e:
+                print(f"Error durante el juego: {e}")
+                import traceback
+                traceback.print_exc()
+                self.running = False
+                break
+            
+            if action == "quit":
+                self.running = False
+            elif action == "answer":
+                transition_started = time.perf_counter()
+                self.engine.answer(self.selected_option)
+            elif action == "fifty_fifty":
+                self.engine.use_fifty_fifty()
+            elif action == "skip":
+                transition_started = time.perf_counter()
+                self.engine.skip()
+            elif action == "ask_audience":
+                self.engine.use_ask_audience()
         
-        # Fin del juego
+        # Fin del juego: encolar el resultado sin esperar al disco y
+        # actualizar la clasificación en memoria
+        record = build_session_record(self.player_name, self.engine)
+        self.results.submit(record)
+        self.leaderboard.record(record)
         if self.running:
-            self.handle_end_screen(True, correct_answers)
+            self.handle_end_screen(self.engine.won, self.engine.correct_answers,
+                                   self.leaderboard.standings(self.player_name))
         
         self.quit()
     
     def quit(self) -> None:
         """Cierra el juego"""
+        print(self.scheduler.report())
+        if self.ui.prepared_hits or self.ui.prepared_misses:
+            print(f"[prefetch] {self.ui.prepared_hits} preguntas ya preparadas, "
+                  f"{self.ui.prepared_misses} renderizadas al mostrarse")
+        if self.profiler is not None:
+            try:
+                self.profiler.dump(PROFILER_OUTPUT)
+                print(f"[perfil] guardado en {PROFILER_OUTPUT}")
+            except OSError as e:
+                print(f"Error al guardar el perfil: {e}")
+        self.results.close()
+        self.leaderboard.close()
+        try:
+            self.stats.save(ANSWER_STATS_FILE)
+        except OSError as e:
+            print(f"Error al guardar las estadísticas: {e}")
+        release_node(self.stats.node)
+        if self.seen_store is not None:
+            try:
+                self.seen_store.save(self.player_name, self.question_manager.bank, self.seen)
+                self.seen_store.close()
+            except sqlite3.Error as e:
+                print(f"Error al guardar las preguntas vistas: {e}")
         pygame.quit()
         sys.exit()
 
 
-def main():
-    """Función principal"""
+def main(bank: Optional[QuestionBank] = None):
+    """
+    Función principal.
+    
+    Args:
+        bank: Banco de preguntas ya cargado (por defecto, data/questions.json)
+    """
     try:
-        game = Game()
+        game = Game(bank)
         game.run()
     except KeyboardInterrupt:
         print("\n\nJuego interrumpido por el usuario.")
@@ -0,0 +1,239 @@
+"""
+Disposición de la pantalla según su resolución
+
+Las posiciones y tamaños de la interfaz están pensados para la resolución
+de referencia (WINDOW_WIDTH x WINDOW_HEIGHT, 1800x900). Layout los escala
+al tamaño real de la superficie: los tamaños (fuentes, botones, imagen del
+título) con una escala uniforme para no deformarse, y las posiciones
+verticales con la escala del alto, así que los paneles 16:9 aprovechan su
+alto extra. Lo horizontal se ancla a los bordes o al centro del ancho real.
+
+Cada disposición se calcula una sola vez por resolución (layout_for) y las
+imágenes escaladas se guardan por resolución (scaled_image); las fuentes
+de cada tamaño ya las comparte el registro de fuentes, así que volver a una
+resolución usada no recalcula ni carga nada.
+
+En paneles más altos que RENDER_MAX_HEIGHT (p. ej. 4K) el juego dibuja a
+una resolución interna menor y SDL la escala por hardware (pygame.SCALED):
+el costo de cada cuadro no crece con el panel.
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+from juego.config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, FULLSCREEN, WINDOW_RESIZABLE, RENDER_MAX_HEIGHT,
+    FONT_TITLE_SIZE, FONT_QUESTION_SIZE, FONT_OPTION_SIZE, FONT_SCORE_SIZE,
+    FONT_INFO_SIZE, LADDER_X, LADDER_Y, LADDER_WIDTH, LADDER_ROW_HEIGHT, PRIZES,
+    LAYOUT_CACHE_SIZE
+)
+
+MIN_FONT_SIZE = 8
+
+# (ancho, alto) -> disposición ya calculada
+_layouts: "OrderedDict[Tuple[int, int], Layout]" = OrderedDict()
+
+# Imágenes originales por ruta y escaladas por (ruta, tamaño)
+_images: Dict[str, pygame.Surface] = {}
+_scaled: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+class Layout:
+    """Posiciones y tamaños de la interfaz para una resolución"""
+    
+    def __init__(self, width: int, height: int):
+        """
+        Calcula la disposición.
+        
+        Args:
+            width: Ancho de la superficie en píxeles
+            height: Alto de la superficie en píxeles
+        """
+        self.width = width
+        self.height = height
+        self.scale_y = height / WINDOW_HEIGHT
+        # Escala de los tamaños: la que cabe en ambos ejes
+        self.scale = min(width / WINDOW_WIDTH, self.scale_y)
+        px, y = self.px, self.y
+        
+        # Fuentes
+        self.font_title_size = self.font_size(FONT_TITLE_SIZE)
+        self.font_question_size = self.font_size(FONT_QUESTION_SIZE)
+        self.font_option_size = self.font_size(FONT_OPTION_SIZE)
+        self.font_score_size = self.font_size(FONT_SCORE_SIZE)
+        self.font_info_size = self.font_size(FONT_INFO_SIZE)
+        
+        # Cabecera: título, nivel y premio a la izquierda, dinero a la derecha
+        self.title_image_size = px(300)
+        self.title_top = y(20)
+        self.level_pos = (px(50), y(50))
+        self.prize_pos = (px(50), y(90))
+        self.safe_haven_pos = (px(50), y(130))
+        self.score_topright = (width - px(50), y(50))
+        
+        # Pregunta
+        self.question_top = y(200)
+        self.question_width = width - px(100)
+        
+        # Opciones en una cuadrícula de 2x2 centrada
+        option_width, option_height, spacing = px(400), px(80), px(20)
+        start_x = (width - (2 * option_width + spacing)) // 2
+        self.option_rects = [
+            pygame.Rect(start_x + (i % 2) * (option_width + spacing),
+                        y(400) + (i // 2) * (option_height + spacing),
+                        option_width, option_height)
+            for i in range(4)
+        ]
+        self.audience_inset = px(6)
+        self.audience_bar_height = max(1, px(6))
+        self.audience_bar_bottom = px(12)
+        self.audience_text_right = px(10)
+        
+        # Escalera de premios
+        self.ladder_row_height = px(LADDER_ROW_HEIGHT)
+        self.ladder_rect = pygame.Rect(px(LADDER_X), y(LADDER_Y), px(LADDER_WIDTH),
+                                       self.ladder_row_height * len(PRIZES))
+        self.ladder_padding = px(12)
+        
+        # Pie: nombre al centro, comodines a la izquierda, teclas a la derecha
+        self.footer_height = px(60)
+        self.name_midbottom = (width // 2, height - px(10))
+        self.lifelines_pos = (px(50), height - px(50))
+        self.lifeline_offsets = (0, px(100), px(220))
+        self.instructions_bottomright = (width - px(50), height - px(10))
+        
+        # Regiones de la pantalla de juego que pueden cambiar. La de la
+        # pregunta llega hasta las opciones y su texto se recorta a ella
+        border = px(3)
+        option_regions = [rect.inflate(2 * border, 2 * border) for rect in self.option_rects]
+        question_bottom = option_regions[0].top
+        self.regions = {
+            "level": pygame.Rect(0, 0, px(700), y(180)),
+            "score": pygame.Rect(width - px(700), 0, px(700), y(120)),
+            "question": pygame.Rect(0, y(180), width, question_bottom - y(180)),
+            "footer": pygame.Rect(0, height - self.footer_height, width, self.footer_height),
+            "ladder": self.ladder_rect,
+        }
+        for i, rect in enumerate(option_regions):
+            self.regions[f"option_{i}"] = rect
+    
+    def px(self, value: float) -> int:
+        """Escala un tamaño de la resolución de referencia"""
+        return round(value * self.scale)
+    
+    def y(self, value: float) -> int:
+        """Escala una posición vertical de la resolución de referencia"""
+        return round(value * self.scale_y)
+    
+    def font_size(self, size: int) -> int:
+        """Escala un tamaño de fuente, sin bajar de un mínimo legible"""
+        return max(MIN_FONT_SIZE, self.px(size))
+
+
+def layout_for(size: Tuple[int, int]) -> Layout:
+    """
+    Disposición de una resolución, calculándola solo la primera vez.
+    
+    Args:
+        size: (ancho, alto) de la superficie
+    
+    Returns:
+        Disposición compartida para ese tamaño
+    """
+    size = tuple(size)
+    layout = _layouts.get(size)
+    if layout is not None:
+        _layouts.move_to_end(size)
+        return layout
+    layout = _layouts[size] = Layout(*size)
+    if len(_layouts) > LAYOUT_CACHE_SIZE:
+        _layouts.popitem(last=False)
+    return layout
+
+
+def scaled_image(path: str, size: Tuple[int, int]) -> pygame.Surface:
+    """
+    Imagen escalada a un tamaño, cargando y escalando cada una una sola vez.
+    
+    Args:
+        path: Ruta de la imagen
+        size: (ancho, alto) deseado
+    
+    Returns:
+        Superficie escalada (compartida: no modificarla)
+    
+    Raises:
+        pygame.error: Si la imagen no se puede cargar
+    """
+    key = (path, tuple(size))
+    surface = _scaled.get(key)
+    if surface is not None:
+        _scaled.move_to_end(key)
+        return surface
+    
+    image = _images.get(path)
+    if image is None:
+        image = _images[path] = pygame.image.load(path)
+    surface = pygame.transform.smoothscale(image, size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    _scaled[key] = surface
+    if len(_scaled) > LAYOUT_CACHE_SIZE:
+        _scaled.popitem(last=False)
+    return surface
+
+
+def clear_caches() -> None:
+    """Olvida las disposiciones y las imágenes escaladas"""
+    _layouts.clear()
+    _images.clear()
+    _scaled.clear()
+
+
+def render_size(panel: Tuple[int, int], max_height: Optional[int] = RENDER_MAX_HEIGHT
+                ) -> Tuple[int, int]:
+    """
+    Resolución interna a la que se dibuja en un panel.
+    
+    Args:
+        panel: (ancho, alto) del panel o la ventana
+        max_height: Alto máximo de la resolución interna (None = sin límite)
+    
+    Returns:
+        El tamaño del panel, o uno menor con su misma proporción
+    """
+    width, height = panel
+    if not max_height or height <= max_height:
+        return width, height
+    return round(width * max_height / height), max_height
+
+
+def open_display(fullscreen: bool = FULLSCREEN) -> pygame.Surface:
+    """
+    Abre la ventana o la pantalla completa del juego.
+    
+    Si el panel supera RENDER_MAX_HEIGHT se dibuja a una resolución interna
+    menor con pygame.SCALED y SDL escala cada cuadro por hardware.
+    
+    Args:
+        fullscreen: Ocupar todo el panel (kioscos) en lugar de abrir una ventana
+    
+    Returns:
+        Superficie de la pantalla, del tamaño de la resolución interna
+    """
+    if fullscreen:
+        desktops = pygame.display.get_desktop_sizes()
+        panel = desktops[0] if desktops else (WINDOW_WIDTH, WINDOW_HEIGHT)
+        flags = pygame.FULLSCREEN
+    else:
+        panel = (WINDOW_WIDTH, WINDOW_HEIGHT)
+        flags = pygame.RESIZABLE if WINDOW_RESIZABLE else 0
+    
+    size = render_size(panel)
+    if size == panel:
+        return pygame.display.set_mode(panel, flags)
+    try:
+        return pygame.display.set_mode(size, flags | pygame.SCALED)
+    except pygame.error as e:
+        print(f"Advertencia: No se pudo escalar por hardware ({e}); "
+              f"se dibuja a {panel[0]}x{panel[1]}")
+        return pygame.display.set_mode(panel, flags)
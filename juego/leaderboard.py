@@ -0,0 +1,303 @@
+"""
+Tabla de clasificación sobre el registro de resultados
+
+Cada jugador aparece una vez con su mejor premio; los empates en premio
+comparten puesto y, en la lista de los mejores, se ordenan por quién lo
+consiguió primero. Hay una clasificación histórica y una por día.
+
+Los premios forman una escalera corta (PRIZES), así que cada clasificación
+guarda cuántos jugadores tienen cada premio como mejor resultado: el puesto
+de un jugador es la suma de los conteos de los premios mayores al suyo, y
+los mejores K salen de recorrer los premios de mayor a menor. Ninguna
+consulta recorre los resultados guardados.
+
+La clasificación histórica se carga una vez de la tabla best_results del
+almacén (una fila por jugador, que ResultsStore mantiene al insertar cada
+partida); después cada partida terminada la actualiza con record() sin
+recalcular nada.
+"""
+import bisect
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Mapping, Optional
+from juego.config import LEADERBOARD_DAYS_CACHED
+from juego.results import ResultsStore
+
+DAY_RESULTS_QUERY = """
+SELECT player, prize, finished_at FROM sessions
+WHERE finished_at >= ? AND finished_at < ?
+ORDER BY finished_at
+"""
+
+
+def day_key(timestamp: float) -> str:
+    """Día local (AAAA-MM-DD) de una marca de tiempo"""
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def day_bounds(day: str) -> tuple:
+    """
+    Marcas de tiempo del inicio del día y del día siguiente.
+    
+    Args:
+        day: Día en formato AAAA-MM-DD
+    """
+    parsed = time.strptime(day, "%Y-%m-%d")
+    start = time.mktime(parsed[:3] + (0, 0, 0, 0, 0, -1))
+    end = time.mktime(parsed[:2] + (parsed[2] + 1, 0, 0, 0, 0, 0, -1))
+    return start, end
+
+
+class Ranking:
+    """Mejor resultado de cada jugador, agrupado por premio"""
+    
+    __slots__ = ("players", "counts", "buckets", "prizes")
+    
+    def __init__(self):
+        """Crea una clasificación vacía"""
+        # jugador -> [mejor premio, momento en que lo obtuvo, partidas, total ganado]
+        self.players = {}
+        # premio -> jugadores cuyo mejor resultado es ese premio
+        self.counts = {}
+        # premio -> [(momento, jugador)] en orden de llegada; las entradas
+        # superadas por un premio mayor se descartan al recorrerlas
+        self.buckets = {}
+        # premios distintos, de menor a mayor
+        self.prizes: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self.players)
+    
+    def _is_current(self, player: str, prize: int, achieved_at: float) -> bool:
+        entry = self.players[player]
+        return entry[0] == prize and entry[1] == achieved_at
+    
+    def _place(self, player: str, prize: int, achieved_at: float) -> None:
+        if prize not in self.counts:
+            bisect.insort(self.prizes, prize)
+            self.counts[prize] = 0
+            self.buckets[prize] = []
+        self.counts[prize] += 1
+        self.buckets[prize].append((achieved_at, player))
+    
+    def _remove(self, prize: int) -> None:
+        self.counts[prize] -= 1
+        bucket = self.buckets[prize]
+        if len(bucket) > 2 * self.counts[prize] + 64:
+            self.buckets[prize] = [
+                (at, player) for at, player in bucket
+                if self._is_current(player, prize, at)
+            ]
+    
+    def add(self, player: str, prize: int, finished_at: float) -> None:
+        """
+        Agrega el resultado de una partida.
+        
+        Args:
+            player: Nombre del jugador
+            prize: Premio obtenido
+            finished_at: Momento en que terminó la partida
+        """
+        entry = self.players.get(player)
+        if entry is None:
+            self.players[player] = [prize, finished_at, 1, prize]
+            self._place(player, prize, finished_at)
+            return
+        
+        entry[2] += 1
+        entry[3] += prize
+        if prize > entry[0]:
+            previous = entry[0]
+            entry[0] = prize
+            entry[1] = finished_at
+            self._remove(previous)
+            self._place(player, prize, finished_at)
+    
+    def load(self, rows: Iterable[tuple]) -> None:
+        """
+        Carga mejores resultados ya agregados en una clasificación vacía.
+        
+        Args:
+            rows: Tuplas (jugador, mejor premio, momento, partidas, total ganado)
+        """
+        for player, prize, achieved_at, games, total in sorted(rows, key=lambda r: r[2]):
+            self.players[player] = [prize, achieved_at, games, total]
+            self._place(player, prize, achieved_at)
+    
+    def rank(self, player: str) -> Optional[int]:
+        """Puesto de un jugador (None si no ha jugado)"""
+        entry = self.players.get(player)
+        if entry is None:
+            return None
+        above = bisect.bisect_right(self.prizes, entry[0])
+        return 1 + sum(self.counts[prize] for prize in self.prizes[above:])
+    
+    def top(self, k: int = 10) -> List[dict]:
+        """
+        Mejores jugadores.
+        
+        Args:
+            k: Número de jugadores
+        
+        Returns:
+            Lista de {"rank", "player", "prize", "achieved_at"}
+        """
+        result = []
+        above = 0
+        for prize in reversed(self.prizes):
+            if len(result) >= k:
+                break
+            if not self.counts[prize]:
+                continue
+            for achieved_at, player in self.buckets[prize]:
+                if self._is_current(player, prize, achieved_at):
+                    result.append({"rank": above + 1, "player": player,
+                                   "prize": prize, "achieved_at": achieved_at})
+                    if len(result) >= k:
+                        break
+            above += self.counts[prize]
+        return result
+    
+    def player(self, player: str) -> Optional[dict]:
+        """Resumen de un jugador (None si no ha jugado)"""
+        entry = self.players.get(player)
+        if entry is None:
+            return None
+        best, achieved_at, games, total = entry
+        return {"player": player, "rank": self.rank(player), "best_prize": best,
+                "achieved_at": achieved_at, "games": games, "total_prize": total}
+
+
+class Leaderboard:
+    """Clasificaciones histórica y diarias, actualizadas partida a partida"""
+    
+    def __init__(self, store: Optional[ResultsStore] = None):
+        """
+        Inicializa la tabla.
+        
+        Args:
+            store: Almacén del que cargar los días que aún no están en memoria
+        """
+        self.store = store
+        self.all_time = Ranking()
+        self.daily: "OrderedDict[str, Ranking]" = OrderedDict()
+    
+    @classmethod
+    def from_store(cls, store: ResultsStore) -> "Leaderboard":
+        """
+        Carga la clasificación histórica y la de hoy desde el almacén.
+        
+        Args:
+            store: Almacén de resultados
+        """
+        leaderboard = cls(store)
+        leaderboard.all_time.load(store.best_results())
+        leaderboard.day(day_key(time.time()))
+        return leaderboard
+    
+    def day(self, day: str) -> Ranking:
+        """
+        Clasificación de un día, cargándola del almacén si hace falta.
+        
+        Args:
+            day: Día en formato AAAA-MM-DD
+        """
+        ranking = self.daily.get(day)
+        if ranking is not None:
+            self.daily.move_to_end(day)
+            return ranking
+        return self._load_day(day)
+    
+    def _load_day(self, day: str, pending: Optional[tuple] = None) -> Ranking:
+        """
+        Carga la clasificación de un día del almacén y la guarda en memoria.
+        
+        Args:
+            day: Día en formato AAAA-MM-DD
+            pending: Partida (jugador, premio, momento) que se suma aunque
+                     aún no esté escrita en el almacén, sin contarla dos veces
+        """
+        ranking = Ranking()
+        if self.store is not None:
+            for row in self.store.connection.execute(DAY_RESULTS_QUERY, day_bounds(day)):
+                if row == pending:
+                    pending = None
+                ranking.add(*row)
+        if pending is not None:
+            ranking.add(*pending)
+        self.daily[day] = ranking
+        if len(self.daily) > LEADERBOARD_DAYS_CACHED:
+            self.daily.popitem(last=False)
+        return ranking
+    
+    def _ranking(self, day: Optional[str]) -> Ranking:
+        return self.all_time if day is None else self.day(day)
+    
+    def record(self, record: Mapping) -> None:
+        """
+        Actualiza las clasificaciones con una partida terminada.
+        
+        Args:
+            record: Registro creado con build_session_record
+        """
+        player, prize, finished_at = record["player"], record["prize"], record["finished_at"]
+        self.all_time.add(player, prize, finished_at)
+        
+        day = day_key(finished_at)
+        ranking = self.daily.get(day)
+        if ranking is None:
+            # Día aún no cargado: incluye las partidas que otros procesos ya
+            # guardaron; esta puede estar o no escrita todavía
+            self._load_day(day, (player, prize, finished_at))
+        else:
+            ranking.add(player, prize, finished_at)
+    
+    def top(self, k: int = 10, day: Optional[str] = None) -> List[dict]:
+        """
+        Mejores jugadores.
+        
+        Args:
+            k: Número de jugadores
+            day: Día (AAAA-MM-DD) o None para la clasificación histórica
+        """
+        return self._ranking(day).top(k)
+    
+    def rank(self, player: str, day: Optional[str] = None) -> Optional[int]:
+        """
+        Puesto de un jugador.
+        
+        Args:
+            player: Nombre del jugador
+            day: Día (AAAA-MM-DD) o None para la clasificación histórica
+        """
+        return self._ranking(day).rank(player)
+    
+    def player(self, player: str) -> Optional[dict]:
+        """Resumen histórico de un jugador con su puesto de hoy"""
+        summary = self.all_time.player(player)
+        if summary is not None:
+            summary["daily_rank"] = self.day(day_key(time.time())).rank(player)
+        return summary
+    
+    def close(self) -> None:
+        """Cierra el almacén del que se cargan los días, si hay uno"""
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+    
+    def standings(self, player: str, k: int = 3) -> dict:
+        """
+        Datos para mostrar al terminar una partida.
+        
+        Args:
+            player: Nombre del jugador
+            k: Número de mejores jugadores a incluir
+        """
+        today = self.day(day_key(time.time()))
+        return {
+            "rank": self.all_time.rank(player),
+            "players": len(self.all_time),
+            "daily_rank": today.rank(player),
+            "daily_players": len(today),
+            "top": self.all_time.top(k),
+        }
@@ -0,0 +1,358 @@
+"""
+Lectura en streaming y validación de bancos de preguntas
+
+Admite un arreglo JSON (como data/questions.json) o JSON Lines (una
+pregunta por línea). Los registros se leen de uno en uno, de modo que la
+memoria usada no depende del tamaño del archivo, y los registros inválidos
+se cuentan y reportan en lugar de descartar todo el archivo.
+
+Cada pregunta recibe un identificador estable ("id") calculado a partir de
+su contenido normalizado, y las preguntas repetidas se descartan comparando
+un hash del texto normalizado, sin comparar las preguntas de a pares.
+"""
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, TextIO
+
+CHUNK_SIZE = 64 * 1024
+MAX_RECORD_SIZE = 1024 * 1024  # Tamaño máximo de una pregunta en el archivo
+MAX_REPORTED_ERRORS = 20
+NUM_OPTIONS = 4
+
+
+class LoadReport:
+    """Resultado de la carga de un banco de preguntas"""
+    
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.valid = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.errors: List[str] = []
+    
+    def add_error(self, position: int, message: str) -> None:
+        """Registra un registro inválido"""
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"registro {position}: {message}")
+    
+    def add_duplicate(self, position: int, original: int) -> None:
+        """Registra una pregunta repetida"""
+        self.duplicates += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"registro {position}: repite la pregunta del registro {original}")
+    
+    def summary(self) -> str:
+        """Resumen legible de la carga"""
+        text = f"{self.valid} preguntas válidas, {self.invalid} inválidas"
+        if self.duplicates:
+            text += f", {self.duplicates} repetidas"
+        if self.path:
+            text = f"{self.path}: {text}"
+        return text
+
+
+def validate_question(record) -> Optional[str]:
+    """
+    Valida una pregunta.
+    
+    Args:
+        record: Registro leído del archivo
+        
+    Returns:
+        Mensaje de error o None si la pregunta es válida
+    """
+    if not isinstance(record, dict):
+        return "no es un objeto"
+    if not isinstance(record.get("question"), str) or not record["question"].strip():
+        return "falta el texto de la pregunta"
+    
+    options = record.get("options")
+    if not isinstance(options, list) or len(options) != NUM_OPTIONS:
+        return f"debe tener exactamente {NUM_OPTIONS} opciones"
+    if not all(isinstance(option, str) and option for option in options):
+        return "las opciones deben ser textos no vacíos"
+    
+    answer = record.get("answer")
+    if not isinstance(answer, int) or isinstance(answer, bool) \
+            or not 0 <= answer < NUM_OPTIONS:
+        return f"'answer' debe ser un índice entre 0 y {NUM_OPTIONS - 1}"
+    
+    if "difficulty" not in record:
+        return "falta 'difficulty'"
+    difficulty = record["difficulty"]
+    if not isinstance(difficulty, int) or isinstance(difficulty, bool) \
+            or not 1 <= difficulty <= 255:
+        return "'difficulty' debe ser un entero entre 1 y 255"
+    return None
+
+
+_PUNCTUATION_CHARS = "¿?¡!.,;:\"'«»“”()-"
+_PUNCTUATION = str.maketrans("", "", _PUNCTUATION_CHARS)
+# Los de la tabla ASCII, para borrarlos con bytes.translate (mucho más rápido)
+_ASCII_PUNCTUATION = "".join(c for c in _PUNCTUATION_CHARS if c.isascii()).encode("ascii")
+# Expresiones sobre las marcas combinantes (tildes tras NFKD): se compilan
+# la primera vez que aparece un texto no ASCII (recorrer Unicode cuesta ~0,1 s)
+_strip_pattern: Optional[re.Pattern] = None
+_non_ascii_kept: Optional[re.Pattern] = None
+_astral_marks = frozenset()
+_ASTRAL = re.compile("[\U00010000-\U0010ffff]")
+
+
+def _compile_marks() -> None:
+    """Compila las expresiones que borran marcas combinantes y signos"""
+    global _strip_pattern, _non_ascii_kept, _astral_marks
+    marks = [chr(c) for c in range(sys.maxunicode + 1) if unicodedata.combining(chr(c))]
+    # Las marcas de los planos superiores son raras y se filtran aparte:
+    # en la clase de la expresión la harían mucho más lenta
+    _astral_marks = frozenset(c for c in marks if c > "\uffff")
+    removed = "".join(re.escape(c) for c in marks if c <= "\uffff")
+    removed += re.escape(_PUNCTUATION_CHARS)
+    _strip_pattern = re.compile(f"[{removed}]+")
+    # Un carácter no ASCII que la normalización conserva (o de otro plano)
+    _non_ascii_kept = re.compile(f"[^\\x00-\\x7f{removed}]")
+
+
+def normalize_text(text: str) -> str:
+    """Texto en minúsculas, sin tildes, signos de puntuación ni espacios repetidos"""
+    if text.isascii():
+        # Sin tildes ni compatibilidades: NFKD no cambiaría nada
+        stripped = text.lower().encode("ascii").translate(None, _ASCII_PUNCTUATION)
+        return " ".join(stripped.decode("ascii").split())
+    if _strip_pattern is None:
+        _compile_marks()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    if not _non_ascii_kept.search(decomposed):
+        # Caso común (p. ej. español): lo único no ASCII son tildes y signos
+        stripped = decomposed.encode("ascii", "ignore").translate(None, _ASCII_PUNCTUATION)
+        return " ".join(stripped.decode("ascii").split())
+    stripped = _strip_pattern.sub("", decomposed)
+    if _ASTRAL.search(stripped):
+        stripped = "".join(c for c in stripped if c not in _astral_marks)
+    return " ".join(stripped.split())
+
+
+def normalize_question(question: Mapping) -> List[str]:
+    """
+    Textos normalizados de una pregunta y de sus opciones, en orden.
+    
+    Se normalizan todos juntos en una sola llamada a normalize_text: el
+    separador NUL no lo altera ninguna etapa de la normalización.
+    
+    Args:
+        question: Pregunta con "question" y "options"
+    """
+    texts = [question["question"], *question["options"]]
+    joined = "\0".join(texts)
+    if joined.count("\0") != len(texts) - 1:
+        return [normalize_text(text) for text in texts]
+    return [part.strip() for part in normalize_text(joined).split("\0")]
+
+
+def question_id(question: Mapping, normalized: Optional[List[str]] = None) -> str:
+    """
+    Identificador estable de una pregunta según su contenido.
+    
+    Depende del texto normalizado de la pregunta y de sus opciones en orden,
+    así que no cambia con ediciones de mayúsculas, tildes o espacios.
+    
+    Args:
+        question: Pregunta con "question" y "options"
+        normalized: normalize_question() de la pregunta, si ya se calculó
+        
+    Returns:
+        16 dígitos hexadecimales
+    """
+    if normalized is None:
+        normalized = normalize_question(question)
+    content = "\x1f".join(normalized)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def duplicate_key(question: Mapping, normalized: Optional[str] = None) -> bytes:
+    """
+    Hash del texto normalizado de la pregunta (igual para preguntas repetidas).
+    
+    Args:
+        question: Pregunta con "question"
+        normalized: normalize_text() de la pregunta, si ya se calculó
+    """
+    if normalized is None:
+        normalized = normalize_text(question["question"])
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+class DuplicateDetector:
+    """Detecta preguntas repetidas guardando solo un hash por pregunta"""
+    
+    __slots__ = ("_first",)
+    
+    def __init__(self):
+        # hash del texto normalizado -> posición de la primera aparición
+        self._first: Dict[bytes, int] = {}
+    
+    def check(self, question: Mapping, position: int,
+              normalized: Optional[str] = None) -> Optional[int]:
+        """
+        Registra una pregunta.
+        
+        Args:
+            question: Pregunta a registrar
+            position: Posición de la pregunta en su archivo o lista
+            normalized: normalize_text() de la pregunta, si ya se calculó
+            
+        Returns:
+            Posición de la primera aparición si es repetida, o None
+        """
+        first = self._first.setdefault(duplicate_key(question, normalized), position)
+        return None if first == position else first
+
+
+def find_duplicates(questions: Iterable[Mapping]) -> List[List[int]]:
+    """
+    Agrupa las preguntas repetidas de una lista.
+    
+    Args:
+        questions: Preguntas a revisar
+        
+    Returns:
+        Grupos de índices (el primero es la aparición original)
+    """
+    groups: Dict[bytes, List[int]] = {}
+    for i, question in enumerate(questions):
+        groups.setdefault(duplicate_key(question), []).append(i)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def _iter_json_lines(f: TextIO) -> Iterator[tuple]:
+    """Genera (posición, registro o excepción) por cada línea no vacía"""
+    for number, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, e
+
+
+def _iter_json_array(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple]:
+    """
+    Genera (posición, registro) por cada elemento de un arreglo JSON sin
+    cargar el arreglo completo. Un error de sintaxis termina la lectura.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size)
+    pos = 0
+    eof = not buffer
+    number = 0
+    
+    def skip(chars: str) -> int:
+        nonlocal buffer, pos, eof
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] in chars):
+                pos += 1
+            if pos < len(buffer) or eof:
+                return pos
+            buffer = buffer[pos:] + f.read(chunk_size)
+            pos = 0
+            eof = len(buffer) == 0
+    
+    skip("")
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise json.JSONDecodeError("Se esperaba un arreglo JSON", buffer, pos)
+    pos += 1
+    
+    while True:
+        skip(",")
+        if pos >= len(buffer):
+            raise json.JSONDecodeError("El arreglo JSON no está cerrado", buffer, pos)
+        if buffer[pos] == "]":
+            return
+        
+        while True:
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError:
+                # Puede ser un registro cortado por el bloque leído
+                if eof or len(buffer) - pos > MAX_RECORD_SIZE:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+        
+        number += 1
+        yield number, record
+        pos = end
+        if pos > chunk_size:
+            buffer = buffer[pos:]
+            pos = 0
+
+
+def iter_records(f: TextIO, json_lines: Optional[bool] = None) -> Iterator[tuple]:
+    """
+    Genera (posición, registro) desde un archivo abierto.
+    
+    Args:
+        f: Archivo de texto abierto
+        json_lines: Forzar JSON Lines (True) o arreglo JSON (False);
+                    por defecto se detecta por el primer carácter
+    """
+    if json_lines is None:
+        first = ""
+        while True:
+            first = f.read(1)
+            if not first or not first.isspace():
+                break
+        f.seek(0)
+        json_lines = first != "["
+    return _iter_json_lines(f) if json_lines else _iter_json_array(f)
+
+
+def iter_questions(path: str, report: Optional[LoadReport] = None,
+                   deduplicate: bool = True) -> Iterator[Dict]:
+    """
+    Lee y valida las preguntas de un archivo, una a una.
+    
+    Args:
+        path: Ruta del archivo (.json con un arreglo o .jsonl)
+        report: Reporte donde acumular los conteos y errores
+        deduplicate: Omitir las preguntas cuyo texto normalizado ya apareció
+        
+    Yields:
+        Preguntas válidas, con su identificador en "id"
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        json.JSONDecodeError: Si el arreglo JSON está mal formado (las
+                              preguntas anteriores al error ya se entregaron)
+    """
+    if report is None:
+        report = LoadReport(path)
+    json_lines = True if path.endswith((".jsonl", ".ndjson")) else None
+    detector = DuplicateDetector() if deduplicate else None
+    
+    with open(path, "r", encoding="utf-8") as f:
+        for position, record in iter_records(f, json_lines):
+            if isinstance(record, json.JSONDecodeError):
+                report.add_error(position, f"JSON inválido ({record.msg})")
+                continue
+            error = validate_question(record)
+            if error:
+                report.add_error(position, error)
+                continue
+            # Los textos se normalizan una sola vez para ambos hashes
+            normalized = normalize_question(record)
+            if detector is not None:
+                original = detector.check(record, position, normalized[0])
+                if original is not None:
+                    report.add_duplicate(position, original)
+                    continue
+            report.valid += 1
+            record["id"] = question_id(record, normalized)
+            yield record
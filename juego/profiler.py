@@ -0,0 +1,338 @@
+"""
+Perfilador de cuadros del juego
+
+Mide cuánto tiempo se va en cada sección del bucle: los métodos draw_* de
+GameUI, wrap_text, font.render, pygame.display.update y
+Game.process_game_events. También mide el trabajo de cada cuadro, que es
+el tiempo entre que el bucle despierta y vuelve a dormir.
+
+Es opcional y se instala reemplazando esas funciones por envolturas. Si
+no se activa (QQSM_PROFILE=1, ver config), no se reemplaza nada y el juego
+corre exactamente el mismo código.
+
+Cada sección acumula un histograma logarítmico (cuatro cubetas por
+potencia de dos), así que registrar una duración cuesta O(1) y la memoria
+no crece con el tiempo de juego. Con F3 se muestra una superposición con
+los FPS, el p95 del cuadro y las secciones más costosas. Al salir se
+guardan un JSON con los histogramas y un archivo .folded de pilas
+colapsadas, compatible con flamegraph.pl y speedscope.
+"""
+import functools
+import json
+import os
+import time
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional
+import pygame
+from juego.config import PROFILER_OUTPUT, PROFILER_TOP_SECTIONS, KEY_PROFILER_OVERLAY
+from juego import fonts, ui, utils
+
+# Cubetas: 4 por potencia de dos de nanosegundos, hasta ~2^63 ns
+N_BUCKETS = 256
+FRAME_SECTION = "cuadro"
+OVERLAY_BACKGROUND = (0, 0, 0)
+OVERLAY_TEXT = (0, 255, 0)
+
+
+def bucket_of(ns: int) -> int:
+    """Cubeta de una duración en nanosegundos"""
+    if ns < 4:
+        return max(ns, 0)
+    bits = ns.bit_length()
+    return 4 * (bits - 2) + ((ns >> (bits - 3)) & 3)
+
+
+def bucket_upper(index: int) -> int:
+    """Límite superior (exclusivo) de una cubeta, en nanosegundos"""
+    if index < 4:
+        return index + 1
+    bits = index // 4 + 2
+    return (5 + index % 4) << (bits - 3)
+
+
+class Histogram:
+    """Histograma logarítmico de duraciones"""
+    
+    __slots__ = ("counts", "count", "total", "max")
+    
+    def __init__(self):
+        """Crea un histograma vacío"""
+        self.counts = array("Q", bytes(8 * N_BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+    
+    def add(self, ns: int) -> None:
+        """Registra una duración en nanosegundos"""
+        self.counts[bucket_of(ns)] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+    
+    def percentile(self, fraction: float) -> int:
+        """
+        Percentil aproximado (límite superior de su cubeta).
+        
+        Args:
+            fraction: Fracción entre 0 y 1 (p. ej. 0.95)
+        
+        Returns:
+            Duración en nanosegundos (0 si no hay datos)
+        """
+        if not self.count:
+            return 0
+        target = max(1, round(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_upper(index), self.max)
+        return self.max
+    
+    def summary(self) -> dict:
+        """Resumen en milisegundos, con las cubetas no vacías"""
+        return {
+            "count": self.count,
+            "total_ms": self.total / 1e6,
+            "mean_ms": self.total / self.count / 1e6 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) / 1e6,
+            "p95_ms": self.percentile(0.95) / 1e6,
+            "p99_ms": self.percentile(0.99) / 1e6,
+            "max_ms": self.max / 1e6,
+            "buckets_us": {f"{bucket_upper(i) / 1e3:g}": count
+                           for i, count in enumerate(self.counts) if count},
+        }
+
+
+class Profiler:
+    """Histogramas por sección, pilas colapsadas y superposición en pantalla"""
+    
+    def __init__(self):
+        """Crea un perfilador sin instrumentar nada todavía"""
+        self.sections: Dict[str, Histogram] = {}
+        # "a;b;c" -> nanosegundos propios (sin contar las secciones anidadas)
+        self.stacks: Dict[str, int] = {}
+        # Secciones abiertas: [nombre, nanosegundos de las anidadas]
+        self._open: List[list] = []
+        self._patches: List[tuple] = []
+        self._frame_start: Optional[int] = None
+        self._frame_ends = deque(maxlen=120)
+        self.overlay_visible = False
+        self.overlay_font: Optional[pygame.font.Font] = None
+        self._overlay_rect: Optional[pygame.Rect] = None
+    
+    # --- Medición ---
+    
+    def _record(self, name: str, elapsed: int) -> None:
+        histogram = self.sections.get(name)
+        if histogram is None:
+            histogram = self.sections[name] = Histogram()
+        histogram.add(elapsed)
+    
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """
+        Envuelve una función para medir cada llamada como sección.
+        
+        Args:
+            name: Nombre de la sección
+            function: Función a medir
+        
+        Returns:
+            Función con la misma firma que registra su duración
+        """
+        open_sections = self._open
+        stacks = self.stacks
+        clock = time.perf_counter_ns
+        
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+            entry = [name, 0]
+            open_sections.append(entry)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                open_sections.pop()
+                self._record(name, elapsed)
+                path = ";".join(section[0] for section in open_sections)
+                path = f"{path};{name}" if path else name
+                stacks[path] = stacks.get(path, 0) + elapsed - entry[1]
+                if open_sections:
+                    open_sections[-1][1] += elapsed
+        
+        return profiled
+    
+    def end_frame(self) -> None:
+        """Cierra el cuadro en curso (el bucle está por dormir)"""
+        now = time.perf_counter_ns()
+        if self._frame_start is not None:
+            self._record(FRAME_SECTION, now - self._frame_start)
+            self._frame_ends.append(now)
+        self._frame_start = None
+    
+    def start_frame(self) -> None:
+        """Abre un cuadro (el bucle acaba de despertar)"""
+        self._frame_start = time.perf_counter_ns()
+    
+    # --- Instalación ---
+    
+    def _patch(self, target, attribute: str, name: str) -> None:
+        original = getattr(target, attribute)
+        # Los métodos de una instancia viven en su clase: al deshacer se borran
+        had_own = attribute in vars(target)
+        self._patches.append((target, attribute, original, had_own))
+        setattr(target, attribute, self.wrap(name, original))
+    
+    def instrument_fonts(self) -> None:
+        """Hace que las fuentes del registro midan font.render (antes de crear la UI)"""
+        wrap = self.wrap
+        
+        class ProfiledFont(pygame.font.Font):
+            render = wrap("font.render", pygame.font.Font.render)
+        
+        def constructor(path, size, bold, italic):
+            font = ProfiledFont(path, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            return font
+        
+        fonts.set_font_constructor(constructor)
+        self._patches.append((fonts, "set_font_constructor", None, False))
+    
+    def instrument_functions(self) -> None:
+        """Mide wrap_text y pygame.display.update"""
+        self._patch(utils, "wrap_text", "wrap_text")
+        ui.wrap_text = utils.wrap_text
+        self._patches.append((ui, "wrap_text", self._patches[-1][2], True))
+        self._patch(pygame.display, "update", "display.update")
+    
+    def instrument_ui(self, game_ui) -> None:
+        """Mide los métodos draw_* de una instancia de GameUI"""
+        for attribute in dir(type(game_ui)):
+            if attribute.startswith("draw_"):
+                self._patch(game_ui, attribute, attribute)
+    
+    def instrument(self, game) -> None:
+        """
+        Instrumenta un juego ya creado (las fuentes deben estar instrumentadas
+        desde antes de crear su UI).
+        
+        Args:
+            game: Instancia de Game
+        """
+        self.instrument_functions()
+        self.instrument_ui(game.ui)
+        self._patch(game, "process_game_events", "process_game_events")
+        # Fuente propia, fuera del registro: la superposición no se mide
+        self.overlay_font = pygame.font.SysFont("Arial", 18, bold=True)
+        
+        # El cuadro va desde que el bucle despierta hasta que vuelve a esperar
+        wait_events = game.scheduler.wait_events
+        overlay_key = pygame.key.key_code(KEY_PROFILER_OVERLAY)
+        
+        @functools.wraps(wait_events)
+        def profiled_wait():
+            self.end_frame()
+            if self.overlay_visible:
+                self.draw_overlay(game.screen)
+            events = wait_events()
+            self.start_frame()
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key == overlay_key:
+                    self.toggle_overlay(game.ui)
+            return events
+        
+        self._patches.append((game.scheduler, "wait_events", wait_events, False))
+        game.scheduler.wait_events = profiled_wait
+    
+    def uninstall(self) -> None:
+        """Deshace toda la instrumentación"""
+        for target, attribute, original, had_own in reversed(self._patches):
+            if target is fonts and attribute == "set_font_constructor":
+                fonts.set_font_constructor(None)
+            elif had_own:
+                setattr(target, attribute, original)
+            else:
+                delattr(target, attribute)
+        self._patches = []
+    
+    # --- Superposición ---
+    
+    def fps(self) -> float:
+        """Cuadros por segundo en los últimos cuadros"""
+        ends = self._frame_ends
+        if len(ends) < 2 or ends[-1] == ends[0]:
+            return 0.0
+        return (len(ends) - 1) * 1e9 / (ends[-1] - ends[0])
+    
+    def top_sections(self, k: int = PROFILER_TOP_SECTIONS) -> List[tuple]:
+        """Secciones con más tiempo acumulado: (nombre, histograma)"""
+        sections = [(name, h) for name, h in self.sections.items() if name != FRAME_SECTION]
+        sections.sort(key=lambda item: item[1].total, reverse=True)
+        return sections[:k]
+    
+    def overlay_lines(self) -> List[str]:
+        """Líneas de texto de la superposición"""
+        frame = self.sections.get(FRAME_SECTION) or Histogram()
+        lines = [f"FPS {self.fps():5.1f} | cuadro p95 {frame.percentile(0.95) / 1e6:6.2f} ms"]
+        for name, histogram in self.top_sections():
+            lines.append(f"{name:<22} {histogram.total / 1e6:8.1f} ms "
+                         f"(p95 {histogram.percentile(0.95) / 1e6:.2f} ms)")
+        return lines
+    
+    def toggle_overlay(self, game_ui=None) -> None:
+        """Muestra u oculta la superposición"""
+        self.overlay_visible = not self.overlay_visible
+        if not self.overlay_visible and game_ui is not None:
+            game_ui.invalidate()  # Borra la superposición en el próximo cuadro
+    
+    def draw_overlay(self, screen: pygame.Surface) -> None:
+        """Dibuja la superposición en la esquina superior izquierda"""
+        font = self.overlay_font
+        if font is None:
+            font = self.overlay_font = pygame.font.SysFont("Arial", 18, bold=True)
+        surfaces = [font.render(line, True, OVERLAY_TEXT) for line in self.overlay_lines()]
+        width = max(surface.get_width() for surface in surfaces) + 16
+        height = sum(surface.get_height() for surface in surfaces) + 12
+        rect = pygame.Rect(0, 0, width, height)
+        if self._overlay_rect is not None:
+            rect = rect.union(self._overlay_rect)
+        screen.fill(OVERLAY_BACKGROUND, rect)
+        y = 6
+        for surface in surfaces:
+            screen.blit(surface, (8, y))
+            y += surface.get_height()
+        self._overlay_rect = rect
+        # Sin pasar por la envoltura: la superposición no cuenta como cuadro
+        update = next((original for target, attribute, original, _ in self._patches
+                       if target is pygame.display and attribute == "update"),
+                      pygame.display.update)
+        update(rect)
+    
+    # --- Volcado ---
+    
+    def report(self) -> dict:
+        """Resumen serializable de todas las secciones"""
+        return {
+            "fps": self.fps(),
+            "sections": {name: histogram.summary()
+                         for name, histogram in sorted(self.sections.items())},
+        }
+    
+    def dump(self, path: str = PROFILER_OUTPUT) -> None:
+        """
+        Guarda el perfil en JSON y las pilas colapsadas en un .folded.
+        
+        Args:
+            path: Ruta del JSON; las pilas van al mismo nombre con extensión .folded
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        # Formato de pilas colapsadas: "a;b;c <microsegundos propios>"
+        with open(os.path.splitext(path)[0] + ".folded", "w", encoding="utf-8") as f:
+            for stack, ns in sorted(self.stacks.items()):
+                if ns // 1000:
+                    f.write(f"{stack.replace(' ', '_')} {ns // 1000}\n")
@@ -1,75 +1,492 @@
 """
 Manejo de preguntas del juego
 """
+import hashlib
 import json
 import os
-from random import shuffle, sample
-from typing import List, Dict, Optional
-from juego.config import DATA_DIR
+import random
+from collections import deque
+from array import array
+from types import MappingProxyType
+from typing import List, Dict, Iterable, Mapping, Optional, Sequence
+from juego.config import AUDIENCE_PRIOR_ANSWERS, DATA_DIR, MAX_QUESTIONS
+from juego.loader import LoadReport, iter_questions, question_id
+from juego.bankfile import (
+    COMPILED_SUFFIX, CompiledRecords, compiled_path_for, is_fresh, open_compiled_bank
+)
+
+
+def _freeze_question(question: Dict) -> Mapping:
+    """Convierte una pregunta en un registro de solo lectura"""
+    frozen = dict(question)
+    frozen["options"] = tuple(question["options"])
+    if "id" not in frozen:
+        frozen["id"] = question_id(question)
+    return MappingProxyType(frozen)
+
+
+class QuestionBank:
+    """Banco de preguntas inmutable, compartible entre varias sesiones"""
+    
+    def __init__(self, records: Sequence[Mapping],
+                 difficulties: Optional[Sequence[int]] = None):
+        """
+        Inicializa el banco.
+        
+        Args:
+            records: Preguntas de solo lectura
+            difficulties: Dificultad de cada pregunta (si se conoce sin
+                          tener que leer los registros)
+        """
+        self.records = records
+        if difficulties is None:
+            difficulties = [record.get("difficulty", 1) for record in records]
+        self.difficulty_of = difficulties
+        # Posición de cada pregunta dentro del grupo de su dificultad
+        self.bucket_positions = array("I")
+        self.by_difficulty = self._build_difficulty_index(difficulties)
+        self.difficulties = sorted(self.by_difficulty)
+        self._index: Optional[Dict[int, int]] = None
+        self._fingerprint: Optional[str] = None
+    
+    def _build_difficulty_index(self, difficulties: Sequence[int]) -> Dict[int, array]:
+        """Agrupa los índices de las preguntas por dificultad"""
+        index: Dict[int, array] = {}
+        for i, difficulty in enumerate(difficulties):
+            bucket = index.get(difficulty)
+            if bucket is None:
+                bucket = index[difficulty] = array("I")
+            self.bucket_positions.append(len(bucket))
+            bucket.append(i)
+        return index
+    
+    @property
+    def index(self) -> Dict[int, int]:
+        """Identificador (como entero) -> posición; se construye al primer uso"""
+        if self._index is None:
+            ids = getattr(self.records, "ids", None)
+            if ids is not None:
+                self._index = {value: i for i, value in enumerate(ids())}
+            else:
+                self._index = {int(record["id"], 16): i
+                               for i, record in enumerate(self.records)}
+        return self._index
+    
+    @property
+    def fingerprint(self) -> str:
+        """Huella del banco: cambia si cambian sus preguntas o su orden"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for value in self.index:  # En el orden de las preguntas
+                digest.update(value.to_bytes(8, "little"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def position_of(self, question_id: str) -> Optional[int]:
+        """Posición de una pregunta por su identificador (None si no existe)"""
+        try:
+            return self.index.get(int(question_id, 16))
+        except (TypeError, ValueError):
+            return None
+    
+    def get(self, question_id: str) -> Optional[Mapping]:
+        """Pregunta con ese identificador, o None"""
+        position = self.position_of(question_id)
+        return None if position is None else self.records[position]
+    
+    @classmethod
+    def from_file(cls, path: str) -> "QuestionBank":
+        """
+        Carga un banco desde un archivo JSON o compilado.
+        
+        Si junto al JSON existe su versión compilada (.qbank) y está al día,
+        se usa esa versión mapeada en memoria.
+        
+        Args:
+            path: Ruta del archivo JSON (o .qbank) con las preguntas
+            
+        Returns:
+            Banco de preguntas (vacío si el archivo no se pudo leer)
+        """
+        compiled_path = path if path.endswith(COMPILED_SUFFIX) else compiled_path_for(path)
+        if compiled_path == path or is_fresh(compiled_path, path):
+            try:
+                return cls.from_compiled(compiled_path)
+            except (OSError, ValueError) as e:
+                print(f"Advertencia: No se pudo abrir el banco compilado {compiled_path}: {e}")
+        
+        report = LoadReport(path)
+        records, difficulties = [], array("B")
+        try:
+            for question in iter_questions(path, report):
+                records.append(_freeze_question(question))
+                difficulties.append(question["difficulty"])
+        except FileNotFoundError:
+            print(f"Error: No se encontró el archivo {path}")
+        except json.JSONDecodeError:
+            print(f"Error: El archivo {path} no es un JSON válido "
+                  f"(se conservan {len(records)} preguntas leídas)")
+        
+        if report.invalid or report.duplicates:
+            print(f"Advertencia: {report.summary()}")
+            for error in report.errors:
+                print(f"  - {error}")
+        return cls(tuple(records), difficulties)
+    
+    @classmethod
+    def from_compiled(cls, path: str) -> "QuestionBank":
+        """
+        Abre un banco compilado; las preguntas se decodifican al accederlas.
+        
+        Args:
+            path: Ruta del archivo .qbank
+            
+        Returns:
+            Banco de preguntas
+        """
+        records = open_compiled_bank(path)
+        return cls(records, records.difficulties())
+    
+    @classmethod
+    def from_embedded(cls) -> "QuestionBank":
+        """
+        Abre el banco compilado embebido en juego.bank_embedded, sin leer
+        archivos de datos.
+        
+        Returns:
+            Banco de preguntas
+            
+        Raises:
+            ImportError: Si el módulo no se generó (python -m juego.bankfile embed)
+        """
+        from juego.bank_embedded import BANK
+        records = CompiledRecords(BANK)
+        return cls(records, records.difficulties())
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __getitem__(self, index: int) -> Mapping:
+        return self.records[index]
+
+
+# Bancos ya cargados en este proceso, por ruta de archivo
+_shared_banks: Dict[str, QuestionBank] = {}
+
+
+def get_shared_bank(path: str) -> QuestionBank:
+    """
+    Obtiene el banco del archivo indicado, cargándolo una sola vez por proceso.
+    
+    Args:
+        path: Ruta del archivo de preguntas
+        
+    Returns:
+        Banco de preguntas compartido
+    """
+    key = os.path.abspath(path)
+    bank = _shared_banks.get(key)
+    if bank is None:
+        bank = QuestionBank.from_file(key)
+        if len(bank):  # No recordar bancos vacíos por errores de lectura
+            _shared_banks[key] = bank
+    return bank
+
+
+def difficulty_for_level(level: int, difficulties: Sequence[int]) -> Optional[int]:
+    """
+    Mapea un nivel del juego a una dificultad del banco.
+    
+    Los niveles 1..MAX_QUESTIONS se reparten en bandas iguales sobre las
+    dificultades disponibles, de la más fácil a la más difícil.
+    
+    Args:
+        level: Nivel actual (1-MAX_QUESTIONS)
+        difficulties: Dificultades disponibles, ordenadas
+        
+    Returns:
+        Dificultad correspondiente o None si no hay dificultades
+    """
+    if not difficulties:
+        return None
+    level = min(max(level, 1), MAX_QUESTIONS)
+    band = (level - 1) * len(difficulties) // MAX_QUESTIONS
+    return difficulties[band]
+
+
+class QuestionDeck:
+    """
+    Reparto aleatorio sin reemplazo sobre los índices 0..size-1.
+    
+    Usa un Fisher-Yates perezoso: cada extracción es O(1) y solo se guardan
+    las posiciones intercambiadas, así que el estado crece con las preguntas
+    repartidas y no con el tamaño del banco. Un mapa inverso (índice ->
+    posición) permite además sacar un índice concreto en O(1).
+    """
+    
+    __slots__ = ("size", "remaining", "_swaps", "_positions", "_rng")
+    
+    def __init__(self, size: int, rng: Optional[random.Random] = None):
+        """
+        Inicializa el mazo.
+        
+        Args:
+            size: Número de índices a repartir
+            rng: Generador aleatorio (por defecto, el del módulo random)
+        """
+        self.size = size
+        self.remaining = size
+        # posición -> índice, solo donde difieren
+        self._swaps: Dict[int, int] = {}
+        # índice -> posición, solo para los índices que se movieron
+        self._positions: Dict[int, int] = {}
+        self._rng = rng if rng is not None else random
+    
+    def _take(self, position: int) -> int:
+        """Saca el índice de una posición moviendo a ella el último"""
+        last = self.remaining - 1
+        index = self._swaps.pop(position, position)
+        self._positions.pop(index, None)
+        if position != last:
+            tail = self._swaps.pop(last, last)
+            self._swaps[position] = tail
+            self._positions[tail] = position
+        self.remaining = last
+        return index
+    
+    def draw(self) -> Optional[int]:
+        """
+        Extrae un índice al azar entre los que quedan.
+        
+        Returns:
+            Índice extraído o None si el mazo está vacío
+        """
+        if not self.remaining:
+            return None
+        return self._take(self._rng.randrange(self.remaining))
+    
+    def exclude(self, index: int) -> bool:
+        """
+        Saca un índice concreto del mazo sin repartirlo.
+        
+        Args:
+            index: Índice a excluir
+            
+        Returns:
+            True si estaba en el mazo
+        """
+        position = self._positions.get(index, index)
+        if not 0 <= position < self.remaining or self._swaps.get(position, position) != index:
+            return False
+        self._take(position)
+        return True
+    
+    def reset(self) -> None:
+        """Vuelve a poner todos los índices en el mazo"""
+        self.remaining = self.size
+        self._swaps.clear()
+        self._positions.clear()
 
 
 class QuestionManager:
     """Gestiona las preguntas del juego"""
     
-    def __init__(self, questions_file: str = "questions.json"):
+    __slots__ = ("questions_file", "bank", "decks", "current_question", "rng", "seen",
+                 "_pending")
+    
+    def __init__(self, questions_file: str = "questions.json",
+                 bank: Optional[QuestionBank] = None,
+                 rng: Optional[random.Random] = None):
         """
         Inicializa el gestor de preguntas.
         
         Args:
             questions_file: Nombre del archivo JSON con las preguntas
+            bank: Banco ya cargado para compartir entre sesiones (opcional)
+            rng: Generador aleatorio propio de la sesión, para repartos
+                 reproducibles (por defecto, el del módulo random)
         """
         self.questions_file = os.path.join(DATA_DIR, questions_file)
-        self.questions: List[Dict] = []
-        self.current_question: Optional[Dict] = None
+        self.bank = bank
+        self.rng = rng if rng is not None else random
+        self.decks: Dict[int, QuestionDeck] = {}
+        self.current_question: Optional[Mapping] = None
+        # Preguntas vistas por el jugador (SeenSet), si se lleva la cuenta
+        self.seen = None
+        # dificultad -> índices ya sacados del mazo por prefetch(), en orden
+        self._pending: Dict[int, deque] = {}
         self.load_questions()
     
+    @property
+    def questions(self) -> Sequence[Mapping]:
+        """Preguntas del banco (solo lectura)"""
+        return self.bank.records
+    
     def load_questions(self) -> None:
-        """Carga las preguntas desde el archivo JSON"""
-        try:
-            with open(self.questions_file, 'r', encoding='utf-8') as f:
-                self.questions = json.load(f)
-        except FileNotFoundError:
-            print(f"Error: No se encontró el archivo {self.questions_file}")
-            self.questions = []
-        except json.JSONDecodeError:
-            print(f"Error: El archivo {self.questions_file} no es un JSON válido")
-            self.questions = []
+        """Carga el banco compartido de preguntas y prepara un mazo nuevo"""
+        if self.bank is None:
+            self.bank = get_shared_bank(self.questions_file)
+        # Un mazo por dificultad sobre los índices de su grupo
+        self.decks = {
+            difficulty: QuestionDeck(len(bucket), self.rng)
+            for difficulty, bucket in self.bank.by_difficulty.items()
+        }
+    
+    def shuffle_questions(self, exclude_ids: Iterable[str] = (), seen=None) -> None:
+        """
+        Mezcla las preguntas aleatoriamente (reinicia los mazos, salvo que
+        se siga con el mismo jugador).
+        
+        Las preguntas vistas se sacan de los mazos una sola vez por jugador,
+        en O(|seen|): si la partida siguiente usa el mismo SeenSet y no hay
+        exclusiones, los mazos se conservan, porque ya no contienen ninguna
+        pregunta vista (las repartidas salieron del mazo al repartirse). Así
+        empezar una partida no cuesta más aunque el jugador haya visto casi
+        todo el banco, y el estado de los mazos no se reconstruye.
+        
+        Args:
+            exclude_ids: Identificadores de preguntas que no se deben repartir
+            seen: SeenSet del jugador; sus preguntas se excluyen y las que se
+                  repartan se marcan en él. Si excluirlas vacía una
+                  dificultad, esa dificultad vuelve a repartirse completa
+                  y se desmarca.
+        """
+        exclude_ids = tuple(exclude_ids)
+        bank = self.bank
+        if seen is None or seen is not self.seen or exclude_ids:
+            for deck in self.decks.values():
+                deck.reset()
+            self._pending.clear()
+            for question_id in exclude_ids:
+                position = bank.position_of(question_id)
+                if position is not None:
+                    self._exclude(position)
+            if seen is not None:
+                for position in seen:
+                    self._exclude(position)
+        self.seen = seen
+        
+        for difficulty, deck in self.decks.items():
+            if not self._remaining(difficulty):
+                deck.reset()
+                if seen is not None:
+                    seen.discard_many(bank.by_difficulty[difficulty])
+    
+    def _exclude(self, position: int) -> None:
+        """Saca del reparto la pregunta en esa posición del banco"""
+        bank = self.bank
+        self.decks[bank.difficulty_of[position]].exclude(bank.bucket_positions[position])
     
-    def shuffle_questions(self) -> None:
-        """Mezcla las preguntas aleatoriamente"""
-        shuffle(self.questions)
+    def _remaining(self, difficulty: int) -> int:
+        """Preguntas por repartir de una dificultad, incluidas las reservadas"""
+        pending = self._pending.get(difficulty)
+        return self.decks[difficulty].remaining + (len(pending) if pending else 0)
     
-    def get_next_question(self) -> Optional[Dict]:
+    def _pick_difficulty(self, level: Optional[int]) -> Optional[int]:
+        """Elige la dificultad de la que se repartirá la siguiente pregunta"""
+        available = [d for d in self.bank.difficulties if self._remaining(d)]
+        if not available:
+            return None
+        
+        if level is None:
+            # Sin nivel: proporcional a lo que queda en cada grupo
+            target = self.rng.randrange(sum(self._remaining(d) for d in available))
+            for difficulty in available:
+                target -= self._remaining(difficulty)
+                if target < 0:
+                    return difficulty
+        
+        wanted = difficulty_for_level(level, self.bank.difficulties)
+        if self._remaining(wanted):
+            return wanted
+        # Grupo agotado: usar la dificultad disponible más cercana
+        return min(available, key=lambda d: (abs(d - wanted), d))
+    
+    def get_next_question(self, level: Optional[int] = None) -> Optional[Mapping]:
         """
         Obtiene la siguiente pregunta.
         
+        Args:
+            level: Nivel actual (1-MAX_QUESTIONS) para elegir la dificultad;
+                   si se omite, se reparte de todo el banco
+        
         Returns:
-            Diccionario con la pregunta o None si no hay más
+            Pregunta de solo lectura o None si no hay más
         """
-        if self.questions:
-            self.current_question = self.questions.pop(0).copy()
-            return self.current_question
-        return None
+        difficulty = self._pick_difficulty(level)
+        if difficulty is None:
+            return None
+        pending = self._pending.get(difficulty)
+        if pending:
+            index = pending.popleft()
+        else:
+            index = self.bank.by_difficulty[difficulty][self.decks[difficulty].draw()]
+        if self.seen is not None:
+            self.seen.add(index)
+        self.current_question = self.bank[index]
+        return self.current_question
+    
+    def prefetch(self, levels: Iterable[Optional[int]]) -> List[Mapping]:
+        """
+        Decide por adelantado las preguntas que se repartirán para esos niveles.
+        
+        Las preguntas se sacan del mazo y quedan reservadas, en orden, para
+        las próximas llamadas a get_next_question() de su dificultad. Llamar
+        otra vez con los mismos niveles no reserva más.
+        
+        Args:
+            levels: Niveles de los próximos repartos posibles
+        
+        Returns:
+            Preguntas reservadas, una por nivel mientras queden
+        """
+        used: Dict[int, int] = {}
+        questions = []
+        for level in levels:
+            difficulty = self._pick_difficulty(level)
+            if difficulty is None:
+                break
+            pending = self._pending.setdefault(difficulty, deque())
+            position = used.get(difficulty, 0)
+            if position == len(pending):
+                drawn = self.decks[difficulty].draw()
+                if drawn is None:
+                    continue
+                pending.append(self.bank.by_difficulty[difficulty][drawn])
+            used[difficulty] = position + 1
+            questions.append(self.bank[pending[position]])
+        return questions
     
-    def get_current_question(self) -> Optional[Dict]:
+    def get_current_question(self) -> Optional[Mapping]:
         """Obtiene la pregunta actual"""
         return self.current_question
     
     def has_more_questions(self) -> bool:
         """Verifica si hay más preguntas disponibles"""
-        return len(self.questions) > 0
+        return self.get_remaining_count() > 0
     
     def get_remaining_count(self) -> int:
         """Obtiene el número de preguntas restantes"""
-        return len(self.questions)
+        return sum(self._remaining(difficulty) for difficulty in self.decks)
 
 
 class Lifeline:
     """Gestiona los comodines del juego"""
     
-    def __init__(self):
+    __slots__ = ("fifty_fifty_used", "skip_question_used", "ask_audience_used", "rng")
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Inicializa los comodines.
+        
+        Args:
+            rng: Generador aleatorio propio de la sesión (por defecto, el
+                 del módulo random)
+        """
+        self.rng = rng if rng is not None else random
         self.fifty_fifty_used = False
         self.skip_question_used = False
+        self.ask_audience_used = False
     
     def use_fifty_fifty(self, options: List[str], correct_answer: int) -> List[str]:
         """
@@ -89,7 +506,7 @@ class Lifeline:
         incorrect_options = [i for i in range(len(options)) if i != correct_answer]
         
         if len(incorrect_options) >= 2:
-            options_to_remove = sample(incorrect_options, 2)
+            options_to_remove = self.rng.sample(incorrect_options, 2)
             new_options = [
                 option if i not in options_to_remove else ""
                 for i, option in enumerate(options)
@@ -111,7 +528,52 @@ class Lifeline:
         self.skip_question_used = True
         return True
     
+    def use_ask_audience(self, options: List[str], correct_answer: int,
+                         counts: Optional[Sequence[int]] = None,
+                         difficulty: int = 1) -> List[int]:
+        """
+        Usa el comodín de preguntar al público.
+        
+        Los porcentajes salen de las respuestas históricas a la pregunta. Se
+        suman AUDIENCE_PRIOR_ANSWERS respuestas simuladas, con más peso en la
+        correcta cuanto más fácil es la pregunta, para que las preguntas con
+        pocos datos no den resultados extremos.
+        
+        Args:
+            options: Lista de opciones (las eliminadas por 50/50 están vacías)
+            correct_answer: Índice de la respuesta correcta
+            counts: Veces que se eligió cada opción (None si no hay datos)
+            difficulty: Dificultad de la pregunta
+            
+        Returns:
+            Porcentaje del público por opción (suman 100; 0 en las eliminadas),
+            o una lista vacía si el comodín ya se usó
+        """
+        if self.ask_audience_used:
+            return []
+        self.ask_audience_used = True
+        
+        visible = [i for i, option in enumerate(options) if option]
+        correct_share = max(0.3, 0.75 - 0.1 * (difficulty - 1))
+        weights = [0.0] * len(options)
+        for i in visible:
+            if i == correct_answer:
+                prior = correct_share
+            else:
+                prior = (1 - correct_share) / max(1, len(visible) - 1)
+            weights[i] = AUDIENCE_PRIOR_ANSWERS * prior + (counts[i] if counts else 0)
+        
+        # Redondeo por mayor residuo para que sumen exactamente 100
+        total = sum(weights)
+        exact = [100 * w / total for w in weights]
+        percentages = [int(value) for value in exact]
+        by_remainder = sorted(visible, key=lambda i: exact[i] - percentages[i], reverse=True)
+        for i in by_remainder[:100 - sum(percentages)]:
+            percentages[i] += 1
+        return percentages
+    
     def reset(self) -> None:
         """Reinicia todos los comodines"""
         self.fifty_fifty_used = False
         self.skip_question_used = False
+        self.ask_audience_used = False
@@ -0,0 +1,336 @@
+"""
+Registro persistente de resultados
+
+Cada partida terminada se guarda en una base SQLite local en modo WAL:
+una fila por sesión (jugador, resultado, premio, comodines) y una fila por
+respuesta (nivel, pregunta, opción elegida, acierto y latencia). Esas
+tablas solo reciben inserciones; en la misma transacción se actualiza el
+mejor resultado de cada jugador (best_results), que es lo que carga la
+clasificación sin recorrer las sesiones.
+
+El bucle de render nunca escribe en disco: las partidas se encolan en un
+ResultsWriter, cuyo hilo de fondo las inserta por lotes en una sola
+transacción. La cola tiene tamaño fijo; si se llena, las partidas nuevas
+se descartan y se cuentan en lugar de bloquear el juego. Al cerrar (o al
+salir del proceso) se escriben las partidas pendientes.
+"""
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Mapping
+from juego.config import (
+    RESULTS_DB, RESULTS_QUEUE_SIZE, RESULTS_BATCH_SIZE, RESULTS_FLUSH_INTERVAL
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    result TEXT NOT NULL,
+    correct_answers INTEGER NOT NULL,
+    prize INTEGER NOT NULL,
+    lifelines TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    level INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    question_id TEXT,
+    chosen TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_session ON answers(session_id);
+CREATE INDEX IF NOT EXISTS sessions_player ON sessions(player, prize, finished_at);
+CREATE INDEX IF NOT EXISTS sessions_finished ON sessions(finished_at);
+CREATE TABLE IF NOT EXISTS best_results (
+    player TEXT PRIMARY KEY,
+    prize INTEGER NOT NULL,
+    achieved_at REAL NOT NULL,
+    games INTEGER NOT NULL,
+    total INTEGER NOT NULL
+);
+"""
+
+# Suma una partida al mejor resultado de su jugador; ante empates en premio
+# se conserva el primer momento en que se obtuvo
+UPSERT_BEST_RESULT = """
+INSERT INTO best_results (player, prize, achieved_at, games, total) VALUES (?, ?, ?, 1, ?)
+ON CONFLICT(player) DO UPDATE SET
+    achieved_at = CASE
+        WHEN excluded.prize > prize THEN excluded.achieved_at
+        WHEN excluded.prize = prize THEN MIN(achieved_at, excluded.achieved_at)
+        ELSE achieved_at END,
+    prize = MAX(prize, excluded.prize),
+    games = games + 1,
+    total = total + excluded.prize
+"""
+
+# Llena best_results desde las sesiones de una base creada antes de la tabla
+BACKFILL_BEST_RESULTS = """
+INSERT OR IGNORE INTO best_results (player, prize, achieved_at, games, total)
+SELECT s.player, s.prize, MIN(s.finished_at), t.games, t.total
+FROM sessions AS s
+JOIN (SELECT player, MAX(prize) AS best, COUNT(*) AS games, SUM(prize) AS total
+      FROM sessions GROUP BY player) AS t
+  ON s.player = t.player AND s.prize = t.best
+GROUP BY s.player
+"""
+
+# Resultado de una partida que se cerró antes de terminar
+RESULT_ABANDONED = "abandoned"
+
+_STOP = object()
+
+
+def build_session_record(player_name: str, engine) -> dict:
+    """
+    Resume una partida del motor como registro para el almacén.
+    
+    Args:
+        player_name: Nombre del jugador
+        engine: GameEngine ya iniciado
+    
+    Returns:
+        Diccionario con los datos de la sesión y sus respuestas
+    """
+    return {
+        "player": player_name,
+        "started_at": engine.started_at,
+        "finished_at": time.time(),
+        "result": engine.state if engine.is_over else RESULT_ABANDONED,
+        "correct_answers": engine.correct_answers,
+        "prize": engine.score,
+        "lifelines": list(engine.lifelines_used),
+        "answers": [
+            {"level": level, "question_id": question_id, "question": question,
+             "chosen": chosen, "correct": correct, "latency_ms": latency * 1000.0}
+            for level, question_id, question, chosen, correct, latency in engine.history
+        ],
+    }
+
+
+class ResultsStore:
+    """Base SQLite de resultados (solo inserciones)"""
+    
+    def __init__(self, path: str = RESULTS_DB):
+        """
+        Abre o crea la base de resultados.
+        
+        Args:
+            path: Ruta del archivo SQLite
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Con WAL, NORMAL solo arriesga la última transacción ante un corte de luz
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        had_best_results = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'best_results'"
+        ).fetchone() is not None
+        self.connection.executescript(SCHEMA)
+        if not had_best_results:
+            # Única vez que se recorren todas las sesiones
+            with self.connection:
+                self.connection.execute(BACKFILL_BEST_RESULTS)
+        # Bases creadas antes de que las preguntas tuvieran identificador
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(answers)")}
+        if "question_id" not in columns:
+            self.connection.execute("ALTER TABLE answers ADD COLUMN question_id TEXT")
+    
+    def insert_batch(self, records: Iterable[Mapping]) -> int:
+        """
+        Inserta varias sesiones en una sola transacción.
+        
+        Args:
+            records: Registros creados con build_session_record
+        
+        Returns:
+            Número de sesiones insertadas
+        """
+        count = 0
+        with self.connection:
+            cursor = self.connection.cursor()
+            for record in records:
+                cursor.execute(
+                    "INSERT INTO sessions (player, started_at, finished_at, result, "
+                    "correct_answers, prize, lifelines) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (record["player"], record["started_at"], record["finished_at"],
+                     record["result"], record["correct_answers"], record["prize"],
+                     json.dumps(record["lifelines"])),
+                )
+                session_id = cursor.lastrowid
+                cursor.executemany(
+                    "INSERT INTO answers (session_id, level, question, question_id, "
+                    "chosen, correct, latency_ms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(session_id, a["level"], a["question"], a.get("question_id"),
+                      a["chosen"], int(a["correct"]), a["latency_ms"])
+                     for a in record["answers"]],
+                )
+                cursor.execute(UPSERT_BEST_RESULT,
+                               (record["player"], record["prize"], record["finished_at"],
+                                record["prize"]))
+                count += 1
+        return count
+    
+    def best_results(self) -> Iterable[tuple]:
+        """Tuplas (jugador, mejor premio, momento, partidas, total ganado)"""
+        return self.connection.execute(
+            "SELECT player, prize, achieved_at, games, total FROM best_results")
+    
+    def session_count(self) -> int:
+        """Número de sesiones guardadas"""
+        return self.connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    
+    def recent_sessions(self, limit: int = 10) -> List[dict]:
+        """
+        Últimas sesiones guardadas, con sus respuestas.
+        
+        Args:
+            limit: Número máximo de sesiones
+        """
+        sessions = []
+        rows = self.connection.execute(
+            "SELECT id, player, started_at, finished_at, result, correct_answers, "
+            "prize, lifelines FROM sessions ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        for (session_id, player, started_at, finished_at, result,
+             correct_answers, prize, lifelines) in rows:
+            answers = self.connection.execute(
+                "SELECT level, question_id, question, chosen, correct, latency_ms "
+                "FROM answers WHERE session_id = ? ORDER BY rowid", (session_id,)
+            ).fetchall()
+            sessions.append({
+                "id": session_id,
+                "player": player,
+                "started_at": started_at,
+                "finished_at": finished_at,
+                "result": result,
+                "correct_answers": correct_answers,
+                "prize": prize,
+                "lifelines": json.loads(lifelines),
+                "answers": [
+                    {"level": level, "question_id": question_id, "question": question,
+                     "chosen": chosen, "correct": bool(correct), "latency_ms": latency_ms}
+                    for level, question_id, question, chosen, correct, latency_ms in answers
+                ],
+            })
+        return sessions
+    
+    def close(self) -> None:
+        """Cierra la conexión"""
+        self.connection.close()
+
+
+class ResultsWriter:
+    """Escritor en segundo plano con cola acotada y escrituras por lotes"""
+    
+    def __init__(self, path: str = RESULTS_DB, queue_size: int = RESULTS_QUEUE_SIZE,
+                 batch_size: int = RESULTS_BATCH_SIZE,
+                 flush_interval: float = RESULTS_FLUSH_INTERVAL):
+        """
+        Inicia el hilo escritor.
+        
+        Args:
+            path: Ruta de la base SQLite
+            queue_size: Sesiones pendientes como máximo
+            batch_size: Sesiones por transacción
+            flush_interval: Segundos máximos que una sesión espera en la cola
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="results-writer",
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, record: Mapping) -> bool:
+        """
+        Encola una sesión sin bloquear.
+        
+        Args:
+            record: Registro creado con build_session_record
+        
+        Returns:
+            True si se encoló, False si la cola estaba llena o cerrada
+        """
+        if self._closed:
+            return False
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+    
+    def _write(self, store: ResultsStore, batch: List[Mapping]) -> None:
+        try:
+            self.written += store.insert_batch(batch)
+        except sqlite3.Error as e:
+            self.failed += len(batch)
+            print(f"Error al guardar resultados: {e}")
+    
+    def _run(self) -> None:
+        try:
+            store = ResultsStore(self.path)
+        except sqlite3.Error as e:
+            print(f"Error al abrir {self.path}: {e}")
+            store = None
+        
+        batch: List[Mapping] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                if store is not None:
+                    self._write(store, batch)
+                else:
+                    self.failed += len(batch)
+                batch = []
+                deadline = None
+        
+        if store is not None:
+            if batch:
+                self._write(store, batch)
+            store.close()
+        else:
+            self.failed += len(batch)
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Escribe las sesiones pendientes y detiene el hilo.
+        
+        Args:
+            timeout: Segundos máximos de espera
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print("Advertencia: no se pudieron guardar todos los resultados")
+            return
+        self._thread.join(timeout)
@@ -0,0 +1,207 @@
+"""
+Ejecución reproducible de muchas sesiones simuladas en varios procesos
+
+Cada sesión juega una partida completa con el motor real (GameEngine) y un
+jugador simulado. Todos sus generadores aleatorios (reparto de preguntas,
+comodín 50/50 y decisiones del jugador) se derivan de la semilla maestra y
+del número de sesión, de modo que el resultado es idéntico bit a bit sin
+importar cuántos procesos se usen.
+
+Uso:
+    python -m juego.runner --sessions 100000 --workers 8 --seed 42
+"""
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from juego.config import DATA_DIR
+from juego.questions import QuestionBank, QuestionManager, Lifeline, get_shared_bank
+from juego.engine import GameEngine, LETTERS, STATE_SAFE_HAVEN
+from juego.simulation import PlayerModel
+
+DEFAULT_SHARD_SIZE = 10_000
+
+
+def derive_seed(master_seed: int, *path) -> int:
+    """
+    Deriva una semilla independiente a partir de la semilla maestra.
+    
+    Args:
+        master_seed: Semilla maestra de la ejecución
+        path: Identificadores del flujo (p. ej. número de sesión y uso)
+    
+    Returns:
+        Semilla de 64 bits
+    """
+    data = repr((master_seed,) + path).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "little")
+
+
+def seeded_engine(bank: QuestionBank, seed: int) -> GameEngine:
+    """
+    Crea un motor cuyos repartos y comodines dependen solo de la semilla.
+    
+    Args:
+        bank: Banco de preguntas compartido
+        seed: Semilla de la sesión
+    """
+    question_manager = QuestionManager(
+        bank=bank, rng=random.Random(derive_seed(seed, "questions")))
+    lifeline = Lifeline(rng=random.Random(derive_seed(seed, "lifeline")))
+    return GameEngine(question_manager, lifeline)
+
+
+def play_session(bank: QuestionBank, seed: int, model: PlayerModel) -> tuple:
+    """
+    Juega una partida completa con un jugador simulado.
+    
+    Args:
+        bank: Banco de preguntas compartido
+        seed: Semilla de la sesión
+        model: Modelo de jugador
+    
+    Returns:
+        Tupla (estado final, respuestas correctas, premio)
+    """
+    engine = seeded_engine(bank, seed)
+    player = random.Random(derive_seed(seed, "player"))
+    engine.start()
+    
+    while not engine.is_over:
+        if engine.state == STATE_SAFE_HAVEN:
+            if (engine.correct_answers in model.walk_away_at
+                    and player.random() < model.walk_away_probability):
+                engine.walk_away()
+            else:
+                engine.continue_game()
+            continue
+        
+        level = engine.current_level
+        question = engine.current_question
+        knows = player.random() < model.accuracy.get(question["difficulty"], 0.0)
+        if not knows and model.skip_from is not None and level >= model.skip_from \
+                and engine.skip():
+            continue
+        if not knows and model.fifty_fifty_from is not None \
+                and level >= model.fifty_fifty_from:
+            engine.use_fifty_fifty()
+        
+        if knows:
+            choice = question["answer"]
+        else:
+            visible = [i for i, option in enumerate(engine.current_options) if option]
+            choice = player.choice(visible)
+        engine.answer(LETTERS[choice])
+    
+    return engine.state, engine.correct_answers, engine.score
+
+
+def run_shard(shard_index: int, first_session: int, count: int, master_seed: int,
+              model: PlayerModel, bank_path: str) -> dict:
+    """
+    Juega un bloque consecutivo de sesiones.
+    
+    Args:
+        shard_index: Número del bloque
+        first_session: Número de la primera sesión del bloque
+        count: Sesiones del bloque
+        master_seed: Semilla maestra de la ejecución
+        model: Modelo de jugador
+        bank_path: Ruta del banco (cada proceso lo carga una vez)
+    
+    Returns:
+        Conteos del bloque y un resumen criptográfico de sus resultados
+    """
+    bank = get_shared_bank(bank_path)
+    digest = hashlib.sha256()
+    histogram = {}
+    states = {}
+    for session in range(first_session, first_session + count):
+        state, correct_answers, score = play_session(
+            bank, derive_seed(master_seed, session), model)
+        histogram[score] = histogram.get(score, 0) + 1
+        states[state] = states.get(state, 0) + 1
+        digest.update(f"{session}:{state}:{correct_answers}:{score};".encode())
+    return {"shard": shard_index, "sessions": count, "histogram": histogram,
+            "states": states, "digest": digest.hexdigest()}
+
+
+def run_sessions(n_sessions: int, master_seed: int, workers: int = 1,
+                 model: Optional[PlayerModel] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE,
+                 bank_path: Optional[str] = None) -> dict:
+    """
+    Reparte sesiones simuladas en bloques sobre un pool de procesos.
+    
+    Los bloques dependen solo de n_sessions y shard_size, y cada sesión
+    tiene su propia semilla derivada, así que el resultado no cambia con
+    el número de procesos.
+    
+    Args:
+        n_sessions: Número total de sesiones
+        master_seed: Semilla maestra
+        workers: Número de procesos (1 = en este proceso)
+        model: Modelo de jugador (por defecto, PlayerModel())
+        shard_size: Sesiones por bloque
+        bank_path: Banco de preguntas (por defecto, data/questions.json)
+    
+    Returns:
+        Histograma de premios, conteo de estados finales y resumen
+        criptográfico de todas las sesiones
+    """
+    model = model or PlayerModel()
+    bank_path = bank_path or os.path.join(DATA_DIR, "questions.json")
+    shards = [
+        (index, start, min(shard_size, n_sessions - start), master_seed, model, bank_path)
+        for index, start in enumerate(range(0, n_sessions, shard_size))
+    ]
+    
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_shard, *zip(*shards)))
+    else:
+        results = [run_shard(*shard) for shard in shards]
+    
+    histogram, states = {}, {}
+    digest = hashlib.sha256()
+    for result in results:  # pool.map conserva el orden de los bloques
+        for score, count in result["histogram"].items():
+            histogram[score] = histogram.get(score, 0) + count
+        for state, count in result["states"].items():
+            states[state] = states.get(state, 0) + count
+        digest.update(result["digest"].encode())
+    
+    total = sum(score * count for score, count in histogram.items())
+    return {
+        "sessions": n_sessions,
+        "master_seed": master_seed,
+        "histogram": dict(sorted(histogram.items())),
+        "states": dict(sorted(states.items())),
+        "expected_payout": total / n_sessions if n_sessions else 0.0,
+        "digest": digest.hexdigest(),
+    }
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sesiones simuladas reproducibles")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    args = parser.parse_args(argv)
+    
+    result = run_sessions(args.sessions, args.seed, args.workers,
+                          shard_size=args.shard_size)
+    print(f"Sesiones: {result['sessions']:,} (semilla {result['master_seed']})")
+    print(f"Premio esperado: ${result['expected_payout']:,.2f}")
+    print("Estados finales: " + ", ".join(
+        f"{state} {count:,}" for state, count in result["states"].items()))
+    print(f"Resumen: {result['digest']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Planificador del bucle principal del juego
+"""
+import time
+from collections import deque
+import pygame
+from juego.config import (
+    FPS, IDLE_WAIT_MODE, IDLE_WAIT_TIMEOUT_MS, SCHEDULER_REPORT_INTERVAL,
+    TRANSITION_SAMPLES
+)
+
+
+class FrameScheduler:
+    """
+    Decide cuándo despierta el bucle del juego.
+    
+    En modo de espera el bucle duerme en pygame.event.wait hasta que llega
+    un evento o vence el temporizador; en modo clásico gira a FPS fijos.
+    """
+    
+    def __init__(self, idle_wait: bool = IDLE_WAIT_MODE,
+                 timeout_ms: int = IDLE_WAIT_TIMEOUT_MS, fps: int = FPS,
+                 report_interval: float = SCHEDULER_REPORT_INTERVAL):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            idle_wait: Si se espera por eventos en lugar de girar a FPS
+            timeout_ms: Tiempo máximo de espera antes de despertar
+            fps: Cuadros por segundo en modo clásico
+            report_interval: Segundos entre reportes de consumo (0 = nunca)
+        """
+        self.idle_wait = idle_wait
+        self.timeout_ms = timeout_ms
+        self.fps = fps
+        self.report_interval = report_interval
+        self.clock = pygame.time.Clock()
+        self.reset_stats()
+    
+    def reset_stats(self) -> None:
+        """Reinicia las estadísticas de consumo"""
+        self.wakeups = 0
+        self.timer_wakeups = 0
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._last_report = self._start_wall
+        # Segundos desde la respuesta hasta el primer cuadro de la pregunta nueva
+        self.transitions = deque(maxlen=TRANSITION_SAMPLES)
+    
+    def record_transition(self, seconds: float) -> None:
+        """
+        Registra cuánto tardó en verse la pregunta siguiente.
+        
+        Args:
+            seconds: Tiempo desde la acción del jugador hasta el cuadro dibujado
+        """
+        self.transitions.append(seconds)
+    
+    def wait_events(self) -> list:
+        """
+        Espera hasta el siguiente despertar y devuelve los eventos pendientes.
+        
+        Returns:
+            Lista de eventos de pygame (vacía si despertó por temporizador)
+        """
+        if self.idle_wait:
+            first = pygame.event.wait(self.timeout_ms)
+            if first.type == pygame.NOEVENT:
+                events = []
+                self.timer_wakeups += 1
+            else:
+                events = [first]
+                events.extend(pygame.event.get())
+        else:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        
+        self.wakeups += 1
+        if self.report_interval:
+            now = time.perf_counter()
+            if now - self._last_report >= self.report_interval:
+                self._last_report = now
+                print(self.report())
+        return events
+    
+    def stats(self) -> dict:
+        """
+        Calcula el consumo desde el último reinicio.
+        
+        Returns:
+            Diccionario con segundos transcurridos, despertares por segundo
+            y porcentaje de CPU usado por el proceso
+        """
+        elapsed = max(time.perf_counter() - self._start_wall, 1e-9)
+        cpu = time.process_time() - self._start_cpu
+        transitions = sorted(self.transitions)
+        return {
+            "elapsed": elapsed,
+            "wakeups": self.wakeups,
+            "timer_wakeups": self.timer_wakeups,
+            "wakeups_per_second": self.wakeups / elapsed,
+            "cpu_percent": 100.0 * cpu / elapsed,
+            "transitions": len(transitions),
+            "transition_ms_p50": 1000.0 * transitions[len(transitions) // 2] if transitions else 0.0,
+            "transition_ms_max": 1000.0 * transitions[-1] if transitions else 0.0,
+        }
+    
+    def report(self) -> str:
+        """Devuelve un resumen legible del consumo"""
+        stats = self.stats()
+        mode = "espera" if self.idle_wait else f"{self.fps} FPS"
+        report = (f"[planificador:{mode}] CPU {stats['cpu_percent']:.1f}% | "
+                  f"{stats['wakeups_per_second']:.1f} despertares/s "
+                  f"({stats['timer_wakeups']} por temporizador)")
+        if stats["transitions"]:
+            report += (f" | transición entre preguntas: mediana "
+                       f"{stats['transition_ms_p50']:.1f} ms, máx "
+                       f"{stats['transition_ms_max']:.1f} ms")
+        return report
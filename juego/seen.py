@@ -0,0 +1,150 @@
+"""
+Preguntas ya vistas por cada jugador
+
+Cada jugador tiene un conjunto de bits con un bit por pregunta del banco
+(12,5 KB para 100.000 preguntas). Solo los jugadores activos se mantienen
+en memoria; en disco el conjunto se guarda comprimido con zlib, así que un
+jugador que vio pocas preguntas ocupa unos pocos bytes aunque haya
+millones de jugadores.
+
+El conjunto está ligado al banco con el que se creó mediante su huella
+(ver QuestionBank.fingerprint): si el banco cambia, el jugador empieza con
+un conjunto vacío.
+"""
+import sqlite3
+import zlib
+from typing import Iterable, Iterator, Optional
+from juego.config import SEEN_DB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    player TEXT PRIMARY KEY,
+    bank TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    bits BLOB NOT NULL
+);
+"""
+
+
+class SeenSet:
+    """Conjunto de bits sobre las posiciones de las preguntas del banco"""
+    
+    __slots__ = ("size", "bits", "count")
+    
+    def __init__(self, size: int, bits: Optional[bytes] = None):
+        """
+        Crea el conjunto.
+        
+        Args:
+            size: Número de preguntas del banco
+            bits: Contenido sin comprimir (por defecto, vacío)
+        """
+        self.size = size
+        # Múltiplo de 8 bytes para recorrerlo por palabras de 64 bits
+        n_bytes = (size + 63) // 64 * 8
+        self.bits = bytearray(n_bytes)
+        if bits:
+            self.bits[:len(bits)] = bits[:n_bytes]
+        self.count = bin(int.from_bytes(self.bits, "little")).count("1") if bits else 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __contains__(self, position: int) -> bool:
+        return bool(self.bits[position >> 3] & (1 << (position & 7)))
+    
+    def add(self, position: int) -> None:
+        """Marca una pregunta como vista"""
+        mask = 1 << (position & 7)
+        if not self.bits[position >> 3] & mask:
+            self.bits[position >> 3] |= mask
+            self.count += 1
+    
+    def discard(self, position: int) -> None:
+        """Vuelve a marcar una pregunta como no vista"""
+        mask = 1 << (position & 7)
+        if self.bits[position >> 3] & mask:
+            self.bits[position >> 3] &= ~mask
+            self.count -= 1
+    
+    def discard_many(self, positions: Iterable[int]) -> None:
+        """Vuelve a marcar varias preguntas como no vistas"""
+        for position in positions:
+            self.discard(position)
+    
+    def __iter__(self) -> Iterator[int]:
+        """Posiciones marcadas, saltando de a 64 las palabras vacías"""
+        words = memoryview(self.bits).cast("Q")
+        for w, word in enumerate(words):
+            if word:
+                word = int.from_bytes(self.bits[w * 8:w * 8 + 8], "little")
+            while word:
+                low = word & -word
+                yield w * 64 + low.bit_length() - 1
+                word ^= low
+    
+    def to_bytes(self) -> bytes:
+        """Contenido comprimido para guardar en disco"""
+        return zlib.compress(bytes(self.bits), 6)
+    
+    @classmethod
+    def from_bytes(cls, size: int, data: bytes) -> "SeenSet":
+        """Reconstruye un conjunto guardado con to_bytes()"""
+        return cls(size, zlib.decompress(data))
+
+
+class SeenStore:
+    """Conjuntos de preguntas vistas de todos los jugadores, en SQLite"""
+    
+    def __init__(self, path: str = SEEN_DB):
+        """
+        Abre o crea la base.
+        
+        Args:
+            path: Ruta del archivo SQLite
+        """
+        self.path = path
+        # El servidor la usa desde su hilo de E/S, no desde el que la abrió
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+    
+    def load(self, player: str, bank) -> SeenSet:
+        """
+        Conjunto de preguntas vistas por un jugador en este banco.
+        
+        Args:
+            player: Nombre del jugador
+            bank: QuestionBank en juego
+        
+        Returns:
+            Conjunto guardado, o uno vacío si no hay o es de otro banco
+        """
+        row = self.connection.execute(
+            "SELECT bank, size, bits FROM seen WHERE player = ?", (player,)
+        ).fetchone()
+        if row is not None and row[0] == bank.fingerprint and row[1] == len(bank):
+            try:
+                return SeenSet.from_bytes(len(bank), row[2])
+            except zlib.error as e:
+                print(f"Advertencia: preguntas vistas de {player} dañadas: {e}")
+        return SeenSet(len(bank))
+    
+    def save(self, player: str, bank, seen: SeenSet) -> None:
+        """
+        Guarda el conjunto de un jugador.
+        
+        Args:
+            player: Nombre del jugador
+            bank: QuestionBank al que corresponde el conjunto
+            seen: Conjunto a guardar
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO seen (player, bank, size, bits) VALUES (?, ?, ?, ?)",
+                (player, bank.fingerprint, seen.size, seen.to_bytes()),
+            )
+    
+    def close(self) -> None:
+        """Cierra la conexión"""
+        self.connection.close()
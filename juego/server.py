@@ -0,0 +1,389 @@
+"""
+Servidor multijugador asíncrono
+
+Atiende muchas sesiones independientes en un solo bucle de asyncio sobre
+TCP con un protocolo de líneas: el cliente envía un comando por línea y el
+servidor responde con un objeto JSON por línea. Todas las sesiones
+comparten el mismo banco de preguntas; cada una guarda solo su motor.
+Las preguntas vistas de cada jugador se leen y guardan en un hilo aparte,
+así que SQLite nunca bloquea el bucle.
+
+Comandos:
+    NAME <nombre>      Cambia el nombre del jugador
+    START              Comienza una partida
+    ANSWER <A|B|C|D>   Responde la pregunta actual (también basta la letra)
+    FIFTY              Usa el comodín 50/50
+    SKIP               Usa el comodín de saltar pregunta
+    AUDIENCE           Usa el comodín de preguntar al público
+    CONTINUE           Sigue jugando desde una estación segura
+    WALK               Se retira en una estación segura
+    TOP [N] [HOY]      Mejores jugadores (históricos o de hoy)
+    RANK [nombre]      Puesto y resumen de un jugador
+    QUIT               Cierra la conexión
+
+Uso:
+    python -m juego.server [--host HOST] [--port PORT]
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from juego.config import (
+    DATA_DIR, PRIZES, SERVER_HOST, SERVER_PORT, SERVER_IDLE_TIMEOUT, SEEN_DB
+)
+from juego.questions import QuestionBank, QuestionManager, get_shared_bank
+from juego.engine import (
+    GameEngine, LETTERS, STATE_IDLE, STATE_QUESTION, STATE_SAFE_HAVEN
+)
+from juego.results import ResultsStore, ResultsWriter, build_session_record
+from juego.leaderboard import Leaderboard, day_key
+from juego.stats import AnswerStats, default_node, release_node
+from juego.seen import SeenSet, SeenStore
+
+
+class Session:
+    """Estado de un jugador conectado"""
+    
+    __slots__ = ("player_name", "engine", "recorded", "leaderboard", "seen", "seen_store")
+    
+    def __init__(self, bank: QuestionBank, leaderboard: Optional[Leaderboard] = None,
+                 stats: Optional[AnswerStats] = None,
+                 seen_store: Optional[SeenStore] = None):
+        """
+        Inicializa la sesión.
+        
+        Args:
+            bank: Banco de preguntas compartido
+            leaderboard: Clasificación compartida (opcional)
+            stats: Estadísticas de respuestas compartidas (opcional)
+            seen_store: Registro de preguntas vistas por jugador (opcional;
+                        sin él solo se evitan repeticiones en la conexión)
+        """
+        self.player_name = "Jugador"
+        self.engine = GameEngine(QuestionManager(bank=bank), stats=stats)
+        self.recorded = False
+        self.leaderboard = leaderboard
+        self.seen_store = seen_store
+        # Preguntas vistas por el jugador: se cargan con el primer START, así
+        # que una conexión inactiva no ocupa un bit por pregunta del banco
+        self.seen: Optional[SeenSet] = None
+    
+    def load_seen(self) -> SeenSet:
+        """Preguntas vistas por el jugador, cargándolas la primera vez"""
+        if self.seen is None:
+            bank = self.engine.question_manager.bank
+            if self.seen_store is not None:
+                try:
+                    self.seen = self.seen_store.load(self.player_name, bank)
+                except sqlite3.Error as e:
+                    print(f"Error al cargar las preguntas vistas: {e}")
+            if self.seen is None:
+                self.seen = SeenSet(len(bank))
+        return self.seen
+    
+    def save_seen(self) -> None:
+        """Guarda las preguntas vistas por el jugador, si se cargaron"""
+        if self.seen is None or self.seen_store is None:
+            return
+        try:
+            self.seen_store.save(self.player_name, self.engine.question_manager.bank,
+                                 self.seen)
+        except sqlite3.Error as e:
+            print(f"Error al guardar las preguntas vistas: {e}")
+    
+    def state_message(self) -> dict:
+        """Mensaje que describe el estado actual de la partida"""
+        engine = self.engine
+        if engine.state == STATE_IDLE:
+            return {"type": "welcome", "player": self.player_name}
+        if engine.state == STATE_QUESTION:
+            return {
+                "type": "question",
+                "level": engine.current_level,
+                "prize": PRIZES[engine.current_level - 1],
+                "score": engine.score,
+                "question": engine.current_question["question"],
+                "options": engine.current_options,
+                "fifty_fifty_used": engine.lifeline.fifty_fifty_used,
+                "skip_used": engine.lifeline.skip_question_used,
+                "audience_used": engine.lifeline.ask_audience_used,
+                "audience": engine.audience,
+            }
+        if engine.state == STATE_SAFE_HAVEN:
+            return {"type": "safe_haven", "score": engine.score}
+        return {
+            "type": "game_over",
+            "result": engine.state,
+            "won": engine.won,
+            "score": engine.score,
+            "correct_answers": engine.correct_answers,
+        }
+    
+    def handle_command(self, line: str) -> Tuple[List[dict], bool]:
+        """
+        Ejecuta un comando del cliente.
+        
+        Args:
+            line: Línea recibida
+            
+        Returns:
+            Mensajes de respuesta y si la conexión debe cerrarse
+        """
+        command, _, argument = line.strip().partition(" ")
+        command = command.upper()
+        argument = argument.strip()
+        engine = self.engine
+        
+        if command in LETTERS:
+            command, argument = "ANSWER", command
+        
+        if command == "QUIT":
+            return [{"type": "bye"}], True
+        if command == "NAME":
+            # Las vistas son del jugador anterior: se guardan y se olvidan
+            self.save_seen()
+            self.seen = None
+            self.player_name = argument[:40] or "Jugador"
+            return [{"type": "ok", "player": self.player_name}], False
+        if command == "START":
+            engine.start(seen=self.load_seen())
+            self.recorded = False
+            return [self.state_message()], False
+        if command == "ANSWER":
+            if engine.state != STATE_QUESTION or argument.upper() not in LETTERS:
+                return [_error("No hay una pregunta que responder con esa opción")], False
+            correct = engine.answer(argument)
+            return [{"type": "answer", "correct": correct, "score": engine.score},
+                    self.state_message()], False
+        if command == "FIFTY":
+            if not engine.use_fifty_fifty():
+                return [_error("El comodín 50/50 no está disponible")], False
+            return [self.state_message()], False
+        if command == "SKIP":
+            if not engine.skip():
+                return [_error("El comodín de saltar no está disponible")], False
+            return [self.state_message()], False
+        if command == "AUDIENCE":
+            if not engine.use_ask_audience():
+                return [_error("El comodín del público no está disponible")], False
+            return [self.state_message()], False
+        if command == "CONTINUE":
+            if not engine.continue_game():
+                return [_error("No estás en una estación segura")], False
+            return [self.state_message()], False
+        if command in ("TOP", "RANK"):
+            if self.leaderboard is None:
+                return [_error("La clasificación no está disponible")], False
+            if command == "TOP":
+                words = argument.upper().split()
+                # isdecimal y no isdigit: int() no acepta dígitos como "²"
+                k = next((int(word) for word in words if word.isdecimal()), 10)
+                day = day_key(time.time()) if "HOY" in words else None
+                return [{"type": "leaderboard", "day": day,
+                         "top": self.leaderboard.top(min(k, 100), day)}], False
+            player = self.leaderboard.player(argument or self.player_name)
+            if player is None:
+                return [_error("Ese jugador no tiene partidas registradas")], False
+            return [dict(player, type="rank")], False
+        if command == "WALK":
+            if not engine.walk_away():
+                return [_error("Solo puedes retirarte en una estación segura")], False
+            return [self.state_message()], False
+        return [_error(f"Comando desconocido: {command}")], False
+
+
+def _error(message: str) -> dict:
+    return {"type": "error", "message": message}
+
+
+def _encode(messages: List[dict]) -> bytes:
+    return b"".join(
+        json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+        for message in messages
+    )
+
+
+class GameServer:
+    """Servidor TCP que hospeda muchas sesiones en un bucle de asyncio"""
+    
+    def __init__(self, bank: Optional[QuestionBank] = None,
+                 idle_timeout: float = SERVER_IDLE_TIMEOUT,
+                 results: Optional[ResultsWriter] = None,
+                 leaderboard: Optional[Leaderboard] = None,
+                 stats: Optional[AnswerStats] = None,
+                 seen_store: Optional[SeenStore] = None):
+        """
+        Inicializa el servidor.
+        
+        Args:
+            bank: Banco de preguntas compartido (por defecto, el del juego)
+            idle_timeout: Segundos sin comandos antes de cerrar una sesión
+            results: Escritor donde guardar las partidas terminadas (opcional)
+            leaderboard: Clasificación que se actualiza con cada partida
+                         terminada y se consulta con TOP y RANK (opcional)
+            stats: Estadísticas de respuestas de todas las sesiones (por
+                   defecto, unas nuevas en memoria)
+            seen_store: Registro de preguntas vistas por jugador, para no
+                        repetirlas entre conexiones (opcional)
+        """
+        self.bank = bank if bank is not None else get_shared_bank(
+            os.path.join(DATA_DIR, "questions.json"))
+        self.idle_timeout = idle_timeout
+        self.results = results
+        self.leaderboard = leaderboard
+        self.stats = stats if stats is not None else AnswerStats("servidor")
+        self.seen_store = seen_store
+        # Un solo hilo para la base de vistas: las operaciones no se mezclan
+        # y la conexión de SQLite solo se usa desde ese hilo
+        self._seen_executor = (ThreadPoolExecutor(1, thread_name_prefix="seen-store")
+                               if seen_store is not None else None)
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def _seen_io(self, function) -> None:
+        """Ejecuta una operación de la base de vistas fuera del bucle"""
+        if self._seen_executor is not None:
+            await asyncio.get_running_loop().run_in_executor(self._seen_executor, function)
+    
+    async def _prepare_seen(self, session: Session, text: str) -> None:
+        """
+        Hace por adelantado la E/S de preguntas vistas que pide un comando.
+        
+        Con las vistas ya guardadas (NAME) o cargadas (START), handle_command
+        no toca la base.
+        """
+        command = text.strip().partition(" ")[0].upper()
+        if command == "NAME" and session.seen is not None:
+            await self._seen_io(session.save_seen)
+            session.seen = None
+        elif command == "START" and session.seen is None:
+            await self._seen_io(session.load_seen)
+    
+    async def handle_client(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        """Atiende una conexión hasta que el cliente sale o queda inactivo"""
+        session = Session(self.bank, self.leaderboard, self.stats, self.seen_store)
+        self.active_sessions += 1
+        self.total_sessions += 1
+        try:
+            writer.write(_encode([session.state_message()]))
+            await writer.drain()
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    break
+                try:
+                    text = line.decode("utf-8")
+                except UnicodeDecodeError:
+                    text = ""
+                await self._prepare_seen(session, text)
+                messages, close = session.handle_command(text)
+                if session.engine.is_over and not session.recorded:
+                    self._record(session)
+                writer.write(_encode(messages))
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            await self._seen_io(session.save_seen)
+    
+    def _record(self, session: Session) -> None:
+        """Guarda una partida terminada y la suma a la clasificación"""
+        session.recorded = True
+        record = build_session_record(session.player_name, session.engine)
+        if self.results is not None:
+            self.results.submit(record)
+        if self.leaderboard is not None:
+            self.leaderboard.record(record)
+    
+    async def start(self, host: str = SERVER_HOST, port: int = SERVER_PORT) -> int:
+        """
+        Comienza a aceptar conexiones.
+        
+        Returns:
+            Puerto en el que escucha (útil con port=0)
+        """
+        self._server = await asyncio.start_server(
+            self.handle_client, host, port, backlog=4096
+        )
+        return self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self) -> None:
+        """Atiende conexiones hasta que se cancele la tarea"""
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def stop(self) -> None:
+        """Deja de aceptar conexiones y espera a que se guarden las vistas"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._seen_executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._seen_executor.shutdown)
+
+
+async def _run(host: str, port: int, results: Optional[ResultsWriter],
+               leaderboard: Optional[Leaderboard], stats: AnswerStats,
+               seen_store: Optional[SeenStore]) -> None:
+    server = GameServer(results=results, leaderboard=leaderboard, stats=stats,
+                        seen_store=seen_store)
+    port = await server.start(host, port)
+    print(f"Servidor escuchando en {host}:{port} ({len(server.bank)} preguntas)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Servidor multijugador del juego")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--results", metavar="DB",
+                        help="Guarda las partidas terminadas en esta base SQLite")
+    parser.add_argument("--stats", metavar="JSON",
+                        help="Carga y guarda aquí las estadísticas de respuestas")
+    parser.add_argument("--seen", metavar="DB", default=SEEN_DB,
+                        help="Preguntas vistas por cada jugador (vacío = solo por conexión)")
+    args = parser.parse_args(argv)
+    stats = AnswerStats(default_node("servidor"))
+    if args.stats:
+        stats = AnswerStats.load(args.stats, stats.node)
+    results = leaderboard = None
+    if args.results:
+        results = ResultsWriter(args.results)
+        leaderboard = Leaderboard.from_store(ResultsStore(args.results))
+    seen_store = SeenStore(args.seen) if args.seen else None
+    try:
+        asyncio.run(_run(args.host, args.port, results, leaderboard, stats, seen_store))
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+    finally:
+        if results is not None:
+            results.close()
+        if leaderboard is not None:
+            leaderboard.close()
+        if args.stats:
+            stats.save(args.stats)
+        release_node(stats.node)
+        if seen_store is not None:
+            seen_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Simulador Monte Carlo de la escalera de premios y los comodines
+
+Juega millones de partidas sintéticas con las reglas del juego (PRIZES,
+SAFE_HAVENS, MAX_QUESTIONS, 50/50 y saltar pregunta). Las partidas avanzan
+en paralelo como arreglos de NumPy, nivel por nivel, y los lotes pueden
+repartirse en un pool de procesos.
+
+Requiere numpy, dependencia opcional declarada en requirements-sim.txt:
+    pip install -r requirements-sim.txt
+
+Uso:
+    python -m juego.simulation --games 1000000 --workers 4
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Sequence
+from juego.config import MAX_QUESTIONS, PRIZES, SAFE_HAVENS
+from juego.questions import difficulty_for_level
+
+try:
+    import numpy as np
+except ImportError:  # numpy solo lo necesita el simulador
+    np = None
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("El simulador requiere numpy: pip install -r requirements-sim.txt")
+
+
+class PlayerModel:
+    """Modelo de comportamiento de los jugadores simulados"""
+    
+    def __init__(self, accuracy: Optional[Dict[int, float]] = None,
+                 walk_away_at: Iterable[int] = (),
+                 walk_away_probability: float = 1.0,
+                 fifty_fifty_from: Optional[int] = 1,
+                 skip_from: Optional[int] = 1,
+                 difficulties: Sequence[int] = (1, 2, 3, 4)):
+        """
+        Inicializa el modelo.
+        
+        Un jugador sabe la respuesta con la probabilidad de su dificultad; si
+        no la sabe, adivina entre las opciones visibles (4, o 2 tras el 50/50).
+        
+        Args:
+            accuracy: Probabilidad de saber la respuesta por dificultad
+            walk_away_at: Estaciones seguras en las que el jugador se retira
+            walk_away_probability: Probabilidad de retirarse en esas estaciones
+            fifty_fifty_from: Nivel desde el que usa el 50/50 si no sabe
+                              la respuesta (None = nunca)
+            skip_from: Nivel desde el que salta la pregunta si no sabe la
+                       respuesta (None = nunca)
+            difficulties: Dificultades del banco, ordenadas
+        """
+        self.accuracy = accuracy or {1: 0.95, 2: 0.8, 3: 0.6, 4: 0.4}
+        self.walk_away_at = frozenset(walk_away_at)
+        self.walk_away_probability = walk_away_probability
+        self.fifty_fifty_from = fifty_fifty_from
+        self.skip_from = skip_from
+        self.difficulties = tuple(difficulties)
+    
+    def knowledge(self, level: int) -> float:
+        """Probabilidad de saber la respuesta de una pregunta del nivel"""
+        return self.accuracy[difficulty_for_level(level, self.difficulties)]
+
+
+def simulate_chunk(n_games: int, model: PlayerModel, seed) -> dict:
+    """
+    Simula un lote de partidas en paralelo.
+    
+    Args:
+        n_games: Número de partidas del lote
+        model: Modelo de jugador
+        seed: Semilla o SeedSequence de NumPy
+    
+    Returns:
+        Histograma de premios y contadores del lote
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    
+    playing = np.ones(n_games, dtype=bool)
+    score = np.zeros(n_games, dtype=np.int64)
+    fifty_available = np.ones(n_games, dtype=bool)
+    skip_available = np.ones(n_games, dtype=bool)
+    lost = 0
+    walked_away = 0
+    
+    for level in range(1, MAX_QUESTIONS + 1):
+        knowledge = model.knowledge(level)
+        knows = rng.random(n_games) < knowledge
+        
+        # Saltar: cambia la pregunta por otra del mismo nivel
+        if model.skip_from is not None and level >= model.skip_from:
+            use = playing & ~knows & skip_available
+            skip_available &= ~use
+            knows[use] = rng.random(int(use.sum())) < knowledge
+        
+        # 50/50: adivinar entre 2 opciones en lugar de 4
+        guess_probability = np.full(n_games, 0.25)
+        if model.fifty_fifty_from is not None and level >= model.fifty_fifty_from:
+            use = playing & ~knows & fifty_available
+            fifty_available &= ~use
+            guess_probability[use] = 0.5
+        
+        correct = knows | (rng.random(n_games) < guess_probability)
+        lost += int((playing & ~correct).sum())
+        playing &= correct
+        score[playing] = PRIZES[level - 1]
+        
+        if level in SAFE_HAVENS and level < MAX_QUESTIONS and level in model.walk_away_at:
+            walk = playing & (rng.random(n_games) < model.walk_away_probability)
+            walked_away += int(walk.sum())
+            playing &= ~walk
+    
+    payouts, counts = np.unique(score, return_counts=True)
+    return {
+        "games": n_games,
+        "histogram": {int(p): int(c) for p, c in zip(payouts, counts)},
+        "won": int(playing.sum()),
+        "lost": lost,
+        "walked_away": walked_away,
+        "fifty_fifty_used": int((~fifty_available).sum()),
+        "skip_used": int((~skip_available).sum()),
+    }
+
+
+def merge_results(results: Iterable[dict]) -> dict:
+    """Combina los resultados de varios lotes"""
+    merged = {"games": 0, "histogram": {}, "won": 0, "lost": 0, "walked_away": 0,
+              "fifty_fifty_used": 0, "skip_used": 0}
+    for result in results:
+        for key in ("games", "won", "lost", "walked_away", "fifty_fifty_used", "skip_used"):
+            merged[key] += result[key]
+        for payout, count in result["histogram"].items():
+            merged["histogram"][payout] = merged["histogram"].get(payout, 0) + count
+    merged["histogram"] = dict(sorted(merged["histogram"].items()))
+    return merged
+
+
+def summarize(result: dict) -> dict:
+    """
+    Calcula la distribución de premios y el costo para la casa.
+    
+    Args:
+        result: Resultado combinado de la simulación
+    
+    Returns:
+        Resultado con media, desviación, percentiles y tasas añadidos
+    
+    Raises:
+        ValueError: Si el resultado no tiene partidas
+    """
+    games = result["games"]
+    if games <= 0:
+        raise ValueError("No hay partidas que resumir")
+    total = sum(payout * count for payout, count in result["histogram"].items())
+    mean = total / games
+    variance = sum(count * (payout - mean) ** 2
+                   for payout, count in result["histogram"].items()) / games
+    
+    percentiles = {}
+    for fraction in (0.5, 0.9, 0.99, 0.999):
+        cumulative = 0
+        for payout, count in result["histogram"].items():
+            cumulative += count
+            if cumulative >= fraction * games:
+                percentiles[f"p{fraction * 100:g}"] = payout
+                break
+    
+    summary = dict(result)
+    summary.update({
+        "expected_payout": mean,
+        "std_payout": variance ** 0.5,
+        "house_cost": total,
+        "percentiles": percentiles,
+        "win_rate": result["won"] / games,
+        "loss_rate": result["lost"] / games,
+        "walk_away_rate": result["walked_away"] / games,
+    })
+    return summary
+
+
+def simulate(n_games: int, model: Optional[PlayerModel] = None,
+             seed: Optional[int] = None, workers: int = 1,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Simula partidas, opcionalmente repartidas en un pool de procesos.
+    
+    Los lotes y sus semillas dependen solo de n_games, chunk_size y seed,
+    así que el resultado no cambia con el número de procesos.
+    
+    Args:
+        n_games: Número total de partidas
+        model: Modelo de jugador (por defecto, PlayerModel())
+        seed: Semilla maestra (None = aleatoria)
+        workers: Número de procesos (1 = en este proceso)
+        chunk_size: Partidas por lote
+    
+    Returns:
+        Resumen de la simulación (ver summarize)
+    
+    Raises:
+        ValueError: Si n_games o chunk_size no son positivos
+    """
+    if n_games <= 0:
+        raise ValueError(f"El número de partidas debe ser positivo: {n_games}")
+    if chunk_size <= 0:
+        raise ValueError(f"El tamaño de lote debe ser positivo: {chunk_size}")
+    _require_numpy()
+    model = model or PlayerModel()
+    sizes = [chunk_size] * (n_games // chunk_size)
+    if n_games % chunk_size:
+        sizes.append(n_games % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, sizes, [model] * len(sizes), seeds))
+    else:
+        results = [simulate_chunk(size, model, s) for size, s in zip(sizes, seeds)]
+    return summarize(merge_results(results))
+
+
+def format_report(summary: dict) -> str:
+    """Reporte legible de una simulación"""
+    games = summary["games"]
+    lines = [
+        f"Partidas simuladas: {games:,}",
+        f"Premio esperado por partida: ${summary['expected_payout']:,.2f} "
+        f"(desviación ${summary['std_payout']:,.2f})",
+        f"Costo total para la casa: ${summary['house_cost']:,}",
+        f"Ganadas: {summary['win_rate']:.2%} | Perdidas: {summary['loss_rate']:.2%} | "
+        f"Retiradas: {summary['walk_away_rate']:.2%}",
+        f"Comodines usados: 50/50 {summary['fifty_fifty_used'] / games:.2%} | "
+        f"Saltar {summary['skip_used'] / games:.2%}",
+        "Percentiles: " + ", ".join(
+            f"{name} ${value:,}" for name, value in summary["percentiles"].items()),
+        "Distribución de premios:",
+    ]
+    for payout, count in summary["histogram"].items():
+        lines.append(f"  ${payout:>9,}: {count / games:8.3%}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Simulador Monte Carlo del juego")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--accuracy", default="0.95,0.8,0.6,0.4",
+                        help="Probabilidad de saber la respuesta por dificultad (1,2,3,...)")
+    parser.add_argument("--walk-away-at", default="",
+                        help="Estaciones seguras donde retirarse, p. ej. 7 o 5,7")
+    parser.add_argument("--walk-probability", type=float, default=1.0)
+    parser.add_argument("--fifty-from", type=int, default=1,
+                        help="Nivel desde el que se usa el 50/50 (0 = nunca)")
+    parser.add_argument("--skip-from", type=int, default=1,
+                        help="Nivel desde el que se salta la pregunta (0 = nunca)")
+    args = parser.parse_args(argv)
+    
+    accuracy = [float(value) for value in args.accuracy.split(",")]
+    model = PlayerModel(
+        accuracy={i + 1: value for i, value in enumerate(accuracy)},
+        walk_away_at=[int(level) for level in args.walk_away_at.split(",") if level],
+        walk_away_probability=args.walk_probability,
+        fifty_fifty_from=args.fifty_from or None,
+        skip_from=args.skip_from or None,
+        difficulties=range(1, len(accuracy) + 1),
+    )
+    try:
+        summary = simulate(args.games, model, args.seed, args.workers, args.chunk_size)
+    except ValueError as e:
+        parser.error(str(e))
+    print(format_report(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Estadísticas de respuestas por pregunta
+
+Cuenta cuántas veces se eligió cada opción de cada pregunta. Alimenta el
+comodín "preguntar al público" con distribuciones reales.
+
+Los contadores funcionan como un G-counter: cada nodo (proceso, kiosco o
+servidor) incrementa solo los suyos. Una instantánea guarda los contadores
+de todos los nodos conocidos. Al combinar instantáneas se toma el máximo de
+cada contador por nodo, así que combinar dos veces la misma no cuenta
+nada doble. Registrar una respuesta y consultar una pregunta cuestan O(1).
+
+Uso:
+    python -m juego.stats merge salida.json nodo1.json nodo2.json
+    python -m juego.stats build data/results.db salida.json
+"""
+import json
+import os
+import socket
+from array import array
+from contextlib import contextmanager
+from typing import Dict, IO, Iterator, Mapping, Optional
+from juego.config import ANSWER_STATS_FILE, DATA_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: un solo proceso por equipo, sin bloqueos
+    fcntl = None
+
+SNAPSHOT_VERSION = 2
+N_OPTIONS = 4
+
+# Nodo -> archivo de bloqueo del hueco que ocupa este proceso; queda abierto
+# (y bloqueado) mientras el proceso vive
+_node_locks: Dict[str, IO] = {}
+
+
+def question_key(question: Mapping) -> str:
+    """Clave con la que se agregan las respuestas de una pregunta"""
+    return question["id"]
+
+
+def default_node(role: str, lock_dir: str = DATA_DIR) -> str:
+    """
+    Identificador estable del proceso local: equipo, tipo y hueco.
+    
+    Dos juegos o servidores a la vez en el mismo equipo (lo normal en un
+    kiosco) no deben compartir contadores, porque cada uno pisaría los del
+    otro. Cada proceso reclama el primer hueco libre con un bloqueo
+    exclusivo sobre un archivo de lock_dir, que mantiene hasta terminar. Al
+    volver a arrancar se reutiliza el mismo hueco, así que el archivo de
+    estadísticas no suma un nodo nuevo por cada arranque.
+    
+    Args:
+        role: Tipo de proceso ("juego", "servidor", ...)
+        lock_dir: Directorio de los archivos de bloqueo
+    """
+    host = socket.gethostname()
+    if fcntl is None:
+        return f"{host}:{role}:0"
+    try:
+        os.makedirs(lock_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Advertencia: no se pudo reservar un nodo en {lock_dir}: {e}")
+        return f"{host}:{role}:{os.getpid()}"
+    slot = 0
+    while True:
+        node = f"{host}:{role}:{slot}"
+        lock_path = os.path.join(lock_dir, f".stats-{host}-{role}-{slot}.lock")
+        try:
+            f = open(lock_path, "a")
+        except OSError as e:
+            print(f"Advertencia: no se pudo reservar un nodo en {lock_dir}: {e}")
+            return f"{host}:{role}:{os.getpid()}"
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Otro proceso (o este mismo) ya ocupa el hueco
+            f.close()
+            slot += 1
+            continue
+        _node_locks[node] = f
+        return node
+
+
+def release_node(node: str) -> None:
+    """Libera el hueco reservado con default_node para que otro proceso lo use"""
+    f = _node_locks.pop(node, None)
+    if f is not None:
+        f.close()
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """Bloqueo exclusivo sobre un archivo auxiliar junto a path"""
+    if fcntl is None:
+        yield
+        return
+    with open(path + ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class AnswerStats:
+    """Contadores de respuestas por pregunta y opción"""
+    
+    __slots__ = ("node", "local", "others", "totals")
+    
+    def __init__(self, node: str = "local"):
+        """
+        Crea contadores vacíos.
+        
+        Args:
+            node: Identificador del nodo dueño de los contadores locales
+        """
+        self.node = node
+        # clave -> array("I") con un contador por opción
+        self.local: Dict[str, array] = {}
+        # nodo -> contadores de ese nodo según la última instantánea vista
+        self.others: Dict[str, Dict[str, array]] = {}
+        # suma de todos los nodos, para consultas en tiempo constante
+        self.totals: Dict[str, array] = {}
+    
+    def __len__(self) -> int:
+        return len(self.totals)
+    
+    def record(self, key: str, option: int) -> None:
+        """
+        Registra que se eligió una opción.
+        
+        Args:
+            key: Clave de la pregunta (ver question_key)
+            option: Índice de la opción elegida (0-3)
+        """
+        counts = self.local.get(key)
+        if counts is None:
+            counts = self.local[key] = array("I", bytes(4 * N_OPTIONS))
+        counts[option] += 1
+        totals = self.totals.get(key)
+        if totals is None:
+            totals = self.totals[key] = array("I", bytes(4 * N_OPTIONS))
+        totals[option] += 1
+    
+    def get(self, key: str) -> Optional[array]:
+        """Contadores combinados de una pregunta (None si nunca se respondió)"""
+        return self.totals.get(key)
+    
+    def _merge_node(self, node: str, counters: Mapping) -> None:
+        if node == self.node:
+            target = self.local
+        else:
+            target = self.others.setdefault(node, {})
+        for key, values in counters.items():
+            current = target.get(key)
+            if current is None:
+                current = target[key] = array("I", bytes(4 * N_OPTIONS))
+            totals = self.totals.get(key)
+            if totals is None:
+                totals = self.totals[key] = array("I", bytes(4 * N_OPTIONS))
+            for i, value in enumerate(values[:N_OPTIONS]):
+                if value > current[i]:
+                    totals[i] += value - current[i]
+                    current[i] = value
+    
+    def merge(self, other: "AnswerStats") -> None:
+        """
+        Incorpora los contadores de otro nodo (o de otra copia de este).
+        
+        Args:
+            other: Estadísticas a combinar
+        """
+        self.merge_snapshot(other.snapshot())
+    
+    def snapshot(self) -> dict:
+        """Contadores de todos los nodos como diccionario serializable"""
+        nodes = {node: {key: list(values) for key, values in counters.items()}
+                 for node, counters in self.others.items()}
+        nodes[self.node] = {key: list(values) for key, values in self.local.items()}
+        return {"version": SNAPSHOT_VERSION, "nodes": nodes}
+    
+    def merge_snapshot(self, data: Mapping) -> None:
+        """
+        Incorpora una instantánea creada con snapshot().
+        
+        Args:
+            data: Instantánea leída de disco o recibida de otro nodo
+        """
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Versión de estadísticas no soportada: {data.get('version')}")
+        for node, counters in data["nodes"].items():
+            self._merge_node(node, counters)
+    
+    def save(self, path: str = ANSWER_STATS_FILE) -> None:
+        """
+        Guarda una instantánea de forma atómica.
+        
+        Antes se combina la instantánea que ya está en disco, así que no se
+        pierden los contadores que otros procesos guardaron mientras tanto.
+        La lectura, la combinación y el reemplazo se hacen con un bloqueo
+        exclusivo (path + ".lock"), para que dos procesos que guardan a la vez
+        no se pisen.
+        
+        Args:
+            path: Ruta del archivo JSON
+        """
+        with _locked(path):
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        self.merge_snapshot(json.load(f))
+                except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                    print(f"Advertencia: no se combinaron las estadísticas de {path}: {e}")
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str = ANSWER_STATS_FILE, node: str = "local") -> "AnswerStats":
+        """
+        Carga una instantánea; si no existe o es inválida, empieza vacía.
+        
+        Args:
+            path: Ruta del archivo JSON
+            node: Identificador del nodo local
+        """
+        stats = cls(node)
+        if not os.path.exists(path):
+            return stats
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stats.merge_snapshot(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Error al cargar las estadísticas de {path}: {e}")
+            return cls(node)
+        return stats
+    
+    @classmethod
+    def from_results(cls, store, node: str = "resultados") -> "AnswerStats":
+        """
+        Reconstruye los contadores a partir del registro de resultados.
+        
+        Args:
+            store: ResultsStore con las respuestas guardadas
+            node: Nodo al que se atribuyen los contadores
+        """
+        stats = cls(node)
+        counters: Dict[str, list] = {}
+        for key, chosen, count in store.connection.execute(
+                "SELECT question_id, chosen, COUNT(*) FROM answers "
+                "WHERE question_id IS NOT NULL GROUP BY question_id, chosen"):
+            option = "ABCD".find(chosen)
+            if option >= 0:
+                counters.setdefault(key, [0] * N_OPTIONS)[option] = count
+        stats._merge_node(node, counters)
+        return stats
+
+
+def main(argv=None) -> None:
+    """Punto de entrada de la línea de comandos"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Estadísticas de respuestas")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="Combina instantáneas de varios nodos")
+    merge.add_argument("output")
+    merge.add_argument("inputs", nargs="+")
+    build = commands.add_parser("build", help="Reconstruye desde el registro de resultados")
+    build.add_argument("results_db")
+    build.add_argument("output")
+    args = parser.parse_args(argv)
+    
+    if args.command == "merge":
+        stats = AnswerStats("combinado")
+        for path in args.inputs:
+            with open(path, "r", encoding="utf-8") as f:
+                stats.merge_snapshot(json.load(f))
+    else:
+        from juego.results import ResultsStore
+        store = ResultsStore(args.results_db)
+        stats = AnswerStats.from_results(store)
+        store.close()
+    stats.save(args.output)
+    print(f"{len(stats)} preguntas guardadas en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,121 @@
 Interfaz gráfica del juego
 """
 import pygame
+from collections import OrderedDict
+from itertools import islice
 from typing import Optional, Tuple
 from juego.config import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, COLOR_BACKGROUND, COLOR_TEXT,
+    COLOR_BACKGROUND, COLOR_TEXT,
     COLOR_PRIMARY, COLOR_SECONDARY, COLOR_SUCCESS, COLOR_ERROR,
     COLOR_OPTION_BG, COLOR_OPTION_HOVER, COLOR_OPTION_SELECTED,
-    FONT_TITLE_SIZE, FONT_QUESTION_SIZE, FONT_OPTION_SIZE,
-    FONT_SCORE_SIZE, FONT_INFO_SIZE, PRIZES, SAFE_HAVENS
+    FONT_FAMILY, PRIZES, SAFE_HAVENS,
+    TEXT_CACHE_SIZE, QUESTION_TEXT_CACHE_SIZE, PREPARED_QUESTIONS, DIRTY_RECT_RENDERING,
+    WRAP_CACHE_SIZE, KEY_FIFTY_FIFTY, KEY_SKIP_QUESTION, KEY_ASK_AUDIENCE
 )
-from juego.utils import wrap_text, draw_text_centered, draw_button
+from juego.utils import wrap_text, prewrap_texts, draw_button
+from juego.fonts import get_font
+from juego.layout import Layout, layout_for, scaled_image
+
+# Estados de un botón de opción (columnas del atlas)
+OPTION_NORMAL = 0
+OPTION_SELECTED = 1
+OPTION_REMOVED = 2
+
+
+class TextCache:
+    """Caché LRU de superficies de texto ya renderizadas"""
+    
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_size: Número máximo de superficies almacenadas
+        """
+        self.max_size = max_size
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Obtiene la superficie del texto, renderizándola solo si no está en caché.
+        
+        Args:
+            font: Fuente de pygame
+            text: Texto a renderizar
+            color: Color del texto
+        
+        Returns:
+            Superficie con el texto renderizado
+        """
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def put(self, font: pygame.font.Font, text: str, color: tuple,
+            surface: pygame.Surface) -> None:
+        """
+        Guarda una superficie renderizada de antemano.
+        
+        Args:
+            font: Fuente con la que se renderizó
+            text: Texto renderizado
+            color: Color del texto
+            surface: Superficie resultante
+        """
+        key = (font, text, color)
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Vacía la caché"""
+        self._surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+class OptionAtlas:
+    """Botones de las opciones de una pregunta en todos sus estados, en una superficie"""
+    
+    __slots__ = ("labels", "surface", "width", "height")
+    
+    def __init__(self, labels: tuple, surface: pygame.Surface, width: int, height: int):
+        """
+        Inicializa el atlas.
+        
+        Args:
+            labels: Texto de cada opción ("" si ya estaba eliminada)
+            surface: Superficie con una fila por opción y una columna por estado
+            width: Ancho de un botón
+            height: Alto de un botón
+        """
+        self.labels = labels
+        self.surface = surface
+        self.width = width
+        self.height = height
+    
+    def matches(self, options: list) -> bool:
+        """Indica si el atlas sirve para estas opciones (las eliminadas valen)"""
+        return len(options) == len(self.labels) and all(
+            not option or option == label for option, label in zip(options, self.labels))
+    
+    def cell(self, index: int, state: int) -> pygame.Rect:
+        """Área del atlas con el botón de una opción en un estado"""
+        return pygame.Rect(state * self.width, index * self.height, self.width, self.height)
 
 
 class GameUI:
@@ -21,34 +127,278 @@ class GameUI:
         Inicializa la UI del juego.
         
         Args:
-            screen: Superficie de pygame donde dibujar
+            screen: Superficie de pygame donde dibujar (la interfaz se adapta
+                    a su tamaño)
         """
         self.screen = screen
-        self.width = WINDOW_WIDTH
-        self.height = WINDOW_HEIGHT
         
-        # Cargar fuentes
-        self.font_title = pygame.font.SysFont("Arial", FONT_TITLE_SIZE, bold=True)
-        self.font_question = pygame.font.SysFont("Arial", FONT_QUESTION_SIZE)
-        self.font_option = pygame.font.SysFont("Arial", FONT_OPTION_SIZE)
-        self.font_score = pygame.font.SysFont("Arial", FONT_SCORE_SIZE, bold=True)
-        self.font_info = pygame.font.SysFont("Arial", FONT_INFO_SIZE)
+        # Cachés de texto: textos estáticos y textos de la pregunta actual
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        self.question_cache = TextCache(QUESTION_TEXT_CACHE_SIZE)
+        
+        # Rectángulos de las opciones para detectar clics
+        self.option_rects = []
+        
+        # Superficies prerenderizadas: botones de la pregunta actual, escalera
+        # de premios del nivel actual y franja de comodines por estado
+        self._option_atlas: Optional[OptionAtlas] = None
+        self._ladder: Optional[pygame.Surface] = None
+        self._ladder_level = None
+        self._lifeline_strips = {}
+        
+        # Preguntas candidatas preparadas mientras el jugador piensa:
+        # texto -> (líneas renderizadas, atlas de botones)
+        self._prepared: "OrderedDict[str, tuple]" = OrderedDict()
+        self.prepared_hits = 0
+        self.prepared_misses = 0
+        
+        # Estado del renderizado por regiones sucias
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self._screen_key = None
+        self._region_states = {}
+        
+        # Posiciones, fuentes e imagen del título para el tamaño de la pantalla
+        self._apply_layout(layout_for(screen.get_size()))
+    
+    def _apply_layout(self, layout: Layout) -> None:
+        """Adopta la disposición de una resolución y descarta lo dibujado para otra"""
+        self.layout = layout
+        self.width = layout.width
+        self.height = layout.height
+        
+        # Fuentes compartidas del registro (cada tamaño se carga una vez por proceso)
+        self.font_title = get_font(FONT_FAMILY, layout.font_title_size, bold=True)
+        self.font_question = get_font(FONT_FAMILY, layout.font_question_size)
+        self.font_option = get_font(FONT_FAMILY, layout.font_option_size)
+        self.font_score = get_font(FONT_FAMILY, layout.font_score_size, bold=True)
+        self.font_info = get_font(FONT_FAMILY, layout.font_info_size)
         
         # Cargar imagen del título
         self.title_image = self._load_title_image()
         
-        # Rectángulos de las opciones para detectar clics
-        self.option_rects = []
+        self.question_cache.clear()
+        self._option_atlas = None
+        self._ladder = None
+        self._ladder_level = None
+        self._lifeline_strips = {}
+        self._prepared.clear()
+        self._regions = layout.regions
+    
+    def resize(self, screen: pygame.Surface) -> None:
+        """
+        Adapta la interfaz a la superficie actual (p. ej. tras cambiar el
+        tamaño de la ventana) y fuerza un redibujado completo.
+        
+        Args:
+            screen: Superficie de pygame donde dibujar
+        """
+        self.screen = screen
+        if screen.get_size() != (self.width, self.height):
+            self._apply_layout(layout_for(screen.get_size()))
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Fuerza un redibujado completo en el próximo cuadro"""
+        self._screen_key = None
+        self._region_states = {}
+    
+    def _begin_static_screen(self, key: tuple) -> bool:
+        """
+        Indica si una pantalla estática debe redibujarse.
+        
+        Args:
+            key: Identificador de la pantalla y de su contenido
+        
+        Returns:
+            True si el contenido cambió desde el último cuadro
+        """
+        if self.dirty_rendering and key == self._screen_key:
+            return False
+        self._screen_key = key
+        self._region_states = {}
+        return True
+    
+    def prewrap_questions(self, questions) -> None:
+        """
+        Calcula de antemano las líneas de un lote de preguntas.
+        
+        Solo se procesan las primeras WRAP_CACHE_SIZE: el caché de líneas no
+        guarda más y el resto se descartaría antes de usarse.
+        
+        Args:
+            questions: Textos de las preguntas (p. ej. las repartidas y las
+                       reservadas por prefetch)
+        """
+        prewrap_texts(islice(questions, WRAP_CACHE_SIZE), self.font_question,
+                      self.layout.question_width)
+    
+    def on_question_changed(self, options: Optional[list] = None,
+                            question: Optional[str] = None) -> None:
+        """
+        Invalida los textos cacheados de la pregunta anterior.
+        
+        Si la pregunta nueva se preparó con prerender_question(), sus
+        superficies pasan a ser las actuales sin renderizar nada.
+        
+        Args:
+            options: Opciones de la pregunta nueva, para prerenderizar sus botones
+            question: Texto de la pregunta nueva
+        """
+        self.question_cache.clear()
+        prepared = self._prepared.pop(question, None) if question is not None else None
+        if prepared is not None:
+            self.prepared_hits += 1
+            lines, atlas = prepared
+            for line, surface in lines:
+                self.question_cache.put(self.font_question, line, COLOR_TEXT, surface)
+            self._option_atlas = atlas
+            return
+        if question is not None:
+            self.prepared_misses += 1
+        if options is not None:
+            self.prerender_options(options)
+    
+    def prerender_question(self, question: str, options: list) -> None:
+        """
+        Prepara una pregunta que aún no está en pantalla.
+        
+        Args:
+            question: Texto de la pregunta
+            options: Opciones de la pregunta
+        """
+        if question in self._prepared:
+            self._prepared.move_to_end(question)
+            return
+        lines = [
+            (line, self.font_question.render(line, True, COLOR_TEXT))
+            for line in wrap_text(question, self.font_question, self.layout.question_width)
+        ]
+        self._prepared[question] = (lines, self._build_option_atlas(options))
+        if len(self._prepared) > PREPARED_QUESTIONS:
+            self._prepared.popitem(last=False)
+    
+    def prerender_options(self, options: list) -> OptionAtlas:
+        """
+        Construye (o reutiliza) el atlas de botones de una pregunta.
+        
+        Args:
+            options: Opciones de la pregunta
+        
+        Returns:
+            Atlas con cada opción en estado normal, seleccionado y eliminado
+        """
+        atlas = self._option_atlas
+        if atlas is None or not atlas.matches(options):
+            atlas = self._option_atlas = self._build_option_atlas(options)
+        return atlas
+    
+    def _build_option_atlas(self, options: list) -> OptionAtlas:
+        """Renderiza los botones de unas opciones en todos sus estados"""
+        width, height = self._option_rect(0).size
+        border = max(1, self.layout.px(3))
+        surface = pygame.Surface((width * 3, height * len(options)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(COLOR_BACKGROUND)
+        for i, option in enumerate(options):
+            # Eliminada por 50/50: solo el contorno del hueco
+            removed = pygame.Rect(OPTION_REMOVED * width, i * height, width, height)
+            pygame.draw.rect(surface, COLOR_OPTION_BG, removed, 1)
+            if not option:
+                continue
+            
+            text_surface = self.font_option.render(f"{'ABCD'[i]}. {option}", True, COLOR_TEXT)
+            for state, bg_color, border_color in (
+                    (OPTION_NORMAL, COLOR_OPTION_BG, COLOR_TEXT),
+                    (OPTION_SELECTED, COLOR_OPTION_SELECTED, COLOR_PRIMARY)):
+                cell = pygame.Rect(state * width, i * height, width, height)
+                pygame.draw.rect(surface, bg_color, cell)
+                pygame.draw.rect(surface, border_color, cell, border)
+                surface.blit(text_surface, text_surface.get_rect(center=cell.center))
+        
+        return OptionAtlas(tuple(options), surface, width, height)
+    
+    def _ladder_panel(self, level: int) -> pygame.Surface:
+        """Escalera de premios con el nivel actual resaltado (se rehace al cambiar de nivel)"""
+        if self._ladder is not None and self._ladder_level == level:
+            return self._ladder
+        
+        layout = self.layout
+        row_height = layout.ladder_row_height
+        surface = pygame.Surface(layout.ladder_rect.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(COLOR_BACKGROUND)
+        for n in range(len(PRIZES), 0, -1):
+            row = pygame.Rect(0, (len(PRIZES) - n) * row_height,
+                              layout.ladder_rect.width, row_height)
+            if n == level:
+                pygame.draw.rect(surface, COLOR_OPTION_SELECTED, row)
+            if n in SAFE_HAVENS:
+                color = COLOR_SUCCESS
+            elif n < level:
+                color = COLOR_SECONDARY
+            else:
+                color = COLOR_TEXT
+            number_surface = self._render(self.font_info, str(n), color)
+            surface.blit(number_surface, number_surface.get_rect(
+                midleft=(row.x + layout.ladder_padding, row.centery)))
+            prize_surface = self._render(self.font_info, f"${PRIZES[n - 1]:,}", color)
+            surface.blit(prize_surface, prize_surface.get_rect(
+                midright=(row.right - layout.ladder_padding, row.centery)))
+        pygame.draw.rect(surface, COLOR_OPTION_BG, surface.get_rect(), max(1, layout.px(2)))
+        
+        self._ladder = surface
+        self._ladder_level = level
+        return surface
+    
+    def _lifeline_strip(self, used: tuple) -> pygame.Surface:
+        """
+        Franja con los comodines coloreados según si se usaron.
+        
+        Args:
+            used: (50/50, saltar, público) usados
+        """
+        strip = self._lifeline_strips.get(used)
+        if strip is not None:
+            return strip
+        
+        labels = zip(self.layout.lifeline_offsets, ("50/50", "Saltar", "Público"))
+        surfaces = [
+            (x, self._render(self.font_info, text, COLOR_ERROR if is_used else COLOR_SUCCESS))
+            for (x, text), is_used in zip(labels, used)
+        ]
+        x, last = surfaces[-1]
+        strip = pygame.Surface((x + last.get_width(), self.font_info.get_linesize()))
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()
+        strip.fill(COLOR_BACKGROUND)
+        for x, text_surface in surfaces:
+            strip.blit(text_surface, (x, 0))
+        self._lifeline_strips[used] = strip
+        return strip
+    
+    def _render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Renderiza un texto estático usando la caché"""
+        return self.text_cache.render(font, text, color)
+    
+    def _draw_centered(self, text: str, font: pygame.font.Font, color: tuple,
+                       y: int, cache: Optional[TextCache] = None) -> None:
+        """Dibuja texto centrado horizontalmente usando la caché"""
+        if cache is None:
+            cache = self.text_cache
+        text_surface = cache.render(font, text, color)
+        self.screen.blit(text_surface, text_surface.get_rect(center=(self.width // 2, y)))
     
     def _load_title_image(self) -> Optional[pygame.Surface]:
-        """Carga la imagen del título"""
+        """Carga la imagen del título escalada a la resolución actual"""
         try:
             import os
             script_dir = os.path.dirname(os.path.abspath(__file__))
             title_path = os.path.join(script_dir, "title.png")
             if os.path.exists(title_path):
-                image = pygame.image.load(title_path)
-                return pygame.transform.scale(image, (300, 300))
+                size = self.layout.title_image_size
+                return scaled_image(title_path, (size, size))
             else:
                 print(f"Advertencia: No se encontró la imagen {title_path}")
                 return None
@@ -58,7 +408,9 @@ class GameUI:
     
     def draw_game_screen(self, question: str, options: list, selected_option: str,
                         current_level: int, score: int, player_name: str,
-                        lifeline_fifty_used: bool, lifeline_skip_used: bool) -> None:
+                        lifeline_fifty_used: bool, lifeline_skip_used: bool,
+                        lifeline_audience_used: bool = False,
+                        audience: Optional[list] = None) -> None:
         """
         Dibuja la pantalla principal del juego.
         
@@ -71,140 +423,221 @@ class GameUI:
             player_name: Nombre del jugador
             lifeline_fifty_used: Si el comodín 50/50 fue usado
             lifeline_skip_used: Si el comodín de saltar fue usado
+            lifeline_audience_used: Si el comodín del público fue usado
+            audience: Porcentajes del público por opción (None si no se pidieron)
         """
+        scene = (question, options, selected_option, current_level, score,
+                 player_name, lifeline_fifty_used, lifeline_skip_used,
+                 lifeline_audience_used, audience)
+        states = {
+            "level": (current_level,),
+            "score": (score,),
+            "question": (question,),
+            "ladder": (current_level,),
+            "footer": (player_name, lifeline_fifty_used, lifeline_skip_used,
+                       lifeline_audience_used),
+        }
+        for i, option in enumerate(options):
+            states[f"option_{i}"] = (option, "ABCD"[i] == selected_option,
+                                     audience[i] if audience else None)
+        
+        # Primer cuadro de la pantalla de juego: dibujado completo
+        if not self.dirty_rendering or self._screen_key != "game":
+            self._screen_key = "game"
+            self._region_states = states
+            self._draw_game_scene(*scene)
+            pygame.display.update()
+            return
+        
+        dirty = [name for name, state in states.items()
+                 if self._region_states.get(name) != state]
+        self._region_states = states
+        
+        # Nada cambió: no se dibuja ni se actualiza la pantalla
+        if not dirty:
+            return
+        
+        # Cada región sucia se limpia y se redibujan solo los elementos que
+        # la tocan (normalmente, solo el suyo)
+        self.option_rects = [(self._option_rect(i), letter)
+                             for i, (letter, option) in enumerate(zip("ABCD", options))
+                             if option]
+        atlas = self.prerender_options(options)
+        dirty_rects = [self._regions[name] for name in dirty]
+        for rect in dirty_rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(COLOR_BACKGROUND, rect)
+            if self.title_image and self._title_rect().colliderect(rect):
+                self._draw_title()
+            for name, region in self._regions.items():
+                if region.colliderect(rect):
+                    self._draw_region(name, atlas, *scene)
+        self.screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+    
+    def _draw_region(self, name: str, atlas: OptionAtlas, question: str, options: list,
+                     selected_option: str, current_level: int, score: int,
+                     player_name: str, lifeline_fifty_used: bool, lifeline_skip_used: bool,
+                     lifeline_audience_used: bool = False,
+                     audience: Optional[list] = None) -> None:
+        """Dibuja el elemento dueño de una región de la pantalla de juego"""
+        if name == "level":
+            self._draw_level_info(current_level)
+        elif name == "score":
+            self._draw_score(score)
+        elif name == "question":
+            self._draw_question(question)
+        elif name == "ladder":
+            self.screen.blit(self._ladder_panel(current_level), self.layout.ladder_rect)
+        elif name == "footer":
+            self._draw_player_info(player_name, lifeline_fifty_used, lifeline_skip_used,
+                                   lifeline_audience_used)
+        else:
+            i = int(name[len("option_"):])
+            if i < len(options):
+                self._draw_option(atlas, i, options[i], selected_option, audience)
+    
+    def _draw_game_scene(self, question: str, options: list, selected_option: str,
+                         current_level: int, score: int, player_name: str,
+                         lifeline_fifty_used: bool, lifeline_skip_used: bool,
+                         lifeline_audience_used: bool = False,
+                         audience: Optional[list] = None) -> None:
+        """Dibuja todos los elementos de la pantalla de juego"""
         # Limpiar pantalla
         self.screen.fill(COLOR_BACKGROUND)
         
         # Dibujar título
         if self.title_image:
-            title_rect = self.title_image.get_rect(midtop=(self.width // 2, 20))
-            self.screen.blit(self.title_image, title_rect)
+            self._draw_title()
         
         # Dibujar información del nivel y premio
-        self._draw_level_info(current_level, score)
+        self._draw_level_info(current_level)
+        self._draw_score(score)
+        self.screen.blit(self._ladder_panel(current_level), self.layout.ladder_rect)
         
         # Dibujar pregunta
         self._draw_question(question)
         
         # Dibujar opciones
-        self._draw_options(options, selected_option)
+        self._draw_options(options, selected_option, audience)
         
         # Dibujar información del jugador y comodines
-        self._draw_player_info(player_name, lifeline_fifty_used, lifeline_skip_used)
-        
-        # Actualizar pantalla
-        pygame.display.update()
+        self._draw_player_info(player_name, lifeline_fifty_used, lifeline_skip_used,
+                               lifeline_audience_used)
+    
+    def _title_rect(self) -> pygame.Rect:
+        """Rectángulo de la imagen del título en la pantalla de juego"""
+        return self.title_image.get_rect(midtop=(self.width // 2, self.layout.title_top))
     
-    def _draw_level_info(self, level: int, score: int) -> None:
+    def _draw_title(self) -> None:
+        """Dibuja la imagen del título en la pantalla de juego"""
+        self.screen.blit(self.title_image, self._title_rect())
+    
+    def _draw_level_info(self, level: int) -> None:
         """Dibuja la información del nivel y premio"""
         # Nivel actual
         level_text = f"Pregunta {level}/10"
-        level_surface = self.font_score.render(level_text, True, COLOR_PRIMARY)
-        self.screen.blit(level_surface, (50, 50))
+        level_surface = self._render(self.font_score, level_text, COLOR_PRIMARY)
+        self.screen.blit(level_surface, self.layout.level_pos)
         
         # Premio actual
         if level <= len(PRIZES):
             prize = PRIZES[level - 1]
             prize_text = f"Premio: ${prize:,}"
-            prize_surface = self.font_score.render(prize_text, True, COLOR_SECONDARY)
-            self.screen.blit(prize_surface, (50, 90))
+            prize_surface = self._render(self.font_score, prize_text, COLOR_SECONDARY)
+            self.screen.blit(prize_surface, self.layout.prize_pos)
             
             # Indicador de estación segura
             if level in SAFE_HAVENS:
                 safe_text = "ESTACIÓN SEGURA"
-                safe_surface = self.font_info.render(safe_text, True, COLOR_SUCCESS)
-                self.screen.blit(safe_surface, (50, 130))
-        
-        # Puntaje acumulado
+                safe_surface = self._render(self.font_info, safe_text, COLOR_SUCCESS)
+                self.screen.blit(safe_surface, self.layout.safe_haven_pos)
+    
+    def _draw_score(self, score: int) -> None:
+        """Dibuja el dinero acumulado"""
         score_text = f"Dinero acumulado: ${score:,}"
-        score_surface = self.font_score.render(score_text, True, COLOR_TEXT)
-        score_rect = score_surface.get_rect(topright=(self.width - 50, 50))
+        score_surface = self._render(self.font_score, score_text, COLOR_TEXT)
+        score_rect = score_surface.get_rect(topright=self.layout.score_topright)
         self.screen.blit(score_surface, score_rect)
     
     def _draw_question(self, question: str) -> None:
-        """Dibuja la pregunta"""
-        question_lines = wrap_text(question, self.font_question, self.width - 100)
-        start_y = 200
-        
+        """Dibuja la pregunta, recortada a su región"""
+        question_lines = wrap_text(question, self.font_question, self.layout.question_width)
+        start_y = self.layout.question_top
+        
+        # Una pregunta muy larga no debe pisar las regiones de abajo: nada
+        # las invalidaría al cambiar de pregunta
+        clip = self.screen.get_clip()
+        self.screen.set_clip(clip.clip(self._regions["question"]))
         for i, line in enumerate(question_lines):
-            draw_text_centered(
-                self.screen, line, self.font_question,
-                COLOR_TEXT, start_y + i * self.font_question.get_linesize(),
-                self.width
+            self._draw_centered(
+                line, self.font_question, COLOR_TEXT,
+                start_y + i * self.font_question.get_linesize(),
+                self.question_cache
             )
+        self.screen.set_clip(clip)
     
-    def _draw_options(self, options: list, selected_option: str) -> None:
-        """Dibuja las opciones de respuesta"""
-        letters = ["A", "B", "C", "D"]
+    def _option_rect(self, index: int) -> pygame.Rect:
+        """Rectángulo de la opción en la posición indicada (calculado por la disposición)"""
+        return self.layout.option_rects[index]
+    
+    def _draw_options(self, options: list, selected_option: str,
+                      audience: Optional[list] = None) -> None:
+        """Dibuja las opciones de respuesta (y los votos del público, si los hay)"""
+        atlas = self.prerender_options(options)
         self.option_rects = []
         
-        # Calcular posiciones
-        option_width = 400
-        option_height = 80
-        spacing = 20
-        start_x = (self.width - (2 * option_width + spacing)) // 2
-        start_y = 400
-        
-        for i, (letter, option) in enumerate(zip(letters, options)):
-            if not option:  # Opción eliminada por 50/50
-                continue
-            
-            # Calcular posición
-            row = i // 2
-            col = i % 2
-            x = start_x + col * (option_width + spacing)
-            y = start_y + row * (option_height + spacing)
-            
-            # Color según selección
-            if letter == selected_option:
-                bg_color = COLOR_OPTION_SELECTED
-                border_color = COLOR_PRIMARY
-            else:
-                bg_color = COLOR_OPTION_BG
-                border_color = COLOR_TEXT
-            
-            # Dibujar botón de opción
-            option_rect = pygame.Rect(x, y, option_width, option_height)
-            pygame.draw.rect(self.screen, bg_color, option_rect)
-            pygame.draw.rect(self.screen, border_color, option_rect, 3)
-            
-            # Dibujar texto
-            option_text = f"{letter}. {option}"
-            text_surface = self.font_option.render(option_text, True, COLOR_TEXT)
-            text_rect = text_surface.get_rect(center=option_rect.center)
-            self.screen.blit(text_surface, text_rect)
-            
-            self.option_rects.append((option_rect, letter))
+        for i, (letter, option) in enumerate(zip("ABCD", options)):
+            self._draw_option(atlas, i, option, selected_option, audience)
+            if option:
+                self.option_rects.append((self._option_rect(i), letter))
+    
+    def _draw_option(self, atlas: OptionAtlas, index: int, option: str,
+                     selected_option: str, audience: Optional[list] = None) -> None:
+        """Dibuja una opción desde el atlas (y sus votos del público, si los hay)"""
+        option_rect = self._option_rect(index)
+        if not option:  # Opción eliminada por 50/50
+            self.screen.blit(atlas.surface, option_rect, atlas.cell(index, OPTION_REMOVED))
+            return
+        
+        state = OPTION_SELECTED if "ABCD"[index] == selected_option else OPTION_NORMAL
+        self.screen.blit(atlas.surface, option_rect, atlas.cell(index, state))
+        
+        # Votos del público: barra inferior y porcentaje a la derecha
+        if audience:
+            layout = self.layout
+            inset = layout.audience_inset
+            bar_width = (option_rect.width - 2 * inset) * audience[index] // 100
+            pygame.draw.rect(self.screen, COLOR_SECONDARY,
+                             (option_rect.x + inset,
+                              option_rect.bottom - layout.audience_bar_bottom,
+                              bar_width, layout.audience_bar_height))
+            percent_surface = self._render(self.font_info, f"{audience[index]}%",
+                                           COLOR_SECONDARY)
+            percent_rect = percent_surface.get_rect(
+                midright=(option_rect.right - layout.audience_text_right,
+                          option_rect.centery))
+            self.screen.blit(percent_surface, percent_rect)
     
     def _draw_player_info(self, player_name: str, lifeline_fifty_used: bool,
-                         lifeline_skip_used: bool) -> None:
+                         lifeline_skip_used: bool,
+                         lifeline_audience_used: bool = False) -> None:
         """Dibuja información del jugador y comodines"""
         # Nombre del jugador
         name_text = f"Jugador: {player_name}"
-        name_surface = self.font_info.render(name_text, True, COLOR_TEXT)
-        name_rect = name_surface.get_rect(midbottom=(self.width // 2, self.height - 10))
+        name_surface = self._render(self.font_info, name_text, COLOR_TEXT)
+        name_rect = name_surface.get_rect(midbottom=self.layout.name_midbottom)
         self.screen.blit(name_surface, name_rect)
         
-        # Comodines
-        y_pos = self.height - 50
-        x_start = 50
-        
-        # Comodín 50/50
-        fifty_text = "50/50"
-        fifty_color = COLOR_ERROR if lifeline_fifty_used else COLOR_SUCCESS
-        fifty_surface = self.font_info.render(fifty_text, True, fifty_color)
-        self.screen.blit(fifty_surface, (x_start, y_pos))
-        
-        # Comodín saltar pregunta
-        skip_text = "Saltar"
-        skip_color = COLOR_ERROR if lifeline_skip_used else COLOR_SUCCESS
-        skip_surface = self.font_info.render(skip_text, True, skip_color)
-        self.screen.blit(skip_surface, (x_start + 100, y_pos))
+        # Comodines: verde si están disponibles, rojo si ya se usaron
+        used = (lifeline_fifty_used, lifeline_skip_used, lifeline_audience_used)
+        self.screen.blit(self._lifeline_strip(used), self.layout.lifelines_pos)
         
         # Instrucciones
-        instructions = "Presiona A/B/C/D para seleccionar | Enter para confirmar | Z: 50/50 | X: Saltar"
-        inst_surface = self.font_info.render(instructions, True, COLOR_TEXT)
-        inst_rect = inst_surface.get_rect(bottomright=(self.width - 50, self.height - 10))
+        instructions = ("Presiona A/B/C/D para seleccionar | Enter para confirmar | "
+                        "Z: 50/50 | X: Saltar | V: Público")
+        inst_surface = self._render(self.font_info, instructions, COLOR_TEXT)
+        inst_rect = inst_surface.get_rect(bottomright=self.layout.instructions_bottomright)
         self.screen.blit(inst_surface, inst_rect)
     
     def draw_start_screen(self, player_name: str) -> bool:
@@ -213,47 +646,53 @@ class GameUI:
         
         Args:
             player_name: Nombre del jugador
-            
+        
         Returns:
             True si el usuario quiere comenzar
         """
+        if not self._begin_static_screen(("start", player_name)):
+            return True
+        
+        px, y = self.layout.px, self.layout.y
         self.screen.fill(COLOR_BACKGROUND)
         
         # Título
         if self.title_image:
-            title_rect = self.title_image.get_rect(center=(self.width // 2, 200))
+            title_rect = self.title_image.get_rect(center=(self.width // 2, y(200)))
             self.screen.blit(self.title_image, title_rect)
         
         # Bienvenida
         welcome_text = f"¡Bienvenido, {player_name}!"
-        draw_text_centered(self.screen, welcome_text, self.font_title,
-                          COLOR_PRIMARY, 350, self.width)
+        self._draw_centered(welcome_text, self.font_title, COLOR_PRIMARY, y(350))
         
         # Reglas
         rules = [
             "Responde 10 preguntas correctamente para ganar $1,000,000",
-            "Puedes usar los comodines 50/50 (Z) y Saltar pregunta (X)",
+            f"Comodines: 50/50 ({KEY_FIFTY_FIFTY.upper()}), "
+            f"Saltar pregunta ({KEY_SKIP_QUESTION.upper()}) y "
+            f"Preguntar al público ({KEY_ASK_AUDIENCE.upper()})",
             "En las preguntas 5 y 7 puedes retirarte con tu premio",
             "¡Buena suerte!"
         ]
         
-        y_start = 450
+        y_start = y(450)
         for i, rule in enumerate(rules):
-            draw_text_centered(self.screen, rule, self.font_info,
-                             COLOR_TEXT, y_start + i * 40, self.width)
+            self._draw_centered(rule, self.font_info, COLOR_TEXT, y_start + i * y(40))
         
         # Botón de comenzar
+        start_text = "Presiona ESPACIO para comenzar"
         start_button = draw_button(
-            self.screen, "Presiona ESPACIO para comenzar",
-            self.font_option, self.width // 2 - 250, 650, 500, 60,
-            COLOR_OPTION_BG, COLOR_PRIMARY
+            self.screen, start_text,
+            self.font_option, self.width // 2 - px(250), y(650), px(500), px(60),
+            COLOR_OPTION_BG, COLOR_PRIMARY,
+            text_surface=self._render(self.font_option, start_text, COLOR_PRIMARY)
         )
         
         pygame.display.update()
         return start_button
     
     def draw_end_screen(self, won: bool, score: int, correct_answers: int,
-                       player_name: str) -> None:
+                       player_name: str, standings: Optional[dict] = None) -> None:
         """
         Dibuja la pantalla de fin de juego.
         
@@ -262,7 +701,15 @@ class GameUI:
             score: Puntaje final
             correct_answers: Número de respuestas correctas
             player_name: Nombre del jugador
+            standings: Puesto del jugador y mejores jugadores (ver
+                       Leaderboard.standings), o None para no mostrarlos
         """
+        ranking_lines = self._standings_lines(standings) if standings else ()
+        if not self._begin_static_screen(("end", won, score, correct_answers, player_name,
+                                          ranking_lines)):
+            return
+        
+        y = self.layout.y
         self.screen.fill(COLOR_BACKGROUND)
         
         if won:
@@ -274,20 +721,36 @@ class GameUI:
             color = COLOR_ERROR
             message = f"Has respondido {correct_answers} preguntas correctamente"
         
-        draw_text_centered(self.screen, title_text, self.font_title,
-                          color, 200, self.width)
+        self._draw_centered(title_text, self.font_title, color, y(200))
         
-        draw_text_centered(self.screen, message, self.font_question,
-                          COLOR_TEXT, 300, self.width)
+        self._draw_centered(message, self.font_question, COLOR_TEXT, y(300))
         
-        draw_text_centered(self.screen, f"Puntaje final: ${score:,}",
-                          self.font_score, COLOR_PRIMARY, 400, self.width)
+        self._draw_centered(f"Puntaje final: ${score:,}",
+                            self.font_score, COLOR_PRIMARY, y(400))
         
-        draw_text_centered(self.screen, "Presiona ESC para salir",
-                          self.font_info, COLOR_TEXT, 600, self.width)
+        for i, line in enumerate(ranking_lines):
+            self._draw_centered(line, self.font_info, COLOR_TEXT, y(470) + i * y(40))
+        
+        self._draw_centered("Presiona ESC para salir", self.font_info, COLOR_TEXT, y(600))
         
         pygame.display.update()
     
+    @staticmethod
+    def _standings_lines(standings: dict) -> tuple:
+        """Textos de la clasificación para la pantalla final"""
+        lines = []
+        if standings["rank"] is not None:
+            line = f"Puesto #{standings['rank']:,} de {standings['players']:,}"
+            if standings["daily_rank"] is not None:
+                line += (f" (hoy #{standings['daily_rank']:,} de "
+                         f"{standings['daily_players']:,})")
+            lines.append(line)
+        if standings["top"]:
+            lines.append("Mejores: " + " · ".join(
+                f"{entry['rank']}. {entry['player']} ${entry['prize']:,}"
+                for entry in standings["top"]))
+        return tuple(lines)
+    
     def draw_safe_haven_screen(self, current_level: int, score: int) -> bool:
         """
         Dibuja la pantalla de estación segura.
@@ -295,23 +758,25 @@ class GameUI:
         Args:
             current_level: Nivel actual
             score: Puntaje actual
-            
+        
         Returns:
             True si el jugador quiere continuar, False si se retira
         """
+        if not self._begin_static_screen(("safe_haven", current_level, score)):
+            return True
+        
+        y = self.layout.y
         self.screen.fill(COLOR_BACKGROUND)
         
-        draw_text_centered(self.screen, "ESTACIÓN SEGURA",
-                          self.font_title, COLOR_SUCCESS, 200, self.width)
+        self._draw_centered("ESTACIÓN SEGURA", self.font_title, COLOR_SUCCESS, y(200))
         
-        draw_text_centered(self.screen, f"Puedes retirarte con ${score:,}",
-                          self.font_question, COLOR_TEXT, 300, self.width)
+        self._draw_centered(f"Puedes retirarte con ${score:,}",
+                            self.font_question, COLOR_TEXT, y(300))
         
-        draw_text_centered(self.screen, "¿Quieres continuar?",
-                          self.font_info, COLOR_TEXT, 400, self.width)
+        self._draw_centered("¿Quieres continuar?", self.font_info, COLOR_TEXT, y(400))
         
-        draw_text_centered(self.screen, "Presiona ESPACIO para continuar | ESC para retirarte",
-                          self.font_info, COLOR_TEXT, 500, self.width)
+        self._draw_centered("Presiona ESPACIO para continuar | ESC para retirarte",
+                            self.font_info, COLOR_TEXT, y(500))
         
         pygame.display.update()
         return True
@@ -1,13 +1,81 @@
 """
 Utilidades del juego
+
+pygame solo se importa al dibujar: wrap_text funciona con cualquier objeto
+con el método size() de las fuentes, así que este módulo se puede usar sin
+cargar pygame.
 """
-import pygame
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List
+from weakref import WeakKeyDictionary
+from juego.config import WRAP_CACHE_SIZE, WIDTH_TABLE_SIZE
+
+if TYPE_CHECKING:
+    import pygame
+
+# Líneas ya calculadas por (texto, fuente, ancho máximo)
+_wrap_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Tablas de anchos de palabra por fuente
+_width_tables: "WeakKeyDictionary[pygame.font.Font, Dict[str, int]]" = WeakKeyDictionary()
+
+
+def _width_table(font: pygame.font.Font) -> Dict[str, int]:
+    """Obtiene la tabla de anchos de palabra de la fuente"""
+    table = _width_tables.get(font)
+    if table is None or len(table) > WIDTH_TABLE_SIZE:
+        table = {" ": font.size(" ")[0]}
+        _width_tables[font] = table
+    return table
+
+
+def _wrap_words(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """
+    Divide el texto midiendo cada palabra una sola vez.
+    
+    El ancho de una línea se estima como la suma de los anchos de sus
+    palabras más un espacio por palabra, sin volver a medir el prefijo.
+    Solo cuando la estimación queda a pocos píxeles del límite (error de
+    redondeo) se mide la línea completa para decidir igual que font.size.
+    """
+    table = _width_table(font)
+    space_width = table[" "]
+    lines = []
+    current_words = []
+    current_width = 0
+    
+    for word in text.split(" "):
+        word_width = table.get(word)
+        if word_width is None:
+            word_width = table[word] = font.size(word)[0]
+        
+        test_width = current_width + word_width + space_width
+        tolerance = 2 * (len(current_words) + 1)
+        if abs(test_width - max_width) <= tolerance:
+            test_width = font.size(" ".join(current_words + [word]) + " ")[0]
+        if test_width < max_width:
+            current_words.append(word)
+            current_width = test_width
+        else:
+            if current_words:
+                lines.append(" ".join(current_words).strip())
+            current_words = [word]
+            current_width = word_width + space_width
+    
+    if current_words:
+        lines.append(" ".join(current_words).strip())
+    
+    return lines if lines else [""]
 
 
 def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list:
     """
     Divide el texto en varias líneas para ajustarlo en la ventana.
     
+    El resultado se memoriza por (texto, fuente, ancho máximo).
+    
     Args:
         text: Texto a dividir
         font: Fuente de pygame
@@ -16,23 +84,39 @@ def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list:
     Returns:
         Lista de líneas de texto
     """
-    words = text.split(" ")
-    lines = []
-    current_line = ""
-    
-    for word in words:
-        test_line = current_line + word + " "
-        if font.size(test_line)[0] < max_width:
-            current_line = test_line
-        else:
-            if current_line:
-                lines.append(current_line.strip())
-            current_line = word + " "
+    key = (text, font, max_width)
+    lines = _wrap_cache.get(key)
+    if lines is not None:
+        _wrap_cache.move_to_end(key)
+        return list(lines)
     
-    if current_line:
-        lines.append(current_line.strip())
+    lines = _wrap_words(text, font, max_width)
+    _wrap_cache[key] = tuple(lines)
+    if len(_wrap_cache) > WRAP_CACHE_SIZE:
+        _wrap_cache.popitem(last=False)
+    return lines
+
+
+def prewrap_texts(texts: Iterable[str], font: pygame.font.Font,
+                  max_width: int) -> Dict[str, List[str]]:
+    """
+    Divide en líneas un lote de textos de una vez (p. ej. al cargar preguntas).
     
-    return lines if lines else [""]
+    Args:
+        texts: Textos a dividir
+        font: Fuente de pygame
+        max_width: Ancho máximo permitido
+        
+    Returns:
+        Diccionario texto -> lista de líneas
+    """
+    return {text: wrap_text(text, font, max_width) for text in texts}
+
+
+def clear_wrap_cache() -> None:
+    """Olvida las líneas y los anchos de palabra memorizados"""
+    _wrap_cache.clear()
+    _width_tables.clear()
 
 
 def draw_text_centered(surface: pygame.Surface, text: str, font: pygame.font.Font, 
@@ -56,7 +140,8 @@ def draw_text_centered(surface: pygame.Surface, text: str, font: pygame.font.Fon
 def draw_button(surface: pygame.Surface, text: str, font: pygame.font.Font,
                 x: int, y: int, width: int, height: int,
                 bg_color: tuple, text_color: tuple,
-                hover: bool = False) -> pygame.Rect:
+                hover: bool = False,
+                text_surface: pygame.Surface = None) -> pygame.Rect:
     """
     Dibuja un botón en la superficie.
     
@@ -69,10 +154,13 @@ def draw_button(surface: pygame.Surface, text: str, font: pygame.font.Font,
         bg_color: Color de fondo
         text_color: Color del texto
         hover: Si el botón está siendo hover
+        text_surface: Superficie del texto ya renderizada (opcional)
         
     Returns:
         Rectángulo del botón
     """
+    import pygame
+    
     if hover:
         bg_color = tuple(min(255, c + 30) for c in bg_color)
     
@@ -80,7 +168,8 @@ def draw_button(surface: pygame.Surface, text: str, font: pygame.font.Font,
     pygame.draw.rect(surface, bg_color, button_rect)
     pygame.draw.rect(surface, text_color, button_rect, 2)
     
-    text_surface = font.render(text, True, text_color)
+    if text_surface is None:
+        text_surface = font.render(text, True, text_color)
     text_rect = text_surface.get_rect(center=button_rect.center)
     surface.blit(text_surface, text_rect)
     
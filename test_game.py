@@ -57,6 +57,753 @@ def test_questions():
         traceback.print_exc()
         return False
 
+def test_question_deck():
+    """Prueba el reparto sin reemplazo sobre un banco compartido"""
+    print("\nProbando reparto de preguntas...")
+    from juego.questions import QuestionDeck, QuestionManager
+    
+    deck = QuestionDeck(1000)
+    drawn = [deck.draw() for _ in range(1000)]
+    assert sorted(drawn) == list(range(1000))
+    assert deck.draw() is None and deck.remaining == 0
+    print("✓ Cada índice se reparte exactamente una vez")
+    
+    first = QuestionManager()
+    second = QuestionManager()
+    assert first.bank is second.bank
+    total = len(first.questions)
+    while first.get_next_question():
+        pass
+    assert len(first.questions) == total
+    assert second.get_remaining_count() == total
+    print("✓ El banco se comparte y no se destruye al repartir")
+    return True
+
+def test_difficulty_selection():
+    """Prueba la selección de preguntas según el nivel"""
+    print("\nProbando selección por dificultad...")
+    from juego.questions import QuestionBank, QuestionManager, difficulty_for_level
+    
+    bands = [difficulty_for_level(level, [1, 2, 3, 4]) for level in range(1, 11)]
+    assert bands == [1, 1, 1, 2, 2, 3, 3, 3, 4, 4]
+    print(f"✓ Bandas por nivel: {bands}")
+    
+    bank = QuestionBank([
+        {"question": f"P{i}", "options": ["a", "b", "c", "d"], "answer": 0,
+         "difficulty": 1 + i % 2}
+        for i in range(6)
+    ])
+    manager = QuestionManager(bank=bank)
+    assert all(manager.get_next_question(10)["difficulty"] == 2 for _ in range(3))
+    assert manager.get_next_question(10)["difficulty"] == 1
+    print("✓ Nivel alto usa la dificultad máxima y luego la más cercana")
+    return True
+
+def test_compiled_bank():
+    """Prueba el banco compilado mapeado en memoria"""
+    print("\nProbando banco compilado...")
+    import json
+    import shutil
+    import tempfile
+    from juego.config import DATA_DIR
+    from juego.bankfile import (
+        build_compiled_bank, is_fresh, open_compiled_bank, write_compiled_bank
+    )
+    from juego.loader import question_id
+    from juego.questions import QuestionBank
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        json_path = os.path.join(tmp_dir, "questions.json")
+        shutil.copy(os.path.join(DATA_DIR, "questions.json"), json_path)
+        compiled_path = build_compiled_bank(json_path)
+        assert is_fresh(compiled_path, json_path)
+        
+        with open(json_path, encoding="utf-8") as f:
+            original = json.load(f)
+        bank = QuestionBank.from_file(json_path)
+        assert type(bank.records).__name__ == "CompiledRecords"
+        assert all(q["id"] == question_id(q) for q in bank.records)
+        assert [dict(q, options=list(q["options"])) for q in bank.records] == \
+            [dict(q, id=question_id(q)) for q in original]
+        print(f"✓ {len(bank)} preguntas leídas desde el archivo compilado")
+        
+        with open(json_path, "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert not is_fresh(compiled_path, json_path)
+        assert isinstance(QuestionBank.from_file(json_path).records, tuple)
+        print("✓ Un JSON modificado invalida el archivo compilado")
+        
+        # Textos de más de 64 KB y limpieza del temporal ante un error
+        long_text = "á" * 40_000
+        question = {"question": long_text, "options": [long_text, "B", "C", "D"],
+                    "answer": 0, "difficulty": 1}
+        out_path = os.path.join(tmp_dir, "largo.qbank")
+        write_compiled_bank([question], out_path)
+        assert open_compiled_bank(out_path)[0]["question"] == long_text
+        try:
+            write_compiled_bank([question, {"question": "?", "options": ["A"]}], out_path)
+            assert False, "Debió fallar"
+        except ValueError:
+            pass
+        assert not os.path.exists(out_path + ".tmp")
+        print("✓ Textos de más de 64 KB y sin temporales tras un error")
+    finally:
+        shutil.rmtree(tmp_dir)
+    return True
+
+def test_streaming_loader():
+    """Prueba la lectura en streaming con validación por registro"""
+    print("\nProbando lectura en streaming...")
+    import io
+    import json
+    import tempfile
+    from juego.loader import LoadReport, iter_questions, iter_records, _iter_json_array, \
+        question_id
+    
+    good = {"question": "¿2 + 2?", "options": ["3", "4", "5", "6"], "answer": 1, "difficulty": 1}
+    bad = [
+        {"question": "Sin dificultad", "options": ["a", "b", "c", "d"], "answer": 0},
+        {"question": "Tres opciones", "options": ["a", "b", "c"], "answer": 0, "difficulty": 1},
+        {"question": "Fuera de rango", "options": ["a", "b", "c", "d"], "answer": 4, "difficulty": 1},
+    ]
+    text = json.dumps([good, *bad, good], ensure_ascii=False)
+    records = [record for _, record in _iter_json_array(io.StringIO(text), chunk_size=5)]
+    assert records == [good, *bad, good]
+    print("✓ Arreglo JSON leído por bloques pequeños")
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False,
+                                     encoding="utf-8") as f:
+        for record in [good, *bad]:
+            f.write(json.dumps(record) + "\n")
+        f.write("{no es json\n")
+        f.write(json.dumps(good) + "\n")
+    try:
+        report = LoadReport(f.name)
+        assert list(iter_questions(f.name, report)) == [dict(good, id=question_id(good))]
+        assert (report.valid, report.invalid, report.duplicates) == (1, 4, 1)
+        print(f"✓ {report.summary()}")
+    finally:
+        os.remove(f.name)
+    
+    lines = [record for _, record in iter_records(io.StringIO(json.dumps(good) + "\n"))]
+    assert lines == [good]
+    return True
+
+def test_engine():
+    """Prueba las reglas del juego sin interfaz gráfica"""
+    print("\nProbando motor del juego...")
+    from juego.config import MAX_QUESTIONS, PRIZES, SAFE_HAVENS
+    from juego.questions import QuestionManager
+    from juego.engine import GameEngine, LETTERS, STATE_LOST, STATE_SAFE_HAVEN, \
+        STATE_WALKED_AWAY, STATE_WON
+    
+    engine = GameEngine(QuestionManager())
+    engine.start()
+    assert engine.use_fifty_fifty()
+    assert engine.current_options.count("") == 2
+    assert engine.skip() and engine.questions_dealt == 2
+    assert not engine.skip()
+    while not engine.is_over:
+        if engine.state == STATE_SAFE_HAVEN:
+            assert engine.continue_game()
+            continue
+        correct = LETTERS[engine.current_question["answer"]]
+        assert engine.answer(correct)
+    assert engine.state == STATE_WON and engine.score == PRIZES[MAX_QUESTIONS - 1]
+    print("✓ Partida completa con comodines y estaciones seguras")
+    
+    engine.start()
+    while engine.state != STATE_SAFE_HAVEN:
+        engine.answer(LETTERS[engine.current_question["answer"]])
+    assert engine.walk_away() and engine.state == STATE_WALKED_AWAY
+    assert engine.won and engine.score == PRIZES[SAFE_HAVENS[0] - 1]
+    
+    engine.start()
+    wrong = LETTERS[(engine.current_question["answer"] + 1) % 4]
+    assert not engine.answer(wrong)
+    assert engine.state == STATE_LOST and not engine.won
+    print("✓ Retirarse y perder terminan la partida")
+    return True
+
+def test_lazy_pygame_import():
+    """Prueba que los módulos sin gráficos no importen pygame"""
+    print("\nProbando importación sin pygame...")
+    import subprocess
+    
+    code = (
+        "import sys, juego, juego.config, juego.questions, juego.engine, juego.utils\n"
+        "assert 'pygame' not in sys.modules\n"
+        "juego.GameUI\n"
+        "assert 'pygame' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)),
+                   env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"))
+    print("✓ pygame solo se carga al usar la interfaz gráfica")
+    return True
+
+def test_server():
+    """Prueba el servidor multijugador con un cliente TCP local"""
+    print("\nProbando servidor multijugador...")
+    import asyncio
+    import json
+    from juego.engine import LETTERS
+    from juego.server import GameServer
+    
+    async def scenario():
+        server = GameServer()
+        port = await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        
+        async def send(line):
+            writer.write(line.encode() + b"\n")
+            return json.loads(await reader.readline())
+        
+        assert json.loads(await reader.readline())["type"] == "welcome"
+        assert (await send("NAME Ana"))["player"] == "Ana"
+        question = await send("START")
+        assert question["type"] == "question" and question["level"] == 1
+        assert (await send("WALK"))["type"] == "error"
+        
+        answers = {q["question"]: q["answer"] for q in server.bank.records}
+        wrong = LETTERS[(answers[question["question"]] + 1) % 4]
+        result = await send(f"ANSWER {wrong}")
+        assert result == {"type": "answer", "correct": False, "score": 0}
+        game_over = json.loads(await reader.readline())
+        assert game_over["type"] == "game_over" and game_over["result"] == "lost"
+        assert (await send("QUIT"))["type"] == "bye"
+        writer.close()
+        await server.stop()
+    
+    asyncio.run(scenario())
+    print("✓ Sesión completa sobre TCP")
+    return True
+
+def test_simulation():
+    """Prueba el simulador Monte Carlo"""
+    print("\nProbando simulador...")
+    from juego.simulation import PlayerModel, simulate, summarize, np
+    for call in (lambda: simulate(0), lambda: simulate(10, chunk_size=0),
+                 lambda: summarize({"games": 0, "histogram": {}})):
+        try:
+            call()
+            assert False, "Debió fallar"
+        except ValueError:
+            pass
+    print("✓ Simular cero partidas es un error claro")
+    if np is None:
+        print("⚠ Advertencia: numpy no está instalado, se omite el simulador")
+        return True
+    from juego.config import PRIZES, SAFE_HAVENS
+    
+    expert = PlayerModel(accuracy={1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0})
+    summary = simulate(1000, expert, seed=1)
+    assert summary["histogram"] == {PRIZES[-1]: 1000}
+    assert summary["fifty_fifty_used"] == 0
+    
+    cautious = PlayerModel(accuracy={1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0},
+                           walk_away_at=[SAFE_HAVENS[0]])
+    assert simulate(500, cautious, seed=1)["histogram"] == {PRIZES[SAFE_HAVENS[0] - 1]: 500}
+    print("✓ Jugadores perfectos ganan o se retiran según su estrategia")
+    
+    single = simulate(10000, seed=7, chunk_size=1500)
+    pooled = simulate(10000, seed=7, chunk_size=1500, workers=2)
+    assert single == pooled and 0 < single["loss_rate"] < 1
+    print(f"✓ Resultado reproducible con 1 y 2 procesos "
+          f"(premio esperado ${single['expected_payout']:,.0f})")
+    return True
+
+def test_sharded_runner():
+    """Prueba que las sesiones simuladas sean reproducibles"""
+    print("\nProbando ejecución reproducible por bloques...")
+    import random
+    from juego.questions import QuestionManager, Lifeline
+    from juego.runner import run_sessions
+    
+    def deal(seed):
+        manager = QuestionManager(rng=random.Random(seed))
+        return [manager.get_next_question(level)["question"] for level in range(1, 11)]
+    assert deal(3) == deal(3)
+    lifeline = Lifeline(rng=random.Random(3))
+    assert lifeline.use_fifty_fifty(["a", "b", "c", "d"], 0) == \
+        Lifeline(rng=random.Random(3)).use_fifty_fifty(["a", "b", "c", "d"], 0)
+    print("✓ Repartos y comodines reproducibles con la misma semilla")
+    
+    single = run_sessions(400, master_seed=11, workers=1, shard_size=64)
+    pooled = run_sessions(400, master_seed=11, workers=3, shard_size=64)
+    assert single == pooled
+    assert sum(single["states"].values()) == 400
+    assert run_sessions(400, master_seed=12, shard_size=64)["digest"] != single["digest"]
+    print(f"✓ 1 y 3 procesos producen el mismo resultado ({single['digest'][:12]})")
+    return True
+
+def test_results_store():
+    """Prueba el registro de resultados en segundo plano"""
+    print("\nProbando registro de resultados...")
+    import os
+    import tempfile
+    from juego.questions import QuestionManager
+    from juego.engine import GameEngine, LETTERS
+    from juego.results import ResultsStore, ResultsWriter, build_session_record
+    
+    engine = GameEngine(QuestionManager())
+    engine.start()
+    assert engine.use_fifty_fifty()
+    engine.answer(LETTERS[engine.current_question["answer"]])
+    engine.answer(LETTERS[(engine.current_question["answer"] + 1) % 4])
+    record = build_session_record("Ana", engine)
+    assert record["result"] == "lost" and record["lifelines"] == ["fifty_fifty"]
+    assert [a["correct"] for a in record["answers"]] == [True, False]
+    assert all(a["latency_ms"] >= 0 for a in record["answers"])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.db")
+        writer = ResultsWriter(path, queue_size=1000, batch_size=64, flush_interval=60)
+        assert all(writer.submit(record) for _ in range(150))
+        writer.close()
+        assert writer.written == 150 and not writer.submit(record)
+        
+        store = ResultsStore(path)
+        assert store.session_count() == 150
+        assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        saved = store.recent_sessions(1)[0]
+        assert saved["player"] == "Ana" and saved["prize"] == record["prize"]
+        assert saved["answers"] == record["answers"]
+        store.close()
+        
+        full = ResultsWriter(path, queue_size=1)
+        full.queue.put(record)  # Ocupa la cola antes de que el hilo la vacíe
+        accepted = sum(full.submit(record) for _ in range(10))
+        full.close()
+        assert accepted + full.dropped == 10
+    print("✓ Sesiones guardadas por lotes al cerrar, sin bloquear al encolar")
+    return True
+
+def test_leaderboard():
+    """Prueba la clasificación histórica, diaria y por jugador"""
+    print("\nProbando clasificación...")
+    import os
+    import random
+    import tempfile
+    import time
+    from juego.results import ResultsStore
+    from juego.leaderboard import Leaderboard, day_key
+    
+    def record(player, prize, finished_at):
+        return {"player": player, "started_at": finished_at - 60,
+                "finished_at": finished_at, "result": "lost", "correct_answers": 0,
+                "prize": prize, "lifelines": [], "answers": []}
+    
+    now = time.time()
+    rng = random.Random(3)
+    records = [record(f"J{rng.randrange(40)}", rng.choice([0, 1000, 20000, 1000000]),
+                      now - rng.randrange(3 * 86400)) for _ in range(500)]
+    records.sort(key=lambda r: r["finished_at"])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, "results.db"))
+        store.insert_batch(records[:400])
+        leaderboard = Leaderboard.from_store(store)
+        for r in records[400:]:
+            store.insert_batch([r])
+            leaderboard.record(r)
+        reloaded = Leaderboard.from_store(store)
+        
+        best = {}
+        for r in records:
+            if r["prize"] > best.get(r["player"], (-1,))[0]:
+                best[r["player"]] = (r["prize"], r["finished_at"])
+        expected = sorted(best, key=lambda p: (-best[p][0], best[p][1]))
+        for board in (leaderboard, reloaded):
+            top = board.top(10)
+            assert [entry["player"] for entry in top] == expected[:10]
+            for player, (prize, _) in best.items():
+                assert board.rank(player) == 1 + sum(
+                    1 for other in best.values() if other[0] > prize)
+        assert reloaded.player("J1") == leaderboard.player("J1")
+        print("✓ Carga desde el almacén y actualización incremental coinciden")
+        
+        today = day_key(now)
+        daily = [r for r in records if day_key(r["finished_at"]) == today]
+        assert len(leaderboard.day(today)) == len({r["player"] for r in daily})
+        assert leaderboard.top(3, today) == reloaded.top(3, today)
+        print("✓ Clasificación diaria")
+        
+        from juego.questions import QuestionManager
+        from juego.server import Session
+        session = Session(QuestionManager().bank, leaderboard)
+        (reply,), _ = session.handle_command("TOP 3 HOY")
+        assert reply["top"] == leaderboard.top(3, today)
+        (reply,), close = session.handle_command("TOP ² 5")
+        assert not close and len(reply["top"]) == 5
+        print("✓ El comando TOP ignora números que no son decimales")
+        
+        # Un día que aún no está en memoria se carga del almacén compartido,
+        # esté o no escrita ya la partida nueva
+        tomorrow = now + 86400
+        others = [record("Otro", 500, tomorrow), record("Otra", 300, tomorrow + 1)]
+        store.insert_batch(others)
+        written = record("Nuevo", 100, tomorrow + 2)
+        store.insert_batch([written])
+        leaderboard.record(written)
+        leaderboard.record(record("Tarde", 50, tomorrow + 3))
+        ranking = leaderboard.day(day_key(tomorrow))
+        assert len(ranking) == 4 and ranking.players["Nuevo"][2] == 1
+        print("✓ El primer registro de un día incluye lo guardado por otros procesos")
+        
+        leaderboard.close()
+        assert leaderboard.store is None
+        
+        # Una base anterior a best_results la reconstruye al abrirse
+        path = os.path.join(tmp, "results.db")
+        store = ResultsStore(path)
+        kept = sorted(store.best_results())
+        with store.connection:
+            store.connection.execute("DROP TABLE best_results")
+        store.close()
+        store = ResultsStore(path)
+        assert sorted(store.best_results()) == kept
+        assert Leaderboard.from_store(store).top(10) == leaderboard.top(10)
+        print("✓ best_results se reconstruye desde las sesiones")
+        store.close()
+    return True
+
+def test_answer_stats():
+    """Prueba las estadísticas de respuestas y el comodín del público"""
+    print("\nProbando estadísticas de respuestas...")
+    import os
+    import tempfile
+    from juego.questions import QuestionManager
+    from juego.engine import GameEngine, LETTERS
+    from juego.stats import AnswerStats, default_node, question_key, release_node
+    
+    kiosk = AnswerStats("kiosco")
+    engine = GameEngine(QuestionManager(), stats=kiosk)
+    engine.start()
+    key = question_key(engine.current_question)
+    correct = engine.current_question["answer"]
+    engine.answer(LETTERS[correct])
+    assert list(kiosk.get(key)) == [int(i == correct) for i in range(4)]
+    
+    server = AnswerStats("servidor")
+    for _ in range(30):
+        server.record(key, (correct + 1) % 4)
+    server.merge(kiosk)
+    server.merge(kiosk)  # Combinar dos veces no cuenta doble
+    kiosk.merge(server)
+    assert list(server.get(key)) == list(kiosk.get(key))
+    assert sum(server.get(key)) == 31
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stats.json")
+        server.save(path)
+        reloaded = AnswerStats.load(path, "servidor")
+        reloaded.record(key, correct)
+        assert sum(reloaded.get(key)) == 32
+        print("✓ Contadores combinables entre nodos sin contar doble")
+        
+        # Dos juegos en el mismo equipo: nodos distintos y ninguno pisa al otro
+        first = AnswerStats.load(path, default_node("juego", tmp))
+        second = AnswerStats.load(path, default_node("juego", tmp))
+        assert first.node != second.node
+        first.record(key, correct)
+        second.record(key, correct)
+        first.save(path)
+        second.save(path)
+        assert sum(AnswerStats.load(path, "otro").get(key)) == 33
+        print("✓ Procesos del mismo equipo guardan sin perder contadores")
+        
+        # Al reiniciar se reutiliza el hueco libre: el archivo no suma nodos
+        nodes = set(AnswerStats.load(path, "otro").others)
+        release_node(first.node)
+        again = AnswerStats.load(path, default_node("juego", tmp))
+        assert again.node == first.node and sum(again.local[key]) == 1
+        again.record(key, correct)
+        again.save(path)
+        assert set(AnswerStats.load(path, "otro").others) == nodes
+        assert sum(AnswerStats.load(path, "otro").get(key)) == 34
+        release_node(again.node)
+        release_node(second.node)
+        print("✓ Cada equipo reutiliza sus nodos entre arranques")
+    
+    engine = GameEngine(QuestionManager(), stats=server)
+    engine.start()
+    while question_key(engine.current_question) != key:
+        engine.start()
+    assert engine.use_ask_audience() and not engine.use_ask_audience()
+    assert sum(engine.audience) == 100
+    assert max(range(4), key=engine.audience.__getitem__) == (correct + 1) % 4
+    
+    engine.start()
+    engine.use_fifty_fifty()
+    engine.use_ask_audience()
+    removed = [i for i, option in enumerate(engine.current_options) if not option]
+    assert sum(engine.audience) == 100 and all(engine.audience[i] == 0 for i in removed)
+    print("✓ El público sigue las respuestas históricas y respeta el 50/50")
+    return True
+
+def test_question_ids():
+    """Prueba los identificadores, el índice y la detección de repetidas"""
+    print("\nProbando identificadores de preguntas...")
+    import random
+    from juego.loader import question_id, find_duplicates
+    from juego.questions import QuestionBank, QuestionDeck, QuestionManager
+    from juego.engine import GameEngine
+    
+    base = {"question": "¿Cuándo se fundó Bogotá?", "options": ["a", "b", "c", "d"],
+            "answer": 0, "difficulty": 1}
+    edited = dict(base, question="  ¿cuando se FUNDÓ   Bogotá? ")
+    other = dict(base, question="¿Cuándo se fundó Cali?")
+    assert question_id(base) == question_id(edited) != question_id(other)
+    assert find_duplicates([base, other, edited]) == [[0, 2]]
+    print("✓ Identificadores estables y repetidas detectadas por hash")
+    
+    # Los atajos (ASCII, solo tildes) dan lo mismo que la normalización completa
+    from juego.loader import normalize_text
+    assert normalize_text("Hola,  (mundo)!") == "hola mundo"
+    assert normalize_text("¿Qué «AÑO»?") == "que ano"
+    assert normalize_text("ΆΈ Ωμέγα ﬁn ½") == "αε ωμεγα fin 1⁄2"
+    assert normalize_text("a\U0001D165b") == "ab"
+    assert question_id(dict(base, options=["a\0", " b", "c", "d"])) != question_id(base)
+    print("✓ Normalización igual por todos los caminos")
+    
+    manager = QuestionManager()
+    bank = manager.bank
+    assert len({q["id"] for q in bank.records}) == len(bank) and not find_duplicates(bank.records)
+    for i, question in enumerate(bank.records):
+        assert bank.get(question["id"]) == question
+        assert bank.position_of(question["id"]) == i
+    assert bank.get("0" * 16) is None and bank.get("no-es-un-id") is None
+    print(f"✓ Índice id -> pregunta sobre {len(bank)} preguntas")
+    
+    deck = QuestionDeck(10, random.Random(5))
+    drawn = [deck.draw() for _ in range(3)]
+    assert not deck.exclude(drawn[0]) and deck.exclude(7 if 7 not in drawn else 8)
+    rest = [deck.draw() for _ in range(deck.remaining)]
+    assert sorted(drawn + rest) == sorted(set(range(10)) - {7 if 7 not in drawn else 8})
+    
+    engine = GameEngine(manager)
+    engine.start()
+    seen = set(engine.dealt_ids)
+    easy = {q["id"] for q in bank.records if q["difficulty"] == bank.difficulties[0]}
+    for _ in range(20):
+        engine.start(seen)
+        if seen >= easy:
+            break
+        assert engine.current_question["id"] not in seen
+        seen.update(engine.dealt_ids)
+    print("✓ Las preguntas vistas se excluyen del reparto")
+    return True
+
+def test_seen_questions():
+    """Prueba el registro de preguntas vistas por jugador"""
+    print("\nProbando preguntas vistas...")
+    import tempfile
+    from juego.seen import SeenSet, SeenStore
+    from juego.questions import QuestionManager
+    from juego.engine import GameEngine
+    
+    seen = SeenSet(100_000)
+    for position in (0, 63, 64, 99_999, 64):
+        seen.add(position)
+    assert len(seen) == 4 and list(seen) == [0, 63, 64, 99_999] and 63 in seen
+    seen.discard_many([63, 5])
+    assert len(seen) == 3 and 63 not in seen
+    data = seen.to_bytes()
+    assert len(data) < 100 and list(SeenSet.from_bytes(100_000, data)) == [0, 64, 99_999]
+    print(f"✓ Conjunto de 100.000 preguntas en {len(seen.bits)} bytes ({len(data)} comprimido)")
+    
+    manager = QuestionManager()
+    bank = manager.bank
+    engine = GameEngine(manager)
+    seen = SeenSet(len(bank))
+    easy = set(bank.by_difficulty[bank.difficulties[0]])
+    dealt = []
+    while len(dealt) < len(easy):
+        engine.start(seen=seen)
+        dealt.append(bank.position_of(engine.current_question["id"]))
+    assert sorted(dealt) == sorted(easy)
+    engine.start(seen=seen)
+    assert bank.position_of(engine.current_question["id"]) in easy
+    assert len(seen) == 1
+    print("✓ Ninguna pregunta se repite hasta agotar su dificultad")
+    
+    class CountingSeenSet(SeenSet):
+        __slots__ = ("walks",)
+        
+        def __iter__(self):
+            self.walks += 1
+            return super().__iter__()
+    
+    seen = CountingSeenSet(len(bank), bytes(seen.bits))
+    seen.walks = 0
+    for _ in range(3):
+        engine.start(seen=seen)
+    assert seen.walks == 1 and len(seen) == 4
+    print("✓ Las vistas se excluyen una vez por jugador, no en cada partida")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SeenStore(os.path.join(tmp, "seen.db"))
+        store.save("Ana", bank, seen)
+        assert list(store.load("Ana", bank)) == list(seen)
+        assert len(store.load("Luis", bank)) == 0
+        store.connection.execute("UPDATE seen SET bank = 'otro'")
+        assert len(store.load("Ana", bank)) == 0
+        print("✓ Conjuntos guardados por jugador y ligados al banco")
+        
+        # En el servidor el conjunto se carga con el primer START y se
+        # guarda por jugador, así que sobrevive a la conexión
+        from juego.server import Session
+        session = Session(bank, seen_store=store)
+        session.handle_command("NAME Beto")
+        assert session.seen is None
+        session.handle_command("START")
+        first = bank.position_of(session.engine.current_question["id"])
+        session.save_seen()
+        session = Session(bank, seen_store=store)
+        session.handle_command("NAME Beto")
+        assert first in session.load_seen()
+        print("✓ El servidor recuerda las preguntas vistas entre conexiones")
+        
+        # Por TCP la base se usa desde un hilo aparte, nunca desde el bucle
+        import asyncio
+        import threading
+        from juego.server import GameServer
+        threads = []
+        for name in ("load", "save"):
+            def traced(*args, _method=getattr(store, name)):
+                threads.append(threading.current_thread())
+                return _method(*args)
+            setattr(store, name, traced)
+        
+        async def scenario():
+            server = GameServer(bank, seen_store=store)
+            port = await server.start("127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await reader.readline()
+            for line in ("NAME Carla", "START", "NAME Dani", "START", "QUIT"):
+                writer.write(line.encode() + b"\n")
+                await reader.readline()
+            await reader.read()
+            writer.close()
+            await server.stop()
+        
+        asyncio.run(scenario())
+        assert len(threads) == 4 and threading.main_thread() not in threads
+        assert len(SeenStore.load(store, "Carla", bank)) == 1
+        print("✓ El servidor lee y guarda las vistas fuera del bucle")
+        store.close()
+    return True
+
+def test_prefetch():
+    """Prueba la preparación anticipada de las preguntas candidatas"""
+    print("\nProbando preparación de la siguiente pregunta...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from juego.questions import QuestionManager
+    from juego.engine import GameEngine
+    from juego.scheduler import FrameScheduler
+    from juego.ui import GameUI
+    
+    manager = QuestionManager()
+    engine = GameEngine(manager)
+    engine.start()
+    remaining = manager.get_remaining_count()
+    candidates = engine.prefetch()
+    assert len(candidates) == 2 and engine.prefetch() == candidates
+    assert manager.get_remaining_count() == remaining
+    assert engine.skip() and engine.current_question in candidates
+    assert engine.answer("ABCD"[engine.current_question["answer"]])
+    assert engine.current_question in candidates and candidates[0] != candidates[1]
+    assert len(engine.prefetch()) == 1  # Ya no queda el comodín de saltar
+    print("✓ Candidatas reservadas y repartidas en orden")
+    
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        ui = GameUI(screen)
+        question = engine.prefetch()[0]
+        ui.prerender_question(question["question"], question["options"])
+        atlas = ui._prepared[question["question"]][1]
+        ui.on_question_changed(list(question["options"]), question["question"])
+        assert ui.prepared_hits == 1 and ui.prerender_options(list(question["options"])) is atlas
+        misses = ui.question_cache.misses
+        ui.draw_game_screen(question["question"], list(question["options"]), "", 3, 2000,
+                            "Ana", False, True)
+        assert ui.question_cache.misses == misses
+        print("✓ La pregunta preparada se muestra sin renderizar texto")
+        
+        scheduler = FrameScheduler(idle_wait=True, timeout_ms=10, report_interval=0)
+        for seconds in (0.004, 0.002, 0.010):
+            scheduler.record_transition(seconds)
+        stats = scheduler.stats()
+        assert stats["transitions"] == 3 and stats["transition_ms_p50"] == 4.0
+        assert "transición" in scheduler.report()
+        print("✓ Latencia de transición medida")
+    finally:
+        pygame.quit()
+    return True
+
+def test_embedded_bank():
+    """Prueba el banco embebido y el lanzador clásico"""
+    print("\nProbando banco embebido...")
+    from juego.bankfile import CompiledRecords, compile_to_bytes
+    from juego.questions import QuestionBank, QuestionManager
+    import juego.quien_quiere_ser_millonario as launcher
+    
+    bank = QuestionManager().bank
+    assert list(CompiledRecords(compile_to_bytes(bank.records))) == list(bank.records)
+    
+    embedded = QuestionBank.from_embedded()
+    assert embedded.fingerprint == bank.fingerprint, \
+        "juego/bank_embedded.py no corresponde a data/questions.json (python -m juego.bankfile embed)"
+    assert list(embedded.records) == list(bank.records)
+    print(f"✓ Banco embebido al día ({len(embedded)} preguntas)")
+    
+    assert launcher.load_bank(False) is None
+    assert launcher.load_bank(True).fingerprint == bank.fingerprint
+    print("✓ El lanzador clásico elige el banco embebido con --embebido")
+    return True
+
+def test_benchmark_suite():
+    """Prueba la suite de benchmarks con un banco pequeño y la detección de regresiones"""
+    print("\nProbando suite de benchmarks...")
+    import importlib.util
+    import tempfile
+    
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "run.py")
+    spec = importlib.util.spec_from_file_location("benchmarks_run", path)
+    bench = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        results = bench.bench_bank(1000, tmp, json_limit=1000, games=5)
+    results.update(bench.bench_engine(games=5))
+    assert set(results) == {"bank.qbank_load_ms[1000]", "bank.json_load_ms[1000]",
+                            "bank.deals_per_s[1000]", "engine.steps_per_s"}
+    assert all(r["value"] > 0 and r["calibration_ms"] > 0 for r in results.values())
+    print(f"✓ {len(results)} métricas medidas")
+    
+    baseline = {name: dict(r) for name, r in results.items()}
+    assert not any(row[4] for row in bench.compare(results, baseline, 0.3))
+    slower = dict(results["engine.steps_per_s"])
+    slower["value"] /= 2
+    rows = bench.compare(dict(results, **{"engine.steps_per_s": slower}), baseline, 0.3)
+    assert [row[0] for row in rows if row[4]] == ["engine.steps_per_s"]
+    print("✓ Una métrica el doble de lenta es una regresión")
+    
+    # Todo el doble de lento en una máquina el doble de lenta no es regresión
+    slow_machine = {
+        name: dict(r, value=r["value"] / 2 if r["higher_is_better"] else r["value"] * 2,
+                   calibration_ms=r["calibration_ms"] * 2)
+        for name, r in results.items()
+    }
+    assert not any(row[4] for row in bench.compare(slow_machine, baseline, 0.3))
+    print("✓ La comparación se corrige por la velocidad de la máquina")
+    return True
+
 def test_pygame_init():
     """Prueba la inicialización de pygame"""
     print("\nProbando inicialización de pygame...")
@@ -78,6 +825,350 @@ def test_pygame_init():
         traceback.print_exc()
         return False
 
+def test_text_cache():
+    """Prueba la caché de superficies de texto"""
+    print("\nProbando caché de texto...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.ui import TextCache
+    
+    pygame.init()
+    try:
+        font = pygame.font.Font(None, 20)
+        cache = TextCache(max_size=2)
+        
+        first = cache.render(font, "Hola", (255, 255, 255))
+        assert cache.render(font, "Hola", (255, 255, 255)) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        print("✓ Texto repetido servido desde la caché")
+        
+        cache.render(font, "Mundo", (255, 255, 255))
+        cache.render(font, "Adiós", (255, 255, 255))
+        assert len(cache) == 2
+        assert cache.render(font, "Hola", (255, 255, 255)) is not first
+        print("✓ Expulsión LRU respetando el tamaño máximo")
+    finally:
+        pygame.quit()
+    return True
+
+def test_dirty_rendering():
+    """Prueba que solo se redibujen las regiones que cambian"""
+    print("\nProbando renderizado por regiones sucias...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from juego.ui import GameUI
+    
+    pygame.init()
+    original_update = pygame.display.update
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        ui = GameUI(screen)
+        options = ["París", "Berlín", "Londres", "Madrid"]
+        args = ("¿Capital de Francia?", options, "", 1, 0, "Ana", False, False)
+        
+        ui.dirty_rendering = False
+        ui.draw_game_screen(*args[:2], "B", *args[3:])
+        full_frame = pygame.image.tobytes(screen, "RGB")
+        
+        ui.dirty_rendering = True
+        ui.invalidate()
+        ui.draw_game_screen(*args)
+        updates = []
+        pygame.display.update = lambda *rects: updates.append(rects)
+        
+        ui.draw_game_screen(*args)
+        assert updates == []
+        print("✓ Sin cambios no se actualiza la pantalla")
+        
+        ui.draw_game_screen(*args[:2], "B", *args[3:])
+        assert len(updates) == 1 and len(updates[0][0]) == 1
+        assert pygame.image.tobytes(screen, "RGB") == full_frame
+        print("✓ Cambiar la selección redibuja solo esa opción")
+        
+        drawn = []
+        original_draw_question = ui._draw_question
+        ui._draw_question = lambda question: drawn.append(question)
+        ui.draw_game_screen(*args)
+        ui._draw_question = original_draw_question
+        assert drawn == []
+        print("✓ Las demás regiones no se vuelven a dibujar")
+        
+        # Una pregunta larga se recorta a su región: al cambiarla por una
+        # corta no quedan restos sobre las opciones
+        long_question = " ".join(["palabra"] * 200)
+        ui.draw_game_screen(long_question, *args[1:])
+        ui.draw_game_screen(*args[:2], "B", *args[3:])
+        assert pygame.image.tobytes(screen, "RGB") == full_frame
+        print("✓ El texto de la pregunta no sale de su región")
+    finally:
+        pygame.display.update = original_update
+        pygame.quit()
+    return True
+
+def test_prerendered_widgets():
+    """Prueba el atlas de opciones, la escalera de premios y la franja de comodines"""
+    print("\nProbando superficies prerenderizadas...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT, LADDER_X, LADDER_Y
+    from juego.ui import GameUI, OPTION_SELECTED, OPTION_REMOVED
+    
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        ui = GameUI(screen)
+        options = ["París", "Berlín", "Londres", "Madrid"]
+        ui.on_question_changed(options)
+        atlas = ui.prerender_options(options)
+        assert atlas.surface.get_size() == (3 * atlas.width, 4 * atlas.height)
+        
+        ui.draw_game_screen("¿Capital de Francia?", options, "B", 1, 0, "Ana", False, False)
+        halved = ["París", "", "", "Madrid"]
+        ui.draw_game_screen("¿Capital de Francia?", halved, "A", 1, 0, "Ana", True, False)
+        assert ui.prerender_options(halved) is atlas
+        assert [letter for _, letter in ui.option_rects] == ["A", "D"]
+        
+        rect = ui._option_rect(0)
+        expected = atlas.surface.subsurface(atlas.cell(0, OPTION_SELECTED))
+        assert (pygame.image.tobytes(screen.subsurface(rect), "RGB")
+                == pygame.image.tobytes(expected, "RGB"))
+        rect = ui._option_rect(1)
+        expected = atlas.surface.subsurface(atlas.cell(1, OPTION_REMOVED))
+        assert (pygame.image.tobytes(screen.subsurface(rect), "RGB")
+                == pygame.image.tobytes(expected, "RGB"))
+        print("✓ Botones en sus tres estados copiados del atlas")
+        
+        ui.on_question_changed(["Uno", "Dos", "Tres", "Cuatro"])
+        assert ui.prerender_options(["Uno", "Dos", "Tres", "Cuatro"]) is not atlas
+        print("✓ El atlas se rehace solo con una pregunta nueva")
+        
+        ladder = ui._ladder_panel(1)
+        assert ui._ladder_panel(1) is ladder and ui._ladder_panel(2) is not ladder
+        ui.draw_game_screen("¿Otra?", ["Uno", "Dos", "Tres", "Cuatro"], "", 2, 1000,
+                            "Ana", True, False)
+        panel = screen.subsurface(ladder.get_rect(topleft=(LADDER_X, LADDER_Y)))
+        assert (pygame.image.tobytes(panel, "RGB")
+                == pygame.image.tobytes(ui._ladder_panel(2), "RGB"))
+        assert ui._lifeline_strip((True, False, False)) is ui._lifeline_strip((True, False, False))
+        print("✓ Escalera de premios y comodines prerenderizados")
+    finally:
+        pygame.quit()
+    return True
+
+def test_layout():
+    """Prueba la disposición escalada por resolución"""
+    print("\nProbando disposición por resolución...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT, LADDER_X, LADDER_Y
+    from juego.layout import layout_for, render_size
+    from juego.ui import GameUI
+    
+    reference = layout_for((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assert layout_for((WINDOW_WIDTH, WINDOW_HEIGHT)) is reference
+    assert reference.ladder_rect.topleft == (LADDER_X, LADDER_Y)
+    assert reference.option_rects[0] == pygame.Rect(490, 400, 400, 80)
+    assert reference.font_question_size == 35
+    print("✓ En la resolución de referencia la disposición es la original")
+    
+    assert render_size((3840, 2160)) == (1920, 1080)
+    assert render_size((1280, 720)) == (1280, 720)
+    assert render_size((3840, 2160), max_height=None) == (3840, 2160)
+    print("✓ Los paneles 4K se dibujan a 1080 líneas")
+    
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        ui = GameUI(screen)
+        font_question, title = ui.font_question, ui.title_image
+        args = ("¿Capital de Francia?", ["París", "Berlín", "Londres", "Madrid"],
+                "A", 3, 2000, "Ana", False, False)
+        ui.draw_game_screen(*args)
+        
+        for size in ((1280, 720), (1024, 768), (3840, 2160)):
+            ui.resize(pygame.display.set_mode(size))
+            ui.draw_game_screen(*args)
+            bounds = ui.screen.get_rect()
+            assert all(bounds.contains(rect) for rect in ui.layout.regions.values()), size
+            assert [letter for _, letter in ui.option_rects] == ["A", "B", "C", "D"]
+        assert ui.font_question.get_height() > font_question.get_height()
+        print("✓ Las regiones caben en pantallas de 720p a 4K")
+        
+        ui.resize(pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT)))
+        assert ui.font_question is font_question
+        assert title is None or ui.title_image is title
+        print("✓ Volver a una resolución reutiliza sus fuentes e imágenes")
+    finally:
+        pygame.quit()
+    return True
+
+def test_font_registry():
+    """Prueba que cada fuente se cargue una sola vez por proceso"""
+    print("\nProbando registro de fuentes...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from juego.fonts import get_font, loaded_fonts
+    from juego.ui import GameUI
+    
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        first, second = GameUI(screen), GameUI(screen)
+        assert first.font_question is second.font_question
+        assert get_font("Arial", 35) is first.font_question
+        assert get_font("Arial", 30, bold=True) is not get_font("Arial", 30)
+        print(f"✓ {loaded_fonts()} fuentes compartidas entre pantallas")
+    finally:
+        pygame.quit()
+    assert loaded_fonts() == 0
+    pygame.init()
+    try:
+        get_font("Arial", 20).render("Hola", True, (255, 255, 255))
+    finally:
+        pygame.quit()
+    print("✓ El registro se vacía al cerrar pygame")
+    return True
+
+def test_profiler():
+    """Prueba el perfilador de cuadros y su instrumentación"""
+    print("\nProbando perfilador...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import json
+    import tempfile
+    import pygame
+    from juego import utils
+    from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from juego.profiler import Histogram, Profiler, bucket_of, bucket_upper
+    from juego.ui import GameUI
+    
+    histogram = Histogram()
+    for ns in range(1, 1001):
+        histogram.add(ns * 1000)
+    assert all(ns < bucket_upper(bucket_of(ns)) <= ns * 1.25 + 1
+               for ns in (1, 5, 999, 10 ** 9))
+    assert 500_000 <= histogram.percentile(0.5) <= 500_000 * 1.25
+    assert histogram.percentile(1.0) == histogram.max == 1_000_000
+    print("✓ Percentiles con error acotado por la cubeta")
+    
+    profiler = Profiler()
+    inner = profiler.wrap("interna", lambda: None)
+    outer = profiler.wrap("externa", lambda: inner() or inner())
+    outer()
+    assert profiler.sections["interna"].count == 2
+    assert set(profiler.stacks) == {"externa", "externa;interna"}
+    print("✓ Secciones anidadas en pilas colapsadas")
+    
+    original_update = pygame.display.update
+    original_wrap = utils.wrap_text
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        profiler = Profiler()
+        profiler.instrument_fonts()
+        ui = GameUI(screen)
+        profiler.instrument_functions()
+        profiler.instrument_ui(ui)
+        profiler.start_frame()
+        ui.draw_game_screen("¿Capital de Francia?", ["París", "Berlín", "Londres", "Madrid"],
+                            "", 1, 0, "Ana", False, False)
+        profiler.end_frame()
+        for section in ("cuadro", "draw_game_screen", "font.render", "display.update"):
+            assert profiler.sections[section].count >= 1, section
+        assert any(s.startswith("draw_game_screen;") for s in profiler.stacks)
+        profiler.draw_overlay(screen)
+        assert profiler.sections["display.update"].count == 1
+        print(f"✓ {len(profiler.sections)} secciones medidas en un cuadro")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            profiler.dump(path)
+            with open(path, encoding="utf-8") as f:
+                assert "draw_game_screen" in json.load(f)["sections"]
+            assert os.path.exists(os.path.join(tmp, "profile.folded"))
+        print("✓ Perfil guardado en JSON y pilas colapsadas")
+        
+        profiler.uninstall()
+        assert pygame.display.update is original_update
+        assert utils.wrap_text is original_wrap
+        assert "draw_game_screen" not in vars(ui)
+        assert type(GameUI(screen).font_question) is pygame.font.Font
+        print("✓ Desinstalar deja el código original")
+    finally:
+        pygame.quit()
+    return True
+
+def test_idle_scheduler():
+    """Prueba que el planificador duerma hasta recibir eventos"""
+    print("\nProbando planificador en modo de espera...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.scheduler import FrameScheduler
+    
+    pygame.init()
+    try:
+        pygame.display.set_mode((100, 100))
+        scheduler = FrameScheduler(idle_wait=True, timeout_ms=10)
+        pygame.event.clear()
+        
+        assert scheduler.wait_events() == []
+        assert scheduler.timer_wakeups == 1
+        print("✓ Despierta por temporizador sin eventos")
+        
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        events = scheduler.wait_events()
+        assert [event.type for event in events] == [pygame.KEYDOWN]
+        
+        stats = scheduler.stats()
+        assert stats["wakeups"] == 2 and stats["wakeups_per_second"] > 0
+        print(f"✓ {scheduler.report()}")
+    finally:
+        pygame.quit()
+    return True
+
+def test_wrap_text():
+    """Prueba la división de texto memorizada"""
+    print("\nProbando división de texto...")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from juego.utils import wrap_text, prewrap_texts, clear_wrap_cache
+    
+    pygame.init()
+    try:
+        font = pygame.font.Font(None, 35)
+        text = " ".join(["palabra"] * 45)
+        clear_wrap_cache()
+        
+        lines = wrap_text(text, font, 500)
+        assert len(lines) > 1
+        assert all(font.size(line)[0] < 500 for line in lines)
+        assert " ".join(lines) == text
+        print(f"✓ Texto de 45 palabras dividido en {len(lines)} líneas")
+        
+        assert wrap_text(text, font, 500) == lines
+        wrapped = prewrap_texts([text, "Hola"], font, 500)
+        assert wrapped[text] == lines and wrapped["Hola"] == ["Hola"]
+        print("✓ Resultados memorizados y división por lotes")
+        
+        # El prewrap de la interfaz no pasa del tamaño del caché
+        from juego.config import WINDOW_WIDTH, WINDOW_HEIGHT, WRAP_CACHE_SIZE
+        from juego.ui import GameUI
+        ui = GameUI(pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT)))
+        consumed = []
+        
+        def questions():
+            for i in range(WRAP_CACHE_SIZE * 3):
+                consumed.append(i)
+                yield f"Pregunta {i}"
+        
+        ui.prewrap_questions(questions())
+        assert len(consumed) == WRAP_CACHE_SIZE
+        print(f"✓ Prewrap limitado a {WRAP_CACHE_SIZE} preguntas")
+    finally:
+        pygame.quit()
+    return True
+
 if __name__ == "__main__":
     print("=" * 50)
     print("PRUEBAS DEL JUEGO - ¿QUIÉN QUIERE SER MILLONARIO?")
@@ -87,7 +1178,32 @@ if __name__ == "__main__":
     
     all_tests_passed &= test_imports()
     all_tests_passed &= test_questions()
+    all_tests_passed &= test_question_deck()
+    all_tests_passed &= test_difficulty_selection()
+    all_tests_passed &= test_compiled_bank()
+    all_tests_passed &= test_streaming_loader()
+    all_tests_passed &= test_engine()
+    all_tests_passed &= test_lazy_pygame_import()
+    all_tests_passed &= test_server()
+    all_tests_passed &= test_simulation()
+    all_tests_passed &= test_sharded_runner()
+    all_tests_passed &= test_results_store()
+    all_tests_passed &= test_leaderboard()
+    all_tests_passed &= test_answer_stats()
+    all_tests_passed &= test_question_ids()
+    all_tests_passed &= test_seen_questions()
+    all_tests_passed &= test_prefetch()
+    all_tests_passed &= test_embedded_bank()
+    all_tests_passed &= test_benchmark_suite()
     all_tests_passed &= test_pygame_init()
+    all_tests_passed &= test_text_cache()
+    all_tests_passed &= test_dirty_rendering()
+    all_tests_passed &= test_prerendered_widgets()
+    all_tests_passed &= test_layout()
+    all_tests_passed &= test_font_registry()
+    all_tests_passed &= test_profiler()
+    all_tests_passed &= test_idle_scheduler()
+    all_tests_passed &= test_wrap_text()
     
     print("\n" + "=" * 50)
     if all_tests_passed: